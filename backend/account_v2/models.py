@@ -1,10 +1,17 @@
+import json
+import logging
 import uuid
 
 from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from backend.constants import FieldLengthConstants as FieldLength
+from unstract.core.constants import PLATFORM_KEY_INVALIDATION_CHANNEL
+
+logger = logging.getLogger(__name__)
 
 NAME_SIZE = 64
 KEY_SIZE = 64
@@ -153,3 +160,28 @@ class PlatformKey(models.Model):
                 name="unique_key_name_organization",
             ),
         ]
+
+
+@receiver(post_save, sender=PlatformKey)
+@receiver(post_delete, sender=PlatformKey)
+def publish_platform_key_invalidation(sender, instance, **kwargs):
+    """Invalidate platform keys cached by platform-service and x2text-service.
+
+    The invalidation is published once the change is committed, so that the
+    services don't cache the key again before they can read the change.
+    """
+    key_id = instance.id
+    organization_id = instance.organization_id
+
+    def publish():
+        from utils.cache_service import redis_cache
+
+        message = json.dumps({"organization_uid": organization_id})
+        try:
+            redis_cache.publish(PLATFORM_KEY_INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.warning(
+                f"Failed to publish invalidation of platform key {key_id}: {e}"
+            )
+
+    transaction.on_commit(publish)
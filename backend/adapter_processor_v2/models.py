@@ -8,6 +8,8 @@ from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 from django.db import models
 from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from tenant_account_v2.models import OrganizationMember
 from utils.exceptions import InvalidEncryptionKey
 from utils.models.base_model import BaseModel
@@ -19,6 +21,7 @@ from utils.models.organization_mixin import (
 from unstract.sdk1.constants import AdapterTypes
 from unstract.sdk1.exceptions import SdkError
 from unstract.sdk1.llm import LLM
+from unstract.sdk1.utils.adapter_config_cache import AdapterConfigCache
 
 logger = logging.getLogger(__name__)
 
@@ -220,3 +223,16 @@ class UserDefaultAdapter(BaseModel):
         verbose_name = "Default Adapter for Organization User"
         verbose_name_plural = "Default Adapters for Organization Users"
         db_table = "default_organization_user_adapter"
+
+
+@receiver(post_save, sender=AdapterInstance)
+@receiver(post_delete, sender=AdapterInstance)
+def bump_adapter_config_version(sender, instance, **kwargs):
+    """Invalidate adapter configs cached by the SDK in tools and services."""
+    from utils.cache_service import redis_cache
+
+    version_key = AdapterConfigCache.get_version_key(str(instance.id))
+    try:
+        redis_cache.incr(version_key)
+    except Exception as e:
+        logger.warning(f"Failed to bump config version of adapter {instance.id}: {e}")
@@ -20,6 +20,7 @@ class ProfileManager(BaseModel):
         ROUTER = "router", "Router retrieval"
         KEYWORD_TABLE = "keyword_table", "Keyword table retrieval"
         AUTOMERGING = "automerging", "Auto-merging retrieval"
+        HYBRID = "hybrid", "Hybrid retrieval"
 
     profile_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     profile_name = models.TextField(blank=False)
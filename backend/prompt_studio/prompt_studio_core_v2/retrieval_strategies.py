@@ -119,11 +119,11 @@ RETRIEVAL_STRATEGY_METADATA = {
             "Exact term and phrase matching",
             "Complementing semantic search with keyword precision",
         ],
-        "token_usage": "Low (3-8k tokens typical)",
-        "cost_impact": "Low ($0.02-0.08 per query)",
+        "token_usage": "Low (2-5k tokens typical)",
+        "cost_impact": "Low ($0.01-0.05 per query)",
         "technical_details": (
-            "Uses LlamaIndex SimpleKeywordTableIndex to extract keywords during indexing "
-            "and match against query keywords with TF-IDF scoring."
+            "Builds a BM25 index of the document's chunks during indexing and scores "
+            "them against the query terms in memory, without LLM calls."
         ),
     },
     "automerging": {
@@ -146,6 +146,27 @@ RETRIEVAL_STRATEGY_METADATA = {
             "with parent nodes when retrieved chunks are related, preserving document coherence."
         ),
     },
+    "hybrid": {
+        "key": "hybrid",
+        "title": "Hybrid Retrieval",
+        "icon": "ForkOutlined",
+        "description": (
+            "Combines semantic vector search with BM25 keyword search using "
+            "Reciprocal Rank Fusion (RRF)."
+        ),
+        "best_for": [
+            "Queries mixing concepts with exact terms, codes or numbers",
+            "Improving recall over simple retrieval at the same cost",
+            "Alternative to fusion retrieval without extra LLM calls",
+        ],
+        "token_usage": "Low (2-5k tokens typical)",
+        "cost_impact": "Low ($0.01-0.05 per query)",
+        "technical_details": (
+            "Runs a single vector query and a BM25 search over the document's chunks "
+            "concurrently, then merges both rankings with RRF scoring. No query "
+            "variations are generated with the LLM."
+        ),
+    },
 }
 
 
@@ -14,7 +14,7 @@ from unstract.core.flask.logging import setup_logging
 from unstract.platform_service.constants import LogLevel
 from unstract.platform_service.controller import api
 from unstract.platform_service.env import Env
-from unstract.platform_service.extensions import db
+from unstract.platform_service.extensions import init_db
 
 load_dotenv()
 
@@ -36,8 +36,14 @@ def create_app() -> Flask:
     # Register URL routes
     app.register_blueprint(api)
 
-    # Initialize and connect to the database
-    db.init(
+    # Initialize the database, pooling connections across requests if enabled
+    init_db(
+        pool_enabled=Env.DB_POOL_ENABLED,
+        min_connections=Env.DB_POOL_MIN_CONNECTIONS,
+        max_connections=Env.DB_POOL_MAX_CONNECTIONS,
+        stale_timeout=Env.DB_POOL_STALE_TIMEOUT,
+        wait_timeout=Env.DB_POOL_WAIT_TIMEOUT,
+        health_check_interval=Env.DB_POOL_HEALTH_CHECK_INTERVAL,
         database=Env.PG_BE_DATABASE,
         user=Env.PG_BE_USERNAME,
         password=Env.PG_BE_PASSWORD,
@@ -7,11 +7,17 @@ from cryptography.fernet import Fernet, InvalidToken
 from flask import Blueprint, Request, jsonify, make_response, request
 from flask import current_app as app
 
-from unstract.core.flask import PluginManager
+from unstract.core.flask import PlatformKeyInfo, PlatformKeyResolver, PluginManager
 from unstract.core.flask.exceptions import APIError
 from unstract.platform_service.constants import DBTable
 from unstract.platform_service.env import Env
-from unstract.platform_service.extensions import db, get_redis_client, safe_cursor
+from unstract.platform_service.extensions import (
+    db,
+    execute_prepared,
+    get_redis_client,
+    get_redis_listener_client,
+    prepared_cursor,
+)
 from unstract.platform_service.helper.adapter_instance import (
     AdapterInstanceRequestHelper,
 )
@@ -45,6 +51,33 @@ def authentication_middleware(func: Any) -> Any:
     return wrapper
 
 
+def _fetch_platform_key(token: str) -> PlatformKeyInfo | None:
+    """Fetch a platform key and its organization in a single query."""
+    query = f"""
+        SELECT pk.is_active, pk.organization_id, org.organization_id
+        FROM "{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY} pk
+        LEFT JOIN "{Env.DB_SCHEMA}".{DBTable.ORGANIZATION} org
+        ON org.id = pk.organization_id
+        WHERE pk.key = %s
+    """
+    with prepared_cursor("get_platform_key", query, (token,)) as cursor:
+        result_row = cursor.fetchone()
+    if not result_row:
+        return None
+    is_active, organization_uid, organization_identifier = result_row
+    return PlatformKeyInfo(
+        is_active=bool(is_active),
+        organization_uid=organization_uid,
+        organization_identifier=organization_identifier,
+    )
+
+
+# Caches platform keys per process, invalidated by the backend through Redis
+platform_key_resolver = PlatformKeyResolver(
+    fetch=_fetch_platform_key, get_redis_client=get_redis_listener_client
+)
+
+
 def get_organization_from_bearer_token(token: str) -> tuple[int | None, str]:
     """Fetch organization by platform key.
 
@@ -54,25 +87,10 @@ def get_organization_from_bearer_token(token: str) -> tuple[int | None, str]:
     Returns:
         tuple[int, str]: organization uid and organization identifier
     """
-    query = f"""
-        SELECT organization_id FROM "{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY}
-        WHERE key=%s
-    """
-    organization_uid: int = execute_query(query, (token,))
-    query_org = f"""
-        SELECT organization_id FROM "{Env.DB_SCHEMA}".{DBTable.ORGANIZATION}
-        WHERE id=%s
-    """
-    organization_identifier: str = execute_query(query_org, (organization_uid,))
-    return organization_uid, organization_identifier
-
-
-def execute_query(query: str, params: tuple = ()) -> Any:
-    with safe_cursor(query, params) as cursor:
-        result_row = cursor.fetchone()
-        if not result_row or len(result_row) == 0:
-            return None
-        return result_row[0]
+    platform_key = platform_key_resolver.resolve(token)
+    if platform_key is None:
+        return None, None
+    return platform_key.organization_uid, platform_key.organization_identifier
 
 
 def validate_bearer_token(token: str | None) -> bool:
@@ -80,29 +98,17 @@ def validate_bearer_token(token: str | None) -> bool:
         app.logger.error("Authentication failed. Empty bearer token")
         return False
 
-    platform_key_table = DBTable.PLATFORM_KEY
-    query = f"""
-        SELECT * FROM \"{Env.DB_SCHEMA}\".{platform_key_table}
-        WHERE key = %s
-    """
-
     try:
-        with safe_cursor(query, (token,)) as cursor:
-            result_row = cursor.fetchone()
-            if not result_row or len(result_row) == 0:
-                app.logger.error(f"Authentication failed. bearer token not found {token}")
-                return False
-            platform_key = str(result_row[1])
-            is_active = bool(result_row[2])
-            if not is_active:
-                app.logger.error(
-                    f"Token is not active. Activate before using it. token {token}"
-                )
-                return False
-            if platform_key != token:
-                app.logger.error(f"Authentication failed. Invalid bearer token: {token}")
-                return False
-            return True
+        platform_key = platform_key_resolver.resolve(token)
+        if platform_key is None:
+            app.logger.error(f"Authentication failed. bearer token not found {token}")
+            return False
+        if not platform_key.is_active:
+            app.logger.error(
+                f"Token is not active. Activate before using it. token {token}"
+            )
+            return False
+        return True
     except Exception as e:
         app.logger.error(
             f"Error while validating bearer token: {e}",
@@ -112,6 +118,189 @@ def validate_bearer_token(token: str | None) -> bool:
         return False
 
 
+TOKEN_USAGE_COLUMNS = (
+    "id",
+    "organization_id",
+    "workflow_id",
+    "execution_id",
+    "adapter_instance_id",
+    "run_id",
+    "usage_type",
+    "llm_usage_reason",
+    "model_name",
+    "embedding_tokens",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "cost_in_dollars",
+    "created_at",
+    "modified_at",
+)
+PAGE_USAGE_COLUMNS = (
+    "id",
+    "organization_id",
+    "pages_processed",
+    "file_name",
+    "file_size",
+    "file_type",
+    "run_id",
+    "created_at",
+)
+TOKEN_USAGE_RECORD = "usage"
+PAGE_USAGE_RECORD = "page_usage"
+# Optional fields of usage records, by record type, and the types they take
+USAGE_RECORD_FIELDS: dict[str, dict[str, type | tuple[type, ...]]] = {
+    TOKEN_USAGE_RECORD: {
+        "workflow_id": str,
+        "execution_id": str,
+        "adapter_instance_id": str,
+        "run_id": str,
+        "usage_type": str,
+        "llm_usage_reason": str,
+        "model_name": str,
+        "provider": str,
+        "embedding_tokens": int,
+        "prompt_tokens": int,
+        "completion_tokens": int,
+        "total_tokens": int,
+    },
+    PAGE_USAGE_RECORD: {
+        "run_id": str,
+        "file_name": str,
+        "file_type": str,
+        "page_count": int,
+        "file_size": (int, float),
+    },
+}
+# Keeps a multi-row INSERT well below Postgres' limit of 65535 parameters
+MAX_USAGE_BATCH_SIZE = 1000
+# Maximum number of keys read or written by a batch cache request
+MAX_CACHE_BATCH_SIZE = 1000
+
+
+def _get_insert_query(table: str, columns: tuple[str, ...], row_count: int = 1) -> str:
+    """Builds a multi-row INSERT of `row_count` rows into a usage table."""
+    row = f"({', '.join(['%s'] * len(columns))})"
+    return f"""
+        INSERT INTO \"{Env.DB_SCHEMA}\".{table} ({", ".join(columns)})
+        VALUES {", ".join([row] * row_count)}
+    """
+
+
+def _validate_usage_record(record: Any) -> str | None:
+    """Returns why a usage record of a batch is invalid, None if it's valid."""
+    if not isinstance(record, dict):
+        return "Record is not an object"
+    fields = USAGE_RECORD_FIELDS.get(record.get("type"))
+    if fields is None:
+        return f"Type must be '{TOKEN_USAGE_RECORD}' or '{PAGE_USAGE_RECORD}'"
+    for field, field_type in fields.items():
+        value = record.get(field)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, field_type):
+            return f"Invalid value of '{field}': {value!r}"
+        if field_type is not str and value < 0:
+            return f"Invalid value of '{field}': {value!r}"
+    return None
+
+
+def _get_cache_ttl(payload: dict[Any, Any]) -> int | None:
+    """Returns the expiry in seconds of values to cache, None to not expire them.
+
+    A request can set its own `ttl`, else `CACHE_TTL` applies.
+
+    Raises:
+        ValueError: If the `ttl` of the request isn't a non-negative integer
+    """
+    ttl = payload.get("ttl", Env.CACHE_TTL)
+    if isinstance(ttl, bool) or not isinstance(ttl, int) or ttl < 0:
+        raise ValueError(f"Invalid ttl: {ttl!r}")
+    return ttl or None
+
+
+def _get_token_usage_row(
+    payload: dict[str, Any],
+    usage_id: uuid.UUID,
+    organization_uid: int | None,
+    current_time: datetime,
+    cost_calculation_helper: CostCalculationHelper | None,
+) -> tuple[Any, ...]:
+    """Returns the values of `TOKEN_USAGE_COLUMNS` for a token usage record."""
+    usage_type = payload.get("usage_type", "")
+    model_name = payload.get("model_name", "")
+    provider = payload.get("provider", "")
+    embedding_tokens = payload.get("embedding_tokens", 0)
+    prompt_tokens = payload.get("prompt_tokens", 0)
+    completion_tokens = payload.get("completion_tokens", 0)
+    input_tokens = prompt_tokens
+    if usage_type == "embedding":
+        input_tokens = embedding_tokens
+    cost_in_dollars = 0.0
+    if provider and cost_calculation_helper:
+        cost_in_dollars = cost_calculation_helper.calculate_cost(
+            model_name=model_name,
+            provider=provider,
+            input_tokens=input_tokens,
+            output_tokens=completion_tokens,
+        )
+    return (
+        usage_id,
+        organization_uid,
+        payload.get("workflow_id"),
+        payload.get("execution_id", ""),
+        payload.get("adapter_instance_id", ""),
+        payload.get("run_id"),
+        usage_type,
+        payload.get("llm_usage_reason", ""),
+        model_name,
+        embedding_tokens,
+        prompt_tokens,
+        completion_tokens,
+        payload.get("total_tokens", 0),
+        cost_in_dollars,
+        current_time,
+        current_time,
+    )
+
+
+def _get_page_usage_row(
+    payload: dict[str, Any],
+    usage_id: uuid.UUID,
+    org_id: str | None,
+    current_time: datetime,
+) -> tuple[Any, ...]:
+    """Returns the values of `PAGE_USAGE_COLUMNS` for a page usage record."""
+    return (
+        usage_id,
+        org_id,
+        payload.get("page_count", ""),
+        payload.get("file_name", ""),
+        payload.get("file_size", ""),
+        payload.get("file_type", ""),
+        payload.get("run_id", ""),
+        current_time,
+    )
+
+
+def _handle_subscription_usage(
+    org_id: str | None, page_count: Any, run_id: str, current_time: datetime
+) -> None:
+    # Cloud-only: Handle subscription usage via plugin
+    usage_plugin = PluginManager().get_plugin("subscription_usage")
+    if usage_plugin:
+        try:
+            handler = usage_plugin["entrypoint_cls"]()
+            handler.handle_subscription_usage(
+                org_id=org_id,
+                page_count=page_count,
+                run_id=run_id,
+                current_time=current_time,
+            )
+        except Exception as e:
+            app.logger.exception(f"Error from subscription usage plugin: {e}")
+
+
 @platform_bp.route("/page-usage", methods=["POST"], endpoint="page_usage")
 @authentication_middleware
 def page_usage() -> Any:
@@ -129,29 +318,10 @@ def page_usage() -> Any:
     bearer_token = get_token_from_auth_header(request)
     _, org_id = get_organization_from_bearer_token(bearer_token)
 
-    page_count = payload.get("page_count", "")
-    file_name = payload.get("file_name", "")
-    file_size = payload.get("file_size", "")
-    file_type = payload.get("file_type", "")
-    run_id = payload.get("run_id", "")
-
-    query = f"""
-        INSERT INTO \"{Env.DB_SCHEMA}\".{DBTable.PAGE_USAGE} (id, organization_id,
-        pages_processed, file_name, file_size, file_type, run_id, created_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-    """
     usage_id = uuid.uuid4()
     current_time = datetime.now()
-    params = (
-        usage_id,
-        org_id,
-        page_count,
-        file_name,
-        file_size,
-        file_type,
-        run_id,
-        current_time,
-    )
+    query = _get_insert_query(DBTable.PAGE_USAGE, PAGE_USAGE_COLUMNS)
+    params = _get_page_usage_row(payload, usage_id, org_id, current_time)
 
     try:
         with db.atomic():
@@ -159,21 +329,12 @@ def page_usage() -> Any:
             app.logger.info("Page usage recorded with id %s for %s", usage_id, org_id)
             result["status"] = "OK"
             result["unique_id"] = usage_id
-
-            # Cloud-only: Handle subscription usage via plugin
-            usage_plugin = PluginManager().get_plugin("subscription_usage")
-            if usage_plugin:
-                try:
-                    handler = usage_plugin["entrypoint_cls"]()
-                    handler.handle_subscription_usage(
-                        org_id=org_id,
-                        page_count=page_count,
-                        run_id=run_id,
-                        current_time=current_time,
-                    )
-                except Exception as e:
-                    app.logger.exception(f"Error from subscription usage plugin: {e}")
-
+            _handle_subscription_usage(
+                org_id=org_id,
+                page_count=payload.get("page_count", ""),
+                run_id=payload.get("run_id", ""),
+                current_time=current_time,
+            )
             return make_response(result, 200)
     except Exception as e:
         app.logger.error(f"Error while creating page usage entry: {e}")
@@ -206,64 +367,19 @@ def usage() -> Any:
         return make_response(result, 400)
     bearer_token = get_token_from_auth_header(request)
     organization_uid, org_id = get_organization_from_bearer_token(bearer_token)
-    workflow_id = payload.get("workflow_id")
-    execution_id = payload.get("execution_id", "")
-    adapter_instance_id = payload.get("adapter_instance_id", "")
-    run_id = payload.get("run_id")
-    usage_type = payload.get("usage_type", "")
-    llm_usage_reason = payload.get("llm_usage_reason", "")
-    model_name = payload.get("model_name", "")
-    provider = payload.get("provider", "")
-    embedding_tokens = payload.get("embedding_tokens", 0)
-    prompt_tokens = payload.get("prompt_tokens", 0)
-    completion_tokens = payload.get("completion_tokens", 0)
-    total_tokens = payload.get("total_tokens", 0)
-    input_tokens = prompt_tokens
-    if usage_type == "embedding":
-        input_tokens = embedding_tokens
-    cost_in_dollars = 0.0
-    if provider:
-        cost_calculation_helper = CostCalculationHelper()
-        cost_in_dollars = cost_calculation_helper.calculate_cost(
-            model_name=model_name,
-            provider=provider,
-            input_tokens=input_tokens,
-            output_tokens=completion_tokens,
-        )
-    usage_id = uuid.uuid4()
-    current_time = datetime.now()
-    query = f"""
-        INSERT INTO \"{Env.DB_SCHEMA}\".{DBTable.TOKEN_USAGE} (
-        id, organization_id, workflow_id,
-        execution_id, adapter_instance_id, run_id, usage_type,
-        llm_usage_reason, model_name, embedding_tokens, prompt_tokens,
-        completion_tokens, total_tokens, cost_in_dollars, created_at, modified_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
+    cost_calculation_helper = (
+        CostCalculationHelper() if payload.get("provider", "") else None
+    )
     usage_id = uuid.uuid4()
     current_time = datetime.now()
-    params = (
-        usage_id,
-        organization_uid,
-        workflow_id,
-        execution_id,
-        adapter_instance_id,
-        run_id,
-        usage_type,
-        llm_usage_reason,
-        model_name,
-        embedding_tokens,
-        prompt_tokens,
-        completion_tokens,
-        total_tokens,
-        cost_in_dollars,
-        current_time,
-        current_time,
+    query = _get_insert_query(DBTable.TOKEN_USAGE, TOKEN_USAGE_COLUMNS)
+    params = _get_token_usage_row(
+        payload, usage_id, organization_uid, current_time, cost_calculation_helper
     )
 
     try:
         with db.atomic() as transaction:
-            db.execute_sql(query, params)
+            execute_prepared("insert_token_usage", query, params)
             transaction.commit()
             app.logger.info("Adapter usage recorded with id %s for %s", usage_id, org_id)
             result["status"] = "OK"
@@ -275,6 +391,136 @@ def usage() -> Any:
         return make_response(result, 500)
 
 
+@platform_bp.route("/usage/batch", methods=["POST"], endpoint="usage_batch")
+@authentication_middleware
+def usage_batch() -> Any:
+    """Bulk usage endpoint.
+
+    Records token usage and page usage in one request. The organization is
+    resolved once and each table is written with a single multi-row INSERT.
+    The IDs of the records are returned in the order they were sent.
+
+    Invalid records are rejected on their own, with a null ID and their index
+    and the reason listed in `errors`, while the valid ones are recorded. The
+    batch is only rejected with a 400 if none of its records are valid.
+
+    Sample Usage:
+    curl -X POST  http://localhost:3001/usage/batch \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{
+            "records": [
+                {"type": "usage", "run_id": "test", "usage_type": "llm", ...},
+                {"type": "page_usage", "run_id": "test", "page_count": 2, ...}
+            ]
+        }'
+    """
+    result: dict[str, Any] = {
+        "status": "ERROR",
+        "error": "",
+        "unique_ids": [],
+        "errors": [],
+    }
+    payload: dict[Any, Any] | None = request.json
+    records = payload.get("records") if isinstance(payload, dict) else None
+    if not records or not isinstance(records, list):
+        result["error"] = Env.INVALID_PAYLOAD
+        return make_response(result, 400)
+    if len(records) > MAX_USAGE_BATCH_SIZE:
+        result["error"] = f"A batch can hold at most {MAX_USAGE_BATCH_SIZE} records"
+        return make_response(result, 400)
+
+    # Invalid records are rejected on their own, as sending them again won't help
+    errors = []
+    for index, record in enumerate(records):
+        error = _validate_usage_record(record)
+        if error:
+            errors.append({"index": index, "error": error})
+    result["errors"] = errors
+    if len(errors) == len(records):
+        result["error"] = "All records are invalid"
+        return make_response(result, 400)
+    rejected = {error["index"] for error in errors}
+
+    bearer_token = get_token_from_auth_header(request)
+    organization_uid, org_id = get_organization_from_bearer_token(bearer_token)
+    # Prices are loaded once for the batch, only if a record needs them
+    cost_calculation_helper = None
+    if any(
+        index not in rejected
+        and record["type"] == TOKEN_USAGE_RECORD
+        and record.get("provider")
+        for index, record in enumerate(records)
+    ):
+        cost_calculation_helper = CostCalculationHelper()
+
+    current_time = datetime.now()
+    usage_ids: list[uuid.UUID | None] = []
+    accepted = []
+    token_usage_rows = []
+    page_usage_rows = []
+    for index, record in enumerate(records):
+        if index in rejected:
+            usage_ids.append(None)
+            continue
+        usage_id = uuid.uuid4()
+        usage_ids.append(usage_id)
+        accepted.append(record)
+        if record["type"] == TOKEN_USAGE_RECORD:
+            token_usage_rows.append(
+                _get_token_usage_row(
+                    record,
+                    usage_id,
+                    organization_uid,
+                    current_time,
+                    cost_calculation_helper,
+                )
+            )
+        else:
+            page_usage_rows.append(
+                _get_page_usage_row(record, usage_id, org_id, current_time)
+            )
+
+    try:
+        with db.atomic():
+            for table, columns, rows in (
+                (DBTable.TOKEN_USAGE, TOKEN_USAGE_COLUMNS, token_usage_rows),
+                (DBTable.PAGE_USAGE, PAGE_USAGE_COLUMNS, page_usage_rows),
+            ):
+                if rows:
+                    query = _get_insert_query(table, columns, row_count=len(rows))
+                    params = tuple(value for row in rows for value in row)
+                    db.execute_sql(query, params)
+            for record in accepted:
+                if record["type"] == PAGE_USAGE_RECORD:
+                    _handle_subscription_usage(
+                        org_id=org_id,
+                        page_count=record.get("page_count", ""),
+                        run_id=record.get("run_id", ""),
+                        current_time=current_time,
+                    )
+        app.logger.info(
+            "Recorded %d token usage and %d page usage entries for %s",
+            len(token_usage_rows),
+            len(page_usage_rows),
+            org_id,
+        )
+        if errors:
+            app.logger.warning(
+                "Rejected %d invalid usage records for %s: %s",
+                len(errors),
+                org_id,
+                errors,
+            )
+        result["status"] = "OK"
+        result["unique_ids"] = usage_ids
+        return make_response(result, 200)
+    except Exception as e:
+        app.logger.error(f"Error while creating usage entries: {e}")
+        result["error"] = "Internal Server Error"
+        return make_response(result, 500)
+
+
 @platform_bp.route(
     "/platform_details",
     methods=["GET"],
@@ -306,11 +552,14 @@ def platform_details() -> Any:
 def cache() -> Any:
     """Cache endpoint.
 
+    Values expire after `ttl` seconds if the request sets one, else after
+    `CACHE_TTL` seconds. A ttl of 0 keeps the value until it's deleted.
+
     Sample Usage:
     curl -X POST  http://localhost:3001/cache \
     -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
     -H "Content-Type: application/json" \
-    -d '{"key": "key1", "value": "value1"}'
+    -d '{"key": "key1", "value": "value1", "ttl": 3600}'
 
     curl -X GET
     -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
@@ -330,9 +579,13 @@ def cache() -> Any:
         value = payload.get("value")
         if key is None or value is None:
             return Env.BAD_REQUEST, 400
+        try:
+            ttl = _get_cache_ttl(payload)
+        except ValueError:
+            return Env.BAD_REQUEST, 400
         try:
             redis_key = f"{account_id}:{key}"
-            r.set(redis_key, value)
+            r.set(redis_key, value, ex=ttl)
         except Exception as e:
             raise APIError(message=f"Error while caching data: {e}") from e
     elif request.method == "GET":
@@ -361,6 +614,82 @@ def cache() -> Any:
     return "OK", 200
 
 
+@platform_bp.route("/cache/mset", methods=["POST"], endpoint="cache_mset")
+@authentication_middleware
+def cache_mset() -> Any:
+    """Caches several values in a single round-trip to Redis.
+
+    Values expire like the ones cached with `/cache`, after the `ttl` of the
+    request or `CACHE_TTL` seconds. They're written in a single pipeline.
+
+    Sample Usage:
+    curl -X POST  http://localhost:3001/cache/mset \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{"items": {"key1": "value1", "key2": "value2"}, "ttl": 3600}'
+    """
+    payload: dict[Any, Any] | None = request.json
+    items = payload.get("items") if payload else None
+    if not isinstance(items, dict) or not items:
+        return Env.BAD_REQUEST, 400
+    if len(items) > MAX_CACHE_BATCH_SIZE:
+        return f"Batch exceeds {MAX_CACHE_BATCH_SIZE} keys", 400
+    if any(value is None for value in items.values()):
+        return Env.BAD_REQUEST, 400
+    try:
+        ttl = _get_cache_ttl(payload)
+    except ValueError:
+        return Env.BAD_REQUEST, 400
+    bearer_token = get_token_from_auth_header(request)
+    _, account_id = get_organization_from_bearer_token(bearer_token)
+
+    try:
+        with get_redis_client().pipeline(transaction=False) as pipeline:
+            for key, value in items.items():
+                pipeline.set(f"{account_id}:{key}", value, ex=ttl)
+            pipeline.execute()
+    except Exception as e:
+        raise APIError(message=f"Error while caching data: {e}") from e
+    return "OK", 200
+
+
+@platform_bp.route("/cache/mget", methods=["POST"], endpoint="cache_mget")
+@authentication_middleware
+def cache_mget() -> Any:
+    """Gets several cached values in a single round-trip to Redis.
+
+    Keys are sent in the body to not be limited by the URL length. Keys which
+    aren't cached have a null value.
+
+    Sample Usage:
+    curl -X POST  http://localhost:3001/cache/mget \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{"keys": ["key1", "key2"]}'
+    """
+    payload: dict[Any, Any] | None = request.json
+    keys = payload.get("keys") if payload else None
+    if not isinstance(keys, list) or not keys:
+        return Env.BAD_REQUEST, 400
+    if len(keys) > MAX_CACHE_BATCH_SIZE:
+        return f"Batch exceeds {MAX_CACHE_BATCH_SIZE} keys", 400
+    bearer_token = get_token_from_auth_header(request)
+    _, account_id = get_organization_from_bearer_token(bearer_token)
+
+    try:
+        values = get_redis_client().mget([f"{account_id}:{key}" for key in keys])
+    except Exception as e:
+        raise APIError(message=f"Error while getting cached data: {e}") from e
+    return jsonify(
+        {
+            "values": {
+                key: value.decode("utf-8") if isinstance(value, bytes) else value
+                for key, value in zip(keys, values, strict=True)
+            }
+        }
+    )
+
+
 @platform_bp.route(
     "/adapter_instance",
     methods=["GET"],
@@ -17,6 +17,15 @@ class Env:
     PG_BE_USERNAME = os.environ.get("PG_BE_USERNAME")
     PG_BE_PASSWORD = os.environ.get("PG_BE_PASSWORD")
     PG_BE_DATABASE = os.environ.get("PG_BE_DATABASE")
+    DB_POOL_ENABLED = os.environ.get("DB_POOL_ENABLED", "False").lower() == "true"
+    DB_POOL_MIN_CONNECTIONS = int(os.environ.get("DB_POOL_MIN_CONNECTIONS", 0))
+    DB_POOL_MAX_CONNECTIONS = int(os.environ.get("DB_POOL_MAX_CONNECTIONS", 20))
+    DB_POOL_STALE_TIMEOUT = int(os.environ.get("DB_POOL_STALE_TIMEOUT", 300))
+    DB_POOL_WAIT_TIMEOUT = int(os.environ.get("DB_POOL_WAIT_TIMEOUT", 10))
+    DB_POOL_HEALTH_CHECK_INTERVAL = int(
+        os.environ.get("DB_POOL_HEALTH_CHECK_INTERVAL", 30)
+    )
+    CACHE_TTL = int(os.environ.get("CACHE_TTL", 0))
     ENCRYPTION_KEY = EnvManager.get_required_setting("ENCRYPTION_KEY")
     MODEL_PRICES_URL = EnvManager.get_required_setting("MODEL_PRICES_URL")
     MODEL_PRICES_TTL_IN_DAYS = int(
@@ -1,11 +1,160 @@
+import os
+import re
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
+from weakref import WeakKeyDictionary
 
+import psycopg2
 import redis
-from peewee import PostgresqlDatabase
+from peewee import DatabaseProxy, PostgresqlDatabase
+from playhouse.pool import MaxConnectionsExceeded, PooledPostgresqlDatabase
+
+# Initialised with a plain or pooled database by `init_db`
+db = DatabaseProxy()
+
+
+class HealthCheckedPooledPostgresqlDatabase(PooledPostgresqlDatabase):
+    """Connection pool which keeps warm connections and checks their health.
+
+    On top of peewee's pool, it:
+    - opens `min_connections` connections the first time a process connects,
+      so that a burst of requests doesn't open them one by one
+    - pings connections idle for longer than `health_check_interval` seconds
+      before handing them out, replacing the ones the server dropped
+    - tracks the statements prepared on each connection, for
+      `prepared_cursor`
+
+    It extends the pool through the hooks peewee's own pools override
+    (`_connect`, `_close`, `_is_closed` and `_can_reuse`). Only the reset of
+    the pool after a fork touches its internal state, which is why peewee is
+    pinned to the 3.x releases this was verified against (3.16 to 3.18).
+    """
+
+    def __init__(
+        self,
+        database: str | None,
+        min_connections: int = 0,
+        health_check_interval: int = 30,
+        **kwargs: Any,
+    ) -> None:
+        self._min_connections = min_connections
+        self._health_check_interval = health_check_interval
+        # Time each idle connection was returned to the pool
+        self._checked_in_at: WeakKeyDictionary[Any, float] = WeakKeyDictionary()
+        # Names of the statements prepared on each connection
+        self._prepared: WeakKeyDictionary[Any, set[str]] = WeakKeyDictionary()
+        # PID of the process the pool was filled in, it's refilled after a fork
+        self._filled_pid: int | None = None
+        self._fill_lock = threading.Lock()
+        super().__init__(database, **kwargs)
+
+    def init(
+        self,
+        database: str | None,
+        min_connections: int | None = None,
+        health_check_interval: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if min_connections is not None:
+            self._min_connections = min_connections
+        if health_check_interval is not None:
+            self._health_check_interval = health_check_interval
+        super().init(database, **kwargs)
+
+    def connect(self, reuse_if_open: bool = False) -> bool:
+        if self._filled_pid != os.getpid():
+            self._fill()
+        return super().connect(reuse_if_open)
+
+    def prepared_statements(self) -> set[str]:
+        """Names of the statements prepared on the current connection."""
+        return self._prepared.setdefault(self.connection(), set())
+
+    def _fill(self) -> None:
+        with self._fill_lock:
+            if self._filled_pid == os.getpid():
+                return
+            # Connections inherited from the parent process can't be shared.
+            # peewee has no API to drop them without closing them, which
+            # would close the parent's connections as well.
+            self._connections = []
+            self._in_use = {}
+            self._checked_in_at.clear()
+            self._prepared.clear()
+            # Checking out connections at once opens the ones the pool lacks
+            conns = []
+            try:
+                for _ in range(self._min_connections):
+                    conns.append(self._connect())
+            except MaxConnectionsExceeded:
+                pass
+            finally:
+                for conn in conns:
+                    self._close(conn)
+            self._filled_pid = os.getpid()
+
+    def _is_closed(self, conn: Any) -> bool:
+        if super()._is_closed(conn):
+            return True
+        checked_in_at = self._checked_in_at.pop(conn, None)
+        if (
+            checked_in_at is None
+            or time.time() - checked_in_at < self._health_check_interval
+        ):
+            return False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return False
+        except psycopg2.Error:
+            return True
+
+    def _can_reuse(self, conn: Any) -> bool:
+        # Called when a connection is returned to the pool
+        if not super()._can_reuse(conn):
+            return False
+        self._checked_in_at[conn] = time.time()
+        return True
+
+
+def init_db(
+    pool_enabled: bool = False,
+    min_connections: int = 0,
+    max_connections: int = 20,
+    stale_timeout: int = 300,
+    wait_timeout: int = 10,
+    health_check_interval: int = 30,
+    **connect_kwargs: Any,
+) -> None:
+    """Initialise `db` with a plain or a pooled database.
+
+    Args:
+        pool_enabled: Whether to reuse connections across requests
+        min_connections: Connections opened upfront in each process
+        max_connections: Connections a process may have open at once
+        stale_timeout: Seconds after which a connection is recycled
+        wait_timeout: Seconds to wait for a free connection
+        health_check_interval: Idle seconds after which a connection is
+            pinged before reuse
+        connect_kwargs: Database name and connection parameters
+    """
+    if not pool_enabled:
+        db.initialize(PostgresqlDatabase(**connect_kwargs))
+        return
+    db.initialize(
+        HealthCheckedPooledPostgresqlDatabase(
+            min_connections=min_connections,
+            health_check_interval=health_check_interval,
+            max_connections=max_connections,
+            stale_timeout=stale_timeout,
+            timeout=wait_timeout,
+            **connect_kwargs,
+        )
+    )
 
-db = PostgresqlDatabase(None)
 
 # Redis connection pool (initialized lazily)
 _redis_pool: redis.ConnectionPool | None = None
@@ -42,6 +191,25 @@ def get_redis_client() -> redis.Redis:
     return redis.Redis(connection_pool=get_redis_pool())
 
 
+def get_redis_listener_client() -> redis.Redis:
+    """Get a Redis client with its own connection, for long-lived listeners.
+
+    Subscriptions hold their connection for as long as they listen, so they
+    don't use the shared pool which serves requests.
+
+    Returns:
+        redis.Redis: Redis client instance.
+    """
+    from unstract.platform_service.env import Env
+
+    return redis.Redis(
+        host=Env.REDIS_HOST,
+        port=Env.REDIS_PORT,
+        username=Env.REDIS_USERNAME,
+        password=Env.REDIS_PASSWORD,
+    )
+
+
 @contextmanager
 def safe_cursor(query: str, params: tuple = ()) -> Generator[Any, None, None]:
     """Execute a query and ensure cursor is always closed.
@@ -58,3 +226,44 @@ def safe_cursor(query: str, params: tuple = ()) -> Generator[Any, None, None]:
         yield cursor
     finally:
         cursor.close()
+
+
+@contextmanager
+def prepared_cursor(
+    name: str, query: str, params: tuple = ()
+) -> Generator[Any, None, None]:
+    """Execute a hot query as a prepared statement and close the cursor.
+
+    The statement is prepared once per pooled connection, which saves parsing
+    and planning the query on every request. Without pooling, connections
+    live for a single request and the query is executed as is.
+
+    Args:
+        name: Name of the prepared statement, unique per query.
+        query: SQL query to execute, with `%s` placeholders.
+        params: Query parameters.
+
+    Yields:
+        Database cursor.
+    """
+    if not isinstance(db.obj, HealthCheckedPooledPostgresqlDatabase):
+        with safe_cursor(query, params) as cursor:
+            yield cursor
+        return
+
+    prepared = db.obj.prepared_statements()
+    if name not in prepared:
+        placeholders = iter(range(1, len(params) + 1))
+        statement = re.sub(r"%s", lambda _: f"${next(placeholders)}", query)
+        db.execute_sql(f"PREPARE {name} AS {statement}").close()
+        prepared.add(name)
+    arguments = ", ".join(["%s"] * len(params))
+    execute = f"EXECUTE {name}({arguments})" if params else f"EXECUTE {name}"
+    with safe_cursor(execute, params) as cursor:
+        yield cursor
+
+
+def execute_prepared(name: str, query: str, params: tuple = ()) -> None:
+    """Execute a hot statement that returns no rows, see `prepared_cursor`."""
+    with prepared_cursor(name, query, params):
+        pass
@@ -2,7 +2,7 @@ from typing import Any
 
 from unstract.core.flask.exceptions import APIError
 from unstract.platform_service.constants import DBTable
-from unstract.platform_service.extensions import safe_cursor
+from unstract.platform_service.extensions import prepared_cursor
 from unstract.platform_service.utils import EnvManager
 
 DB_SCHEMA = EnvManager.get_required_setting("DB_SCHEMA", "unstract")
@@ -29,7 +29,9 @@ class AdapterInstanceRequestHelper:
             f' FROM "{DB_SCHEMA}".{DBTable.ADAPTER_INSTANCE} x '
             f"WHERE id=%s and organization_id=%s"
         )
-        with safe_cursor(query, (adapter_instance_id, organization_uid)) as cursor:
+        with prepared_cursor(
+            "get_adapter_instance", query, (adapter_instance_id, organization_uid)
+        ) as cursor:
             result_row = cursor.fetchone()
             if not result_row:
                 raise APIError(
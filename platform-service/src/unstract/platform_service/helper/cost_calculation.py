@@ -1,4 +1,7 @@
 import json
+import threading
+import time
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -11,19 +14,174 @@ from unstract.sdk1.exceptions import FileStorageError
 from unstract.sdk1.file_storage import EnvHelper, StorageType
 
 
-class CostCalculationHelper:
-    def __init__(
-        self,
-        url: str = Env.MODEL_PRICES_URL,
-        ttl_days: int = Env.MODEL_PRICES_TTL_IN_DAYS,
-        file_path: str = Env.MODEL_PRICES_FILE_PATH,
-    ):
-        self.ttl_days = ttl_days
+class ModelPriceCatalog:
+    """Process-wide catalog of model prices and token limits.
+
+    The LiteLLM price JSON is loaded once per process and indexed, so that
+    looking up the price of a model is a dictionary lookup instead of a scan
+    over every model. The file in permanent storage acts as the version of the
+    catalog: it is re-fetched from `url` when older than `ttl_days`, and other
+    processes pick up the new file once its modification time changes.
+
+    The storage file is checked at most every `CHECK_INTERVAL` seconds, in a
+    background thread, while lookups keep being served from the loaded catalog.
+    """
+
+    # Seconds between checks of the price file for a newer version
+    CHECK_INTERVAL = 3600
+    # Seconds before retrying when no prices could be loaded yet
+    RETRY_INTERVAL = 60
+
+    _instances: dict[tuple[str, int, str], "ModelPriceCatalog"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, url: str, ttl_days: int, file_path: str):
         self.url = url
+        self.ttl_days = ttl_days
         self.file_path = file_path
+        self.file_storage = None
+        # Modification time of the price file the catalog was built from
+        self.version: datetime | None = None
+        self._next_check_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._loaded = False
+        # Models keyed by their full LiteLLM name, e.g. "azure/gpt-4o"
+        self._exact: dict[str, dict[str, Any]] = {}
+        # Models keyed by their name without the provider prefix, e.g. "gpt-4o"
+        self._by_suffix: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        self._resolved: dict[tuple[str, str], dict[str, Any] | None] = {}
+        self._model_token_data: dict[str, Any] = {}
+
+    @classmethod
+    def get(cls, url: str, ttl_days: int, file_path: str) -> "ModelPriceCatalog":
+        """Returns the loaded catalog of this process, refreshing it if due."""
+        key = (url, ttl_days, file_path)
+        with cls._instances_lock:
+            catalog = cls._instances.get(key)
+            if catalog is None:
+                catalog = cls(url=url, ttl_days=ttl_days, file_path=file_path)
+                cls._instances[key] = catalog
+        catalog._ensure_loaded()
+        return catalog
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    def find(self, model_name: str, provider: str) -> dict[str, Any] | None:
+        """Returns the price data of a model served by a provider.
+
+        The model is matched by its exact LiteLLM name or by its name without
+        the provider prefix, and falls back to any name ending with
+        `model_name`. The first match whose `litellm_provider` contains
+        `provider` is returned.
+        """
+        key = (provider, model_name)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        candidates: list[tuple[str, dict[str, Any]]] = []
+        if model_name in self._exact:
+            candidates.append((model_name, self._exact[model_name]))
+        candidates.extend(self._by_suffix.get(model_name, []))
+        item = self._match_provider(candidates, provider)
+        if item is None:
+            item = self._match_provider(
+                (
+                    (name, info)
+                    for name, info in self._exact.items()
+                    if name.endswith(model_name)
+                ),
+                provider,
+            )
+        self._resolved[key] = item
+        return item
+
+    def has_prices(self) -> bool:
+        return bool(self._model_token_data)
+
+    @staticmethod
+    def _match_provider(
+        candidates: Iterable[tuple[str, dict[str, Any]]], provider: str
+    ) -> dict[str, Any] | None:
+        for _, model_info in candidates:
+            if provider in model_info.get("litellm_provider", ""):
+                return model_info
+        return None
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._refresh()
+                    self._loaded = True
+            return
+        if time.monotonic() < self._next_check_at:
+            return
+        with self._lock:
+            if self._refreshing or time.monotonic() < self._next_check_at:
+                return
+            self._refreshing = True
+        flask_app = app._get_current_object()
+        threading.Thread(
+            target=self._refresh_in_background,
+            args=(flask_app,),
+            name="model-price-refresh",
+            daemon=True,
+        ).start()
+
+    def _refresh_in_background(self, flask_app: Any) -> None:
+        with flask_app.app_context():
+            try:
+                self._refresh()
+            finally:
+                self._refreshing = False
+
+    def _refresh(self) -> None:
+        """Reloads the catalog if the price file changed or expired."""
+        self._next_check_at = time.monotonic() + self.CHECK_INTERVAL
+        try:
+            if self.file_storage is None:
+                self.file_storage = self._get_file_storage()
+            model_token_data, version = self._get_model_token_data()
+        except Exception as e:
+            app.logger.warning(
+                "Error while loading model prices: %s", e, stack_info=True, exc_info=True
+            )
+            if not self._model_token_data:
+                self._next_check_at = time.monotonic() + self.RETRY_INTERVAL
+            return
+        if model_token_data is None:
+            if not self._model_token_data:
+                self._next_check_at = time.monotonic() + self.RETRY_INTERVAL
+            return
+        self._build_index(model_token_data)
+        self.version = version
+
+    def _build_index(self, model_token_data: dict[str, Any]) -> None:
+        by_suffix: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for name, model_info in model_token_data.items():
+            if not isinstance(model_info, dict):
+                continue
+            _, separator, suffix = name.partition("/")
+            if separator:
+                by_suffix.setdefault(suffix, []).append((name, model_info))
+        # Indexes are built before being swapped in, so that lookups never see
+        # a partly built index
+        self._model_token_data = model_token_data
+        self._exact = {
+            name: info
+            for name, info in model_token_data.items()
+            if isinstance(info, dict)
+        }
+        self._by_suffix = by_suffix
+        self._resolved = {}
 
+    def _get_file_storage(self) -> Any:
         try:
-            self.file_storage = EnvHelper.get_storage(
+            return EnvHelper.get_storage(
                 StorageType.PERMANENT, "FILE_STORAGE_CREDENTIALS"
             )
         except KeyError as e:
@@ -38,58 +196,34 @@ class CostCalculationHelper:
             )
             raise e
 
-        self.model_token_data = self._get_model_token_data()
+    def _get_model_token_data(
+        self,
+    ) -> tuple[dict[str, Any] | None, datetime | None]:
+        """Returns the price data to load and its version.
 
-    def calculate_cost(
-        self, model_name: str, provider: str, input_tokens: int, output_tokens: int
-    ) -> str:
-        cost = 0.0
-        item = None
+        Returns:
+            tuple: Price data, None if the loaded catalog is still current,
+                and the modification time of the price file
+        """
+        # File does not exist, fetch JSON data from API
+        if not self.file_storage.exists(self.file_path):
+            return self._fetch_and_save_json(), None
 
-        if not self.model_token_data:
-            return json.loads(format_float_positional(cost))
-        # Filter the model objects by model name
-        filtered_models = {
-            k: v for k, v in self.model_token_data.items() if k.endswith(model_name)
-        }
-        # Check if the lite llm provider starts with the given provider
-        for _, model_info in filtered_models.items():
-            if provider in model_info.get("litellm_provider", ""):
-                item = model_info
-                break
-        if item:
-            input_cost_per_token = item.get("input_cost_per_token", 0)
-            output_cost_per_token = item.get("output_cost_per_token", 0)
-            cost += input_cost_per_token * input_tokens
-            cost += output_cost_per_token * output_tokens
-        return format_float_positional(cost)
+        file_mtime = self.file_storage.modification_time(self.file_path)
+        file_expiry_date = file_mtime + timedelta(days=self.ttl_days)
+        file_expiry_date_utc = file_expiry_date.replace(tzinfo=UTC)
+        now_utc = datetime.now().replace(tzinfo=UTC)
 
-    def _get_model_token_data(self) -> dict[str, Any] | None:
-        try:
-            # File does not exist, fetch JSON data from API
-            if not self.file_storage.exists(self.file_path):
-                return self._fetch_and_save_json()
-
-            file_mtime = self.file_storage.modification_time(self.file_path)
-            file_expiry_date = file_mtime + timedelta(days=self.ttl_days)
-            file_expiry_date_utc = file_expiry_date.replace(tzinfo=UTC)
-            now_utc = datetime.now().replace(tzinfo=UTC)
-
-            if now_utc < file_expiry_date_utc:
-                app.logger.info(f"Reading model token data from {self.file_path}")
-                # File exists and TTL has not expired, read and return content
-                file_contents = self.file_storage.read(
-                    self.file_path, mode="r", encoding="utf-8"
-                )
-                return json.loads(file_contents)
-            else:
-                # TTL expired, fetch updated JSON data from API
-                return self._fetch_and_save_json()
-        except Exception as e:
-            app.logger.warning(
-                "Error in calculate_cost: %s", e, stack_info=True, exc_info=True
-            )
-            return None
+        if now_utc >= file_expiry_date_utc:
+            # TTL expired, fetch updated JSON data from API
+            return self._fetch_and_save_json(), None
+        if self._loaded and file_mtime == self.version:
+            return None, file_mtime
+
+        app.logger.info(f"Reading model token data from {self.file_path}")
+        # File exists and TTL has not expired, read and return content
+        file_contents = self.file_storage.read(self.file_path, mode="r", encoding="utf-8")
+        return json.loads(file_contents), file_mtime
 
     def _fetch_and_save_json(self) -> dict[str, Any] | None:
         """Fetch model's price and token data from the URL.
@@ -122,3 +256,33 @@ class CostCalculationHelper:
                 "Error fetching data from API: %s", e, stack_info=True, exc_info=True
             )
             return None
+
+
+class CostCalculationHelper:
+    def __init__(
+        self,
+        url: str = Env.MODEL_PRICES_URL,
+        ttl_days: int = Env.MODEL_PRICES_TTL_IN_DAYS,
+        file_path: str = Env.MODEL_PRICES_FILE_PATH,
+    ):
+        self.ttl_days = ttl_days
+        self.url = url
+        self.file_path = file_path
+        self.catalog = ModelPriceCatalog.get(
+            url=url, ttl_days=ttl_days, file_path=file_path
+        )
+
+    def calculate_cost(
+        self, model_name: str, provider: str, input_tokens: int, output_tokens: int
+    ) -> str:
+        cost = 0.0
+
+        if not self.catalog.has_prices():
+            return json.loads(format_float_positional(cost))
+        item = self.catalog.find(model_name=model_name, provider=provider)
+        if item:
+            input_cost_per_token = item.get("input_cost_per_token", 0)
+            output_cost_per_token = item.get("output_cost_per_token", 0)
+            cost += input_cost_per_token * input_tokens
+            cost += output_cost_per_token * output_tokens
+        return format_float_positional(cost)
@@ -0,0 +1,97 @@
+"""Tests of the cache endpoints, `/cache` and the batch `/cache/mset` and `/cache/mget`.
+
+Run with: pytest tests/test_cache_batch.py -v
+"""
+
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("ENCRYPTION_KEY", "test")
+os.environ.setdefault("MODEL_PRICES_URL", "http://localhost/model_prices.json")
+os.environ.setdefault("MODEL_PRICES_TTL_IN_DAYS", "7")
+os.environ.setdefault("MODEL_PRICES_FILE_PATH", "cost/model_prices.json")
+os.environ.setdefault("DB_SCHEMA", "unstract")
+
+from flask import Flask  # noqa: E402
+from flask.testing import FlaskClient  # noqa: E402
+from unstract.core.flask import PlatformKeyInfo  # noqa: E402
+from unstract.platform_service.controller import platform  # noqa: E402
+
+HEADERS = {"Authorization": "Bearer platform-key"}
+
+
+@pytest.fixture
+def redis_client() -> Any:
+    key_info = PlatformKeyInfo(
+        is_active=True, organization_uid=1, organization_identifier="org_1"
+    )
+    redis_client = MagicMock()
+    with (
+        patch.object(platform, "get_redis_client", return_value=redis_client),
+        patch.object(platform.platform_key_resolver, "resolve", return_value=key_info),
+    ):
+        yield redis_client
+
+
+@pytest.fixture
+def client() -> FlaskClient:
+    app = Flask("platform-service-test")
+    app.register_blueprint(platform.platform_bp)
+    return app.test_client()
+
+
+def test_mset_writes_keys_in_one_pipeline(
+    redis_client: MagicMock, client: FlaskClient
+) -> None:
+    response = client.post(
+        "/cache/mset", headers=HEADERS, json={"items": {"a": "1", "b": "2"}}
+    )
+
+    assert response.status_code == 200
+    pipeline = redis_client.pipeline.return_value.__enter__.return_value
+    assert [call.args for call in pipeline.set.call_args_list] == [
+        ("org_1:a", "1"),
+        ("org_1:b", "2"),
+    ]
+    # Like `/cache`, values don't expire unless CACHE_TTL or the request says so
+    assert [call.kwargs for call in pipeline.set.call_args_list] == [
+        {"ex": None},
+        {"ex": None},
+    ]
+    pipeline.execute.assert_called_once()
+    redis_client.mset.assert_not_called()
+
+
+def test_set_and_mset_expire_alike(redis_client: MagicMock, client: FlaskClient) -> None:
+    pipeline = redis_client.pipeline.return_value.__enter__.return_value
+    with patch.object(platform.Env, "CACHE_TTL", 60):
+        client.post("/cache", headers=HEADERS, json={"key": "a", "value": "1"})
+        client.post("/cache/mset", headers=HEADERS, json={"items": {"b": "2"}})
+    redis_client.set.assert_called_once_with("org_1:a", "1", ex=60)
+    pipeline.set.assert_called_once_with("org_1:b", "2", ex=60)
+
+    client.post("/cache", headers=HEADERS, json={"key": "a", "value": "1", "ttl": 5})
+    client.post("/cache/mset", headers=HEADERS, json={"items": {"b": "2"}, "ttl": 5})
+    redis_client.set.assert_called_with("org_1:a", "1", ex=5)
+    pipeline.set.assert_called_with("org_1:b", "2", ex=5)
+
+    response = client.post(
+        "/cache/mset", headers=HEADERS, json={"items": {"b": "2"}, "ttl": "5"}
+    )
+    assert response.status_code == 400
+
+
+def test_mget_reads_keys_in_one_request(
+    redis_client: MagicMock, client: FlaskClient
+) -> None:
+    redis_client.mget.return_value = [b"1", None]
+
+    response = client.post("/cache/mget", headers=HEADERS, json={"keys": ["a", "b"]})
+
+    assert response.status_code == 200
+    assert response.json["values"] == {"a": "1", "b": None}
+    redis_client.mget.assert_called_once_with(["org_1:a", "org_1:b"])
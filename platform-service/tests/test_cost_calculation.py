@@ -0,0 +1,132 @@
+"""Tests of the model price catalog used to calculate the cost of LLM calls.
+
+Permanent storage is replaced by a fake holding the price file in memory.
+
+Run with: pytest tests/test_cost_calculation.py -v
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("ENCRYPTION_KEY", "test")
+os.environ.setdefault("MODEL_PRICES_URL", "http://localhost/model_prices.json")
+os.environ.setdefault("MODEL_PRICES_TTL_IN_DAYS", "7")
+os.environ.setdefault("MODEL_PRICES_FILE_PATH", "cost/model_prices.json")
+os.environ.setdefault("DB_SCHEMA", "unstract")
+
+from flask import Flask  # noqa: E402
+from unstract.platform_service.helper.cost_calculation import (  # noqa: E402
+    CostCalculationHelper,
+    ModelPriceCatalog,
+)
+
+URL = "http://localhost/model_prices.json"
+FILE_PATH = "cost/model_prices.json"
+PRICES = {
+    "gpt-4o": {
+        "litellm_provider": "openai",
+        "input_cost_per_token": 0.001,
+        "output_cost_per_token": 0.002,
+    },
+    "azure/gpt-4o": {
+        "litellm_provider": "azure",
+        "input_cost_per_token": 0.003,
+        "output_cost_per_token": 0.004,
+    },
+    "bedrock/anthropic.claude-v2": {
+        "litellm_provider": "bedrock",
+        "input_cost_per_token": 0.005,
+        "output_cost_per_token": 0.006,
+    },
+}
+
+
+class FakeFileStorage:
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self.mtime = datetime.now()
+        self.reads = 0
+
+    def exists(self, path: str) -> bool:
+        return True
+
+    def modification_time(self, path: str) -> datetime:
+        return self.mtime
+
+    def read(self, path: str, mode: str, encoding: str) -> str:
+        self.reads += 1
+        return json.dumps(self.data)
+
+
+@pytest.fixture
+def storage() -> Any:
+    storage = FakeFileStorage(PRICES)
+    ModelPriceCatalog.clear()
+    app = Flask("platform-service-test")
+    with (
+        patch.object(ModelPriceCatalog, "_get_file_storage", return_value=storage),
+        app.app_context(),
+    ):
+        yield storage
+    ModelPriceCatalog.clear()
+
+
+def get_catalog() -> ModelPriceCatalog:
+    return ModelPriceCatalog.get(url=URL, ttl_days=7, file_path=FILE_PATH)
+
+
+def test_lookup_matches_model_and_provider(storage: FakeFileStorage) -> None:
+    catalog = get_catalog()
+
+    assert catalog.find(model_name="gpt-4o", provider="openai") == PRICES["gpt-4o"]
+    assert catalog.find(model_name="gpt-4o", provider="azure") == PRICES["azure/gpt-4o"]
+    # The catalog is loaded once per process
+    assert get_catalog() is catalog
+    assert storage.reads == 1
+
+
+def test_lookup_falls_back_to_model_name_suffix(storage: FakeFileStorage) -> None:
+    catalog = get_catalog()
+
+    assert (
+        catalog.find(model_name="claude-v2", provider="bedrock")
+        == PRICES["bedrock/anthropic.claude-v2"]
+    )
+
+
+def test_unknown_model_costs_nothing(storage: FakeFileStorage) -> None:
+    helper = CostCalculationHelper(url=URL, ttl_days=7, file_path=FILE_PATH)
+
+    assert helper.catalog.find(model_name="gpt-5", provider="openai") is None
+    assert helper.catalog.find(model_name="gpt-4o", provider="vertex_ai") is None
+    assert helper.calculate_cost("gpt-5", "openai", 100, 100) == "0"
+    assert helper.calculate_cost("gpt-4o", "openai", 100, 100) == "0.3"
+
+
+def test_refresh_loads_a_newer_price_file(storage: FakeFileStorage) -> None:
+    catalog = get_catalog()
+    assert catalog.find(model_name="gpt-5", provider="openai") is None
+
+    # The loaded catalog is kept while the price file is unchanged
+    catalog._refresh()
+    assert storage.reads == 1
+
+    storage.data = {
+        **PRICES,
+        "gpt-5": {"litellm_provider": "openai", "input_cost_per_token": 0.01},
+    }
+    storage.mtime += timedelta(minutes=1)
+    catalog._refresh()
+
+    assert storage.reads == 2
+    assert catalog.version == storage.mtime
+    assert catalog.find(model_name="gpt-5", provider="openai") == {
+        "litellm_provider": "openai",
+        "input_cost_per_token": 0.01,
+    }
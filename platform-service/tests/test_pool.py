@@ -0,0 +1,146 @@
+"""Tests of the pooled database connections.
+
+Postgres is replaced by a fake driver, which counts the connections opened
+and can drop a connection as the server would.
+
+Run with: pytest tests/test_pool.py -v
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Self
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("DB_SCHEMA", "unstract")
+
+import psycopg2  # noqa: E402
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE  # noqa: E402
+from unstract.platform_service.extensions import (  # noqa: E402
+    db,
+    execute_prepared,
+    init_db,
+)
+
+MAX_CONNECTIONS = 4
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+        self.description: list[tuple] = []
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        if self.connection.dropped:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.connection.statements.append(sql)
+
+    def fetchone(self) -> tuple | None:
+        return None
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+
+class FakeConnection:
+    opened: list["FakeConnection"] = []
+    _lock = threading.Lock()
+
+    def __init__(self, **kwargs: Any) -> None:
+        with FakeConnection._lock:
+            FakeConnection.opened.append(self)
+        self.closed = False
+        self.dropped = False
+        self.autocommit = True
+        self.server_version = 160000
+        self.statements: list[str] = []
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def get_transaction_status(self) -> int:
+        return TRANSACTION_STATUS_IDLE
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pool() -> Any:
+    FakeConnection.opened = []
+    with patch("peewee.psycopg2.connect", FakeConnection):
+        init_db(
+            pool_enabled=True,
+            min_connections=2,
+            max_connections=MAX_CONNECTIONS,
+            wait_timeout=5,
+            health_check_interval=0,
+            database="unstract_db",
+            register_unicode=False,
+        )
+        yield db.obj
+        db.obj.close_all()
+
+
+def select() -> None:
+    db.execute_sql("SELECT 1").close()
+
+
+def touch_usage() -> None:
+    execute_prepared("touch_usage", "UPDATE usage SET run_id = %s", ("run-1",))
+
+
+def request(run: Callable[[], None] = select) -> FakeConnection:
+    """Runs queries the way a request does, returning its connection."""
+    db.connect()
+    try:
+        run()
+        return db.connection()
+    finally:
+        db.close()
+
+
+def test_connections_are_reused_and_returned(pool: Any) -> None:
+    connections = {id(request()) for _ in range(10)}
+
+    # The warm connections serve sequential requests
+    assert len(FakeConnection.opened) == 2
+    assert len(connections) == 1
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        list(executor.map(lambda _: request(), range(100)))
+
+    assert len(FakeConnection.opened) <= MAX_CONNECTIONS
+    # Every connection was returned to the pool, so closing idle ones closes all
+    pool.close_idle()
+    assert all(connection.closed for connection in FakeConnection.opened)
+
+
+def test_dropped_connection_is_health_checked_and_replaced(pool: Any) -> None:
+    request(touch_usage)
+    for connection in FakeConnection.opened:
+        connection.dropped = True
+
+    connection = request(touch_usage)
+
+    assert len(FakeConnection.opened) == 3
+    assert connection is FakeConnection.opened[-1]
+    # The statement is prepared again on the new connection
+    assert connection.statements[0].startswith("PREPARE touch_usage")
+    assert connection.statements[1].startswith("EXECUTE touch_usage")
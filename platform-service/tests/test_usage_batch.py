@@ -0,0 +1,136 @@
+"""Tests of the bulk usage endpoint, `/usage/batch`.
+
+Run with: pytest tests/test_usage_batch.py -v
+"""
+
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("ENCRYPTION_KEY", "test")
+os.environ.setdefault("MODEL_PRICES_URL", "http://localhost/model_prices.json")
+os.environ.setdefault("MODEL_PRICES_TTL_IN_DAYS", "7")
+os.environ.setdefault("MODEL_PRICES_FILE_PATH", "cost/model_prices.json")
+os.environ.setdefault("DB_SCHEMA", "unstract")
+
+from flask import Flask  # noqa: E402
+from flask.testing import FlaskClient  # noqa: E402
+from unstract.core.flask import PlatformKeyInfo  # noqa: E402
+from unstract.platform_service.controller import platform  # noqa: E402
+
+HEADERS = {"Authorization": "Bearer platform-key"}
+TOKEN_USAGE = {
+    "type": "usage",
+    "run_id": "run-1",
+    "usage_type": "llm",
+    "model_name": "gpt-4o",
+    "prompt_tokens": 10,
+    "completion_tokens": 5,
+    "total_tokens": 15,
+}
+PAGE_USAGE = {
+    "type": "page_usage",
+    "run_id": "run-1",
+    "file_name": "lease.pdf",
+    "page_count": 2,
+}
+
+
+@pytest.fixture
+def db() -> Any:
+    key_info = PlatformKeyInfo(
+        is_active=True, organization_uid=1, organization_identifier="org_1"
+    )
+    with (
+        patch.object(platform, "db") as db,
+        patch.object(platform.platform_key_resolver, "resolve", return_value=key_info),
+        patch.object(platform, "PluginManager", MagicMock()),
+    ):
+        yield db
+
+
+@pytest.fixture
+def client() -> FlaskClient:
+    app = Flask("platform-service-test")
+    app.register_blueprint(platform.platform_bp)
+    return app.test_client()
+
+
+def test_records_are_inserted_in_one_query_per_table(
+    db: MagicMock, client: FlaskClient
+) -> None:
+    records = [TOKEN_USAGE, PAGE_USAGE, TOKEN_USAGE]
+
+    response = client.post("/usage/batch", headers=HEADERS, json={"records": records})
+
+    assert response.status_code == 200
+    assert response.json["status"] == "OK"
+    assert response.json["errors"] == []
+    assert len(response.json["unique_ids"]) == 3
+    assert db.execute_sql.call_count == 2
+    token_params = db.execute_sql.call_args_list[0].args[1]
+    page_params = db.execute_sql.call_args_list[1].args[1]
+    assert len(token_params) == 2 * len(platform.TOKEN_USAGE_COLUMNS)
+    assert len(page_params) == len(platform.PAGE_USAGE_COLUMNS)
+    # IDs are returned in the order records were sent
+    assert token_params[0] == platform.uuid.UUID(response.json["unique_ids"][0])
+    assert page_params[0] == platform.uuid.UUID(response.json["unique_ids"][1])
+
+
+def test_invalid_records_are_rejected_on_their_own(
+    db: MagicMock, client: FlaskClient
+) -> None:
+    records = [
+        TOKEN_USAGE,
+        {**TOKEN_USAGE, "prompt_tokens": "ten"},
+        {"type": "unknown"},
+        "usage",
+        {**PAGE_USAGE, "page_count": -1},
+        PAGE_USAGE,
+    ]
+
+    response = client.post("/usage/batch", headers=HEADERS, json={"records": records})
+
+    assert response.status_code == 200
+    assert response.json["status"] == "OK"
+    assert [error["index"] for error in response.json["errors"]] == [1, 2, 3, 4]
+    unique_ids = response.json["unique_ids"]
+    assert [unique_id is not None for unique_id in unique_ids] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+        True,
+    ]
+    token_params = db.execute_sql.call_args_list[0].args[1]
+    page_params = db.execute_sql.call_args_list[1].args[1]
+    assert len(token_params) == len(platform.TOKEN_USAGE_COLUMNS)
+    assert len(page_params) == len(platform.PAGE_USAGE_COLUMNS)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{"records": []}, {}, {"records": [{"type": "usage", "total_tokens": True}]}],
+)
+def test_batches_without_valid_records_are_rejected(
+    db: MagicMock, client: FlaskClient, payload: dict[str, Any]
+) -> None:
+    response = client.post("/usage/batch", headers=HEADERS, json=payload)
+
+    assert response.status_code == 400
+    assert response.json["status"] == "ERROR"
+    db.execute_sql.assert_not_called()
+
+
+def test_database_errors_fail_the_batch(db: MagicMock, client: FlaskClient) -> None:
+    db.execute_sql.side_effect = Exception("connection lost")
+
+    response = client.post(
+        "/usage/batch", headers=HEADERS, json={"records": [TOKEN_USAGE]}
+    )
+
+    assert response.status_code == 500
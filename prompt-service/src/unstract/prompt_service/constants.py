@@ -62,6 +62,7 @@ class PromptServiceConstants:
     TABLE = "table"
     TABLE_SETTINGS = "table_settings"
     USE_VISION_TABLE_EXTRACTION = "use_vision_table_extraction"
+    PROMPT_CONCURRENCY = "prompt_concurrency"
     EPILOGUE = "epilogue"
     PLATFORM_POSTAMBLE = "platform_postamble"
     WORD_CONFIDENCE_POSTAMBLE = "word_confidence_postamble"
@@ -166,6 +167,7 @@ class RetrievalStrategy(str, Enum):
     ROUTER = "router"
     KEYWORD_TABLE = "keyword_table"
     AUTOMERGING = "automerging"
+    HYBRID = "hybrid"
 
 
 class VariableConstants:
@@ -192,6 +194,7 @@ class IndexingConstants:
     REINDEX = "reindex"
     FILE_HASH = "file_hash"
     OUTPUT_FILE_PATH = "output_file_path"
+    INPUT_FILE_PATH = "input_file_path"
     ENABLE_HIGHLIGHT = "enable_highlight"
     ENABLE_WORD_CONFIDENCE = "enable_word_confidence"
     USAGE_KWARGS = "usage_kwargs"
@@ -10,10 +10,12 @@ from unstract.core.flask.exceptions import APIError
 from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
 from unstract.prompt_service.constants import RetrievalStrategy, RunLevel
 from unstract.prompt_service.exceptions import BadRequest
+from unstract.prompt_service.helpers.adapter_registry import AdapterRegistry
 from unstract.prompt_service.helpers.auth import AuthHelper
 from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
 from unstract.prompt_service.helpers.usage import UsageHelper
 from unstract.prompt_service.services.answer_prompt import AnswerPromptService
+from unstract.prompt_service.services.prompt_execution import PromptExecutionService
 from unstract.prompt_service.services.rentrolls_extractor.interface import (
     RentRollExtractor,
 )
@@ -21,18 +23,16 @@ from unstract.prompt_service.services.vision_table_extraction import (
     VisionTableExtractionService,
 )
 from unstract.prompt_service.services.retrieval import RetrievalService
+from unstract.prompt_service.services.type_coercion import TypeCoercionService
 from unstract.prompt_service.services.variable_replacement import (
     VariableReplacementService,
 )
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.prompt_service.utils.log import publish_log
 from unstract.sdk1.constants import LogLevel
-from unstract.sdk1.embedding import EmbeddingCompat
 from unstract.sdk1.exceptions import SdkError
 from unstract.sdk1.index import Index
-from unstract.sdk1.llm import LLM
 from unstract.sdk1.platform import PlatformHelper as ToolAdapter
-from unstract.sdk1.vector_db import VectorDB
 
 answer_prompt_bp = Blueprint("answer-prompt", __name__)
 
@@ -82,13 +82,21 @@ def prompt_processor() -> Any:
             PSKeys.REQUIRED, None
         )
 
-    for output in prompts:  # type:ignore
+    util = PromptServiceBaseTool(platform_key=platform_key)
+    index = Index(tool=util, run_id=run_id, capture_metrics=True)
+    # Adapters are shared by the prompts of this request
+    adapters = AdapterRegistry(tool=util)
+    usage_kwargs = {"run_id": run_id, "execution_id": execution_id}
+
+    def execute_prompt(output: dict[str, Any]) -> dict[str, Any] | None:
+        """Executes a single prompt, returning a response to end the run early."""
+        nonlocal structured_output, metadata, metrics
+        challenge_llm = None
+        type_coercion = None
         prompt_name = output[PSKeys.NAME]
         prompt_text = output[PSKeys.PROMPT]
         chunk_size = output[PSKeys.CHUNK_SIZE]
         app.logger.info(f"[{tool_id}] chunk size: {chunk_size}")
-        util = PromptServiceBaseTool(platform_key=platform_key)
-        index = Index(tool=util, run_id=run_id, capture_metrics=True)
         if VariableReplacementService.is_variables_present(prompt_text=prompt_text):
             # Determine if this is from IDE (Prompt Studio) or API deployment
             is_ide = execution_source == "ide"
@@ -144,34 +152,22 @@ def prompt_processor() -> Any:
         )
 
         try:
-            usage_kwargs = {"run_id": run_id, "execution_id": execution_id}
-            llm = LLM(
+            llm = adapters.get_llm(
                 adapter_instance_id=output[PSKeys.LLM],
-                tool=util,
                 usage_kwargs={
                     **usage_kwargs,
                     PSKeys.LLM_USAGE_REASON: PSKeys.EXTRACTION,
                 },
-                capture_metrics=True,
             )
 
             # Only create embedding and vector_db if chunk_size > 0
             # When chunk_size is 0, we read the complete file without embeddings
-            embedding = None
             vector_db = None
             if chunk_size > 0:
-                embedding = EmbeddingCompat(
-                    adapter_instance_id=output[PSKeys.EMBEDDING],
-                    tool=util,
-                    kwargs={
-                        **usage_kwargs,
-                    },
-                )
-
-                vector_db = VectorDB(
-                    tool=util,
+                vector_db = adapters.get_vector_db(
                     adapter_instance_id=output[PSKeys.VECTOR_DB],
-                    embedding=embedding,
+                    embedding_instance_id=output[PSKeys.EMBEDDING],
+                    usage_kwargs=usage_kwargs,
                 )
         except SdkError as e:
             msg = f"Couldn't fetch adapter. {e}"
@@ -423,7 +419,7 @@ def prompt_processor() -> Any:
                     metadata=metadata,
                     execution_source=execution_source,
                 )
-                continue
+                return None
             except APIError as e:
                 app.logger.error(
                     "Failed to extract line-item for the prompt %s: %s",
@@ -516,9 +512,24 @@ def prompt_processor() -> Any:
                 f"Processing prompt type: {output[PSKeys.TYPE]}",
             )
 
+            coerced = None
+            if (
+                output[PSKeys.TYPE] in TypeCoercionService.TYPES
+                and answer.lower() != "na"
+            ):
+                # Answers which parse unambiguously skip the LLM conversion
+                coerced = TypeCoercionService.coerce(output[PSKeys.TYPE], answer)
+                type_coercion = (
+                    TypeCoercionService.LLM
+                    if coerced is None
+                    else TypeCoercionService.FAST_PATH
+                )
+
             if output[PSKeys.TYPE] == PSKeys.NUMBER:
                 if answer.lower() == "na":
                     structured_output[output[PSKeys.NAME]] = None
+                elif coerced is not None:
+                    structured_output[output[PSKeys.NAME]] = coerced
                 else:
                     # Extract these prompts as constants after pkging
                     prompt = f"Extract the number from the following \
@@ -546,6 +557,8 @@ def prompt_processor() -> Any:
             elif output[PSKeys.TYPE] == PSKeys.EMAIL:
                 if answer.lower() == "na":
                     structured_output[output[PSKeys.NAME]] = None
+                elif coerced is not None:
+                    structured_output[output[PSKeys.NAME]] = coerced
                 else:
                     prompt = f'Extract the email from the following text:\n{answer}\n\nOutput just the email. \
                         The email should be directly assignable to a string variable. \
@@ -558,6 +571,8 @@ def prompt_processor() -> Any:
             elif output[PSKeys.TYPE] == PSKeys.DATE:
                 if answer.lower() == "na":
                     structured_output[output[PSKeys.NAME]] = None
+                elif coerced is not None:
+                    structured_output[output[PSKeys.NAME]] = coerced
                 else:
                     prompt = f'Extract the date from the following text:\n{answer}\n\nOutput just the date.\
                           The date should be in ISO date time format. No explanation is required. \
@@ -572,6 +587,8 @@ def prompt_processor() -> Any:
             elif output[PSKeys.TYPE] == PSKeys.BOOLEAN:
                 if answer.lower() == "na":
                     structured_output[output[PSKeys.NAME]] = None
+                elif coerced is not None:
+                    structured_output[output[PSKeys.NAME]] = coerced
                 else:
                     prompt = f'Extract yes/no from the following text:\n{answer}\n\n\
                         Output in single word.\
@@ -629,14 +646,12 @@ def prompt_processor() -> Any:
                             RunLevel.CHALLENGE,
                             "Challenging response",
                         )
-                        challenge_llm = LLM(
+                        challenge_llm = adapters.get_llm(
                             adapter_instance_id=tool_settings[PSKeys.CHALLENGE_LLM],
-                            tool=util,
                             usage_kwargs={
                                 **usage_kwargs,
                                 PSKeys.LLM_USAGE_REASON: PSKeys.CHALLENGE,
                             },
-                            capture_metrics=True,
                         )
                         challenge = challenge_plugin["entrypoint_cls"](
                             llm=llm,
@@ -750,9 +765,38 @@ def prompt_processor() -> Any:
                     **challenge_metrics,
                 }
             )
-            # Only close vector_db if it was created (chunk_size > 0)
-            if vector_db:
-                vector_db.close()
+            if type_coercion:
+                metrics[prompt_name]["type_coercion"] = type_coercion
+        return None
+
+    dependencies = PromptExecutionService.get_dependencies(prompts, variable_names)
+    max_workers = PromptExecutionService.get_max_workers(tool_settings)
+    with adapters:
+        RetrievalService.embed_queries(
+            prompts=prompts,
+            variable_names=variable_names,
+            tool_settings=tool_settings,
+            adapters=adapters,
+            usage_kwargs=usage_kwargs,
+        )
+        if max_workers > 1 and PromptExecutionService.can_run_concurrently(
+            prompts, dependencies, tool_settings
+        ):
+            PromptExecutionService.run_concurrently(
+                prompts=prompts,
+                dependencies=dependencies,
+                execute=execute_prompt,
+                max_workers=max_workers,
+            )
+            PromptExecutionService.restore_prompt_order(
+                variable_names, structured_output, metadata, metrics
+            )
+        else:
+            for output in prompts:  # type:ignore
+                response = execute_prompt(output)
+                if response is not None:
+                    return response
+
     publish_log(
         log_events_id,
         {"tool_id": tool_id, "doc_name": doc_name},
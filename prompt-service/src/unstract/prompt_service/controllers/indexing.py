@@ -62,7 +62,10 @@ def index() -> Any:
     enable_highlight: bool = payload.get(IKeys.ENABLE_HIGHLIGHT, False)
     enable_word_confidence: bool = payload.get(IKeys.ENABLE_WORD_CONFIDENCE, False)
     usage_kwargs: dict[Any, Any] = payload.get(IKeys.USAGE_KWARGS, {})
-    extracted_text: str = payload.get(IKeys.EXTRACTED_TEXT, "")
+    extracted_text: str | None = payload.get(IKeys.EXTRACTED_TEXT, "")
+    # Documents sent without their text are extracted while they're indexed
+    input_file_path: str | None = payload.get(IKeys.INPUT_FILE_PATH)
+    output_file_path: str | None = payload.get(IKeys.OUTPUT_FILE_PATH)
     tags: list[str] = payload.get(IKeys.TAGS, None)
     execution_source = payload.get(IKeys.EXECUTION_SOURCE, None)
     run_id: str = payload.get(PSKeys.RUN_ID, "")
@@ -95,6 +98,8 @@ def index() -> Any:
         platform_key=platform_key,
         processing_options=processing_options,
         extracted_text=extracted_text,
+        input_file_path=input_file_path,
+        output_file_path=output_file_path,
     )
     response = {
         IKeys.DOC_ID: doc_id,
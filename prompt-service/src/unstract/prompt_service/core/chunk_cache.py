@@ -0,0 +1,132 @@
+"""Process-wide cache of the chunks of indexed documents.
+
+The first retrieval on a document fetches all of its nodes and embeddings
+from the vector DB. Later prompts on the same document rank the cached
+chunks locally, with a cosine similarity over a NumPy matrix, instead of
+querying the vector DB again. Documents whose nodes may have been capped at
+`VectorDB.MAX_DOCUMENT_NODES` are still queried in the vector DB.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from unstract.prompt_service.utils.env_loader import get_env_or_die
+from unstract.sdk1.vector_db import VectorDB
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentChunks:
+    """Chunks of a document and, if all of them are known, their embeddings."""
+
+    def __init__(
+        self,
+        texts: list[str],
+        embeddings: list[list[float] | None],
+        complete: bool = True,
+    ):
+        """Initialize the chunks.
+
+        Args:
+            texts (list[str]): Text of each chunk
+            embeddings (list[list[float] | None]): Embedding of each chunk
+            complete (bool): Whether these are all the chunks of the document.
+                Partial chunks can't be ranked.
+        """
+        self.texts = texts
+        self.complete = complete
+        self.matrix: np.ndarray | None = None
+        if texts and complete and all(embedding is not None for embedding in embeddings):
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            # Normalised once, so that ranking is a single matrix-vector product
+            self.matrix = matrix / np.where(norms == 0, 1, norms)
+
+    def can_rank(self) -> bool:
+        return self.matrix is not None
+
+    def rank(self, query_embedding: list[float], top_k: int) -> list[tuple[str, float]]:
+        """Returns the `top_k` chunks most similar to a query, with their scores.
+
+        Args:
+            query_embedding (list[float]): Embedding of the query
+            top_k (int): Number of chunks to return
+
+        Returns:
+            list[tuple[str, float]]: Chunks and their cosine similarity, best
+                first
+        """
+        if self.matrix is None:
+            raise ValueError("Chunks can't be ranked without their embeddings")
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        scores = self.matrix @ (query / norm if norm else query)
+        top_k = min(top_k, len(self.texts))
+        if top_k <= 0:
+            return []
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.texts[index], float(scores[index])) for index in top]
+
+
+class ChunkCache:
+    """LRU cache of `DocumentChunks`, keyed by vector DB and `doc_id`.
+
+    Entries expire after a while, so that documents re-indexed by other
+    processes are fetched again.
+
+    Configurable via environment variables:
+    - CHUNK_CACHE_SIZE (default: 16 documents, 0 disables the cache)
+    - CHUNK_CACHE_TTL (default: 300s)
+    """
+
+    _entries: OrderedDict[tuple[str, str], tuple[float, DocumentChunks]] = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return int(get_env_or_die("CHUNK_CACHE_SIZE", "16")) > 0
+
+    @staticmethod
+    def get(vector_db: VectorDB, doc_id: str) -> DocumentChunks:
+        """Returns the chunks of a document, fetching them on a miss."""
+        key = (str(getattr(vector_db, "_adapter_instance_id", None)), doc_id)
+        size = int(get_env_or_die("CHUNK_CACHE_SIZE", "16"))
+        ttl = float(get_env_or_die("CHUNK_CACHE_TTL", "300"))
+        now = time.monotonic()
+        with ChunkCache._lock:
+            entry = ChunkCache._entries.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                ChunkCache._entries.move_to_end(key)
+                return entry[1]
+
+        nodes = vector_db.get_document_nodes(doc_id)
+        chunks = DocumentChunks(
+            texts=[node.get_content() for node in nodes],
+            embeddings=[node.embedding for node in nodes],
+            # Nodes fetched by a similarity query stop at the cap
+            complete=len(nodes) < VectorDB.MAX_DOCUMENT_NODES,
+        )
+        if not chunks.complete:
+            status = "possibly capped, ranked by the vector DB"
+        elif chunks.can_rank():
+            status = "ranked locally"
+        else:
+            status = "without embeddings"
+        logger.info("Fetched %d chunks of %s, %s", len(chunks.texts), doc_id, status)
+        if size <= 0 or not chunks.texts:
+            return chunks
+        with ChunkCache._lock:
+            ChunkCache._entries[key] = (now, chunks)
+            ChunkCache._entries.move_to_end(key)
+            while len(ChunkCache._entries) > size:
+                ChunkCache._entries.popitem(last=False)
+        return chunks
+
+    @staticmethod
+    def clear() -> None:
+        with ChunkCache._lock:
+            ChunkCache._entries.clear()
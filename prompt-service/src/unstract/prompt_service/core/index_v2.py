@@ -1,9 +1,12 @@
 import json
 import logging
+from collections.abc import Iterable, Iterator
+from itertools import batched
 from typing import Any
 
 import openai
 from llama_index.core import Document
+from llama_index.core.node_parser import SentenceSplitter
 from llama_index.core.vector_stores import (
     FilterOperator,
     MetadataFilter,
@@ -12,12 +15,15 @@ from llama_index.core.vector_stores import (
     VectorStoreQueryResult,
 )
 
+from unstract.prompt_service.core.keyword_index import BM25Index, KeywordIndexStore
 from unstract.prompt_service.dto import (
     ChunkingConfig,
     FileInfo,
     InstanceIdentifiers,
     ProcessingOptions,
 )
+from unstract.prompt_service.exceptions import ExtractionError
+from unstract.prompt_service.utils.env_loader import get_env_or_die
 from unstract.sdk1.adapters.vectordb.no_op.src.no_op_custom_vectordb import (
     NoOpCustomVectorDB,
 )
@@ -36,6 +42,15 @@ logger = logging.getLogger(__name__)
 
 
 class Index:
+    """Indexes the text of a document into a vector DB.
+
+    Configurable via environment variables:
+    - INDEX_STREAMING_BATCH_PAGES (default: 10): pages chunked and embedded
+      together when a document is indexed while it's extracted
+    """
+
+    DEFAULT_STREAMING_BATCH_PAGES = "10"
+
     def __init__(
         self,
         tool: StreamMixin,
@@ -114,26 +129,19 @@ class Index:
         """Checks if nodes are already present in the vector database for a
         given doc_id.
 
+        The vector DB looks the document up natively where it can, otherwise
+        a similarity query filtered by the doc_id is run.
+
         Returns:
-            str: The document ID.
+            bool: Whether the document is indexed
         """
-        # Checking if document is already indexed against doc_id
-        doc_id_eq_filter = MetadataFilter.from_dict(
-            {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
-        )
-        filters = MetadataFilters(filters=[doc_id_eq_filter])
-        q = VectorStoreQuery(
-            query_embedding=embedding.get_query_embedding(" "),
-            doc_ids=[doc_id],
-            filters=filters,
-        )
-
         doc_id_found = False
         try:
-            n: VectorStoreQueryResult = vector_db.query(query=q)
-            if len(n.nodes) > 0:
-                doc_id_found = True
-                self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
+            doc_id_found = vector_db.has_document(doc_id)
+            if doc_id_found is None:
+                doc_id_found = self._query_document(doc_id, embedding, vector_db)
+            if doc_id_found:
+                self.tool.stream_log(f"Found nodes for {doc_id}")
             else:
                 self.tool.stream_log(f"No nodes found for {doc_id}")
         except Exception as e:
@@ -149,14 +157,35 @@ class Index:
 
         return doc_id_found
 
+    @staticmethod
+    def _query_document(doc_id: str, embedding: Embedding, vector_db: VectorDB) -> bool:
+        doc_id_eq_filter = MetadataFilter.from_dict(
+            {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
+        )
+        filters = MetadataFilters(filters=[doc_id_eq_filter])
+        q = VectorStoreQuery(
+            query_embedding=embedding.get_query_embedding(" "),
+            doc_ids=[doc_id],
+            filters=filters,
+        )
+        n: VectorStoreQueryResult = vector_db.query(query=q)
+        return len(n.nodes) > 0
+
     @capture_metrics
     def perform_indexing(
         self,
         vector_db: VectorDB,
         doc_id: str,
-        extracted_text: str,
+        extracted_text: str | Iterable[str],
         doc_id_found: bool,
+        fs: FileStorage | None = None,
     ):
+        """Indexes the text of a document.
+
+        `extracted_text` is either the complete text or an iterable of page
+        texts, e.g. from `ExtractionService.extract_pages`, which are indexed
+        in batches while they're extracted.
+        """
         if isinstance(
             vector_db.get_vector_db(
                 adapter_instance_id=self.instance_identifiers.vector_db_instance_id,
@@ -166,6 +195,11 @@ class Index:
         ):
             return doc_id
 
+        if not isinstance(extracted_text, str):
+            documents = self._index_pages(vector_db, doc_id, extracted_text, doc_id_found)
+            self._index_keywords(fs, doc_id, documents)
+            return doc_id
+
         self.tool.stream_log("Indexing file...")
         full_text = [
             {
@@ -178,22 +212,82 @@ class Index:
         if self.processing_options.reindex and doc_id_found:
             self.delete_nodes(vector_db, doc_id)
         self._trigger_indexing(vector_db, documents)
+        self._index_keywords(fs, doc_id, documents)
         return doc_id
 
-    def _trigger_indexing(self, vector_db, documents):
+    def _index_pages(
+        self,
+        vector_db: VectorDB,
+        doc_id: str,
+        pages: Iterable[str],
+        doc_id_found: bool,
+    ) -> list[Document]:
+        """Indexes pages in batches while they're extracted.
+
+        Each batch of pages is chunked, embedded and stored before the next
+        one is extracted, see `VectorDB.index_document_batches`, so chunks
+        never span two batches. Earlier nodes of the document are deleted once
+        there's text to index.
+
+        Returns:
+            list[Document]: Documents of the indexed batches
+        """
+        self.tool.stream_log("Indexing file while it's extracted...")
+        batch_pages = max(
+            int(
+                get_env_or_die(
+                    "INDEX_STREAMING_BATCH_PAGES", self.DEFAULT_STREAMING_BATCH_PAGES
+                )
+            ),
+            1,
+        )
+        documents: list[Document] = []
+
+        def document_batches() -> Iterator[list[Document]]:
+            for page_batch in batched(pages, batch_pages):
+                text = "\n".join(page_text for page_text in page_batch if page_text)
+                if not text:
+                    continue
+                if not documents and self.processing_options.reindex and doc_id_found:
+                    self.delete_nodes(vector_db, doc_id)
+                document = Document(
+                    text=text, doc_id=doc_id, metadata={"section": "full"}
+                )
+                document.id_ = doc_id
+                documents.append(document)
+                self.tool.stream_log(f"Indexing batch {len(documents)} of pages")
+                yield [document]
+            if not documents:
+                raise SdkError(f"No text available to index for {doc_id}")
+
+        self._trigger_indexing(vector_db, document_batches(), batched=True)
+        return documents
+
+    def _trigger_indexing(self, vector_db, documents, batched: bool = False):
         self.tool.stream_log("Adding nodes to vector db...")
         try:
-            vector_db.index_document(
-                documents,
-                chunk_size=self.chunking_config.chunk_size,
-                chunk_overlap=self.chunking_config.chunk_overlap,
-                show_progress=True,
-            )
+            if batched:
+                vector_db.index_document_batches(
+                    documents,
+                    chunk_size=self.chunking_config.chunk_size,
+                    chunk_overlap=self.chunking_config.chunk_overlap,
+                    show_progress=True,
+                )
+            else:
+                vector_db.index_document(
+                    documents,
+                    chunk_size=self.chunking_config.chunk_size,
+                    chunk_overlap=self.chunking_config.chunk_overlap,
+                    show_progress=True,
+                )
             self.tool.stream_log("File has been indexed successfully")
         # Handle embedding errors from litellm
         except openai.OpenAIError as e:
             e = parse_litellm_err(e)
             raise e
+        # Errors of the extraction are raised as is, with their status code
+        except ExtractionError:
+            raise
         except Exception as e:
             self.tool.stream_log(
                 f"Error adding nodes to vector db: {e}",
@@ -201,6 +295,27 @@ class Index:
             )
             raise e
 
+    def _index_keywords(
+        self, fs: FileStorage | None, doc_id: str, documents: list[Document]
+    ) -> None:
+        """Stores a BM25 index of the chunks added to the vector DB.
+
+        Documents are split as `VectorDB.index_document` splits them, so the
+        keyword index holds the same chunks as the vector DB.
+        """
+        try:
+            parser = SentenceSplitter.from_defaults(
+                chunk_size=self.chunking_config.chunk_size,
+                chunk_overlap=self.chunking_config.chunk_overlap,
+            )
+            nodes = parser.get_nodes_from_documents(documents)
+            keyword_index = BM25Index.build([node.get_content() for node in nodes])
+        except Exception as e:
+            # Keyword retrieval builds the index from the vector DB instead
+            logger.warning(f"Unable to build keyword index of {doc_id}: {e}")
+            return
+        KeywordIndexStore.save(fs, doc_id, keyword_index)
+
     def delete_nodes(self, vector_db: VectorDB, doc_id: str):
         try:
             vector_db.delete(ref_doc_id=doc_id)
@@ -0,0 +1,158 @@
+"""Lexical (BM25) index of the chunks of an indexed document.
+
+The index is built from the chunks stored in the vector DB when a document
+is indexed and persisted in file storage under its `doc_id`, so keyword
+retrieval only scores the chunks in memory, without LLM calls.
+"""
+
+import logging
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Any
+
+from unstract.prompt_service.utils.env_loader import get_env_or_die
+from unstract.sdk1.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into lowercase words and numbers."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    """Okapi BM25 scoring over inverted postings of the chunks of a document."""
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(
+        self,
+        chunks: list[str],
+        postings: dict[str, list[list[int]]],
+        lengths: list[int],
+    ):
+        """Initialize the index.
+
+        Args:
+            chunks (list[str]): Text of the chunks
+            postings (dict[str, list[list[int]]]): ``[chunk, term frequency]``
+                pairs of each term
+            lengths (list[int]): Number of terms of each chunk
+        """
+        self.chunks = chunks
+        self.postings = postings
+        self.lengths = lengths
+        self.average_length = sum(lengths) / len(lengths) if lengths else 0.0
+
+    @classmethod
+    def build(cls, chunks: list[str]) -> "BM25Index":
+        postings: dict[str, list[list[int]]] = {}
+        lengths = []
+        for position, chunk in enumerate(chunks):
+            terms = tokenize(chunk)
+            lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                postings.setdefault(term, []).append([position, frequency])
+        return cls(chunks=chunks, postings=postings, lengths=lengths)
+
+    def search(self, query: str, top_k: int) -> list[str]:
+        """Returns the `top_k` chunks scoring highest for the query."""
+        scores: Counter[int] = Counter()
+        count = len(self.chunks)
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for position, frequency in postings:
+                norm = 1 - self.B + self.B * self.lengths[position] / self.average_length
+                scores[position] += (
+                    idf * frequency * (self.K1 + 1) / (frequency + self.K1 * norm)
+                )
+        return [self.chunks[position] for position, _ in scores.most_common(top_k)]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "postings": self.postings,
+            "lengths": self.lengths,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BM25Index":
+        return cls(
+            chunks=data["chunks"], postings=data["postings"], lengths=data["lengths"]
+        )
+
+
+class KeywordIndexStore:
+    """Persists keyword indexes in file storage and caches them per process.
+
+    Configurable via environment variables:
+    - KEYWORD_INDEX_DIR (default: unstract/keyword-index)
+    - KEYWORD_INDEX_CACHE_SIZE (default: 32 documents)
+    """
+
+    DEFAULT_DIR = "unstract/keyword-index"
+
+    _cache: OrderedDict[str, BM25Index] = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_path(doc_id: str) -> str:
+        index_dir = get_env_or_die("KEYWORD_INDEX_DIR", KeywordIndexStore.DEFAULT_DIR)
+        return f"{index_dir.rstrip('/')}/{doc_id}.json"
+
+    @staticmethod
+    def save(fs_instance: FileStorage | None, doc_id: str, index: BM25Index) -> None:
+        """Stores the index of a document, logging instead of raising on failures."""
+        KeywordIndexStore._cache_index(doc_id, index)
+        if fs_instance is None:
+            return
+        path = KeywordIndexStore.get_path(doc_id)
+        try:
+            fs_instance.mkdir(create_parents=True, path=path.rsplit("/", 1)[0])
+            fs_instance.json_dump(path=path, data=index.to_dict())
+        except Exception as e:
+            logger.warning("Unable to store keyword index of %s: %s", doc_id, e)
+
+    @staticmethod
+    def load(fs_instance: FileStorage | None, doc_id: str) -> BM25Index | None:
+        """Returns the index of a document, None if it hasn't been built."""
+        with KeywordIndexStore._lock:
+            index = KeywordIndexStore._cache.get(doc_id)
+            if index is not None:
+                KeywordIndexStore._cache.move_to_end(doc_id)
+                return index
+        if fs_instance is None:
+            return None
+        path = KeywordIndexStore.get_path(doc_id)
+        try:
+            if not fs_instance.exists(path):
+                return None
+            index = BM25Index.from_dict(fs_instance.json_load(path))
+        except Exception as e:
+            logger.warning("Unable to load keyword index of %s: %s", doc_id, e)
+            return None
+        KeywordIndexStore._cache_index(doc_id, index)
+        return index
+
+    @staticmethod
+    def clear_cache() -> None:
+        with KeywordIndexStore._lock:
+            KeywordIndexStore._cache.clear()
+
+    @staticmethod
+    def _cache_index(doc_id: str, index: BM25Index) -> None:
+        size = int(get_env_or_die("KEYWORD_INDEX_CACHE_SIZE", "32"))
+        with KeywordIndexStore._lock:
+            KeywordIndexStore._cache[doc_id] = index
+            KeywordIndexStore._cache.move_to_end(doc_id)
+            while len(KeywordIndexStore._cache) > max(size, 0):
+                KeywordIndexStore._cache.popitem(last=False)
@@ -0,0 +1,102 @@
+"""Process-wide cache of the embeddings of prompts used as retrieval queries.
+
+Prompts of a request are embedded together in a single batched call before
+they run, and the same prompts on later documents reuse the cached vectors
+instead of embedding them again.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+from unstract.prompt_service.utils.env_loader import get_env_or_die
+from unstract.sdk1.vector_db import VectorDB
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings, keyed by embedding config and query.
+
+    Queries are only cached for embeddings whose config hash is known, so
+    that a changed adapter config never reuses stale vectors.
+
+    Configurable via environment variables:
+    - QUERY_EMBEDDING_CACHE_SIZE (default: 1024 queries, 0 disables the cache)
+    """
+
+    _entries: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_size() -> int:
+        return int(get_env_or_die("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+
+    @staticmethod
+    def get(vector_db: VectorDB, query: str) -> list[float]:
+        """Returns the embedding of a query, embedding it on a miss."""
+        config_hash = QueryEmbeddingCache._get_config_hash(vector_db)
+        if config_hash is None:
+            return vector_db.get_query_embedding(query)
+        with QueryEmbeddingCache._lock:
+            embedding = QueryEmbeddingCache._entries.get((config_hash, query))
+            if embedding is not None:
+                QueryEmbeddingCache._entries.move_to_end((config_hash, query))
+                return embedding
+        embedding = vector_db.get_query_embedding(query)
+        QueryEmbeddingCache._store(config_hash, [query], [embedding])
+        return embedding
+
+    @staticmethod
+    def warm(vector_db: VectorDB, queries: list[str]) -> int:
+        """Embeds the queries missing from the cache in a single batch.
+
+        Args:
+            vector_db (VectorDB): Vector DB holding the embedding of the queries
+            queries (list[str]): Queries to embed
+
+        Returns:
+            int: Number of queries embedded
+        """
+        config_hash = QueryEmbeddingCache._get_config_hash(vector_db)
+        if config_hash is None:
+            return 0
+        with QueryEmbeddingCache._lock:
+            misses = list(
+                dict.fromkeys(
+                    query
+                    for query in queries
+                    if (config_hash, query) not in QueryEmbeddingCache._entries
+                )
+            )
+        if not misses:
+            return 0
+        embeddings = vector_db.get_query_embeddings(misses)
+        QueryEmbeddingCache._store(config_hash, misses, embeddings)
+        logger.info(
+            "Embedded %d of %d queries in a single batch", len(misses), len(queries)
+        )
+        return len(misses)
+
+    @staticmethod
+    def clear() -> None:
+        with QueryEmbeddingCache._lock:
+            QueryEmbeddingCache._entries.clear()
+
+    @staticmethod
+    def _get_config_hash(vector_db: VectorDB) -> str | None:
+        if QueryEmbeddingCache.get_size() <= 0:
+            return None
+        return vector_db.get_embedding_config_hash()
+
+    @staticmethod
+    def _store(
+        config_hash: str, queries: list[str], embeddings: list[list[float]]
+    ) -> None:
+        size = QueryEmbeddingCache.get_size()
+        with QueryEmbeddingCache._lock:
+            for query, embedding in zip(queries, embeddings, strict=True):
+                QueryEmbeddingCache._entries[(config_hash, query)] = embedding
+                QueryEmbeddingCache._entries.move_to_end((config_hash, query))
+            while len(QueryEmbeddingCache._entries) > size:
+                QueryEmbeddingCache._entries.popitem(last=False)
@@ -1,6 +1,14 @@
+import logging
+
+from llama_index.core import QueryBundle
+from unstract.prompt_service.core.chunk_cache import ChunkCache
+from unstract.prompt_service.core.query_embedding_cache import QueryEmbeddingCache
+from unstract.sdk1.file_storage import FileStorage
 from unstract.sdk1.llm import LLM
 from unstract.sdk1.vector_db import VectorDB
 
+logger = logging.getLogger(__name__)
+
 
 class BaseRetriever:
     def __init__(
@@ -10,6 +18,7 @@ class BaseRetriever:
         doc_id: str,
         top_k: int,
         llm: LLM | None = None,
+        fs_instance: FileStorage | None = None,
     ):
         """Initialize the Retrieval class.
 
@@ -18,13 +27,47 @@ class BaseRetriever:
             prompt (str): The query prompt.
             doc_id (str): Document identifier for query context.
             top_k (int): Number of top results to retrieve.
+            fs_instance (FileStorage | None): File storage holding the
+                persisted indexes of the document, e.g. its keyword index.
         """
         self.vector_db = vector_db
         self.prompt = prompt
         self.doc_id = doc_id
         self.top_k = top_k
         self.llm = llm if llm else None
+        self.fs_instance = fs_instance
 
     @staticmethod
     def retrieve() -> set[str]:
         return set()
+
+    def rank_cached_chunks(self, top_k: int) -> list[tuple[str, float]] | None:
+        """Ranks the chunks of the document locally, using the `ChunkCache`.
+
+        Returns:
+            list[tuple[str, float]] | None: Chunks most similar to the prompt
+                and their scores, None if the vector DB has to be queried
+                instead
+        """
+        if not ChunkCache.is_enabled():
+            return None
+        try:
+            chunks = ChunkCache.get(self.vector_db, self.doc_id)
+            if not chunks.can_rank():
+                return None
+            query_embedding = QueryEmbeddingCache.get(self.vector_db, self.prompt)
+        except Exception as e:
+            logger.warning(f"Unable to rank cached chunks of {self.doc_id}: {e}")
+            return None
+        return chunks.rank(query_embedding, top_k)
+
+    def get_query_bundle(self) -> QueryBundle:
+        """Returns the prompt along with its embedding from the `QueryEmbeddingCache`.
+
+        Vector retrievers query the vector DB with the given embedding instead
+        of embedding the prompt again.
+        """
+        return QueryBundle(
+            query_str=self.prompt,
+            embedding=QueryEmbeddingCache.get(self.vector_db, self.prompt),
+        )
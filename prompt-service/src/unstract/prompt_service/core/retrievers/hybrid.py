@@ -0,0 +1,105 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from llama_index.core import VectorStoreIndex
+from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
+from unstract.prompt_service.core.retrievers.keyword_table import KeywordTableRetriever
+from unstract.prompt_service.exceptions import RetrievalError
+
+logger = logging.getLogger(__name__)
+
+
+class HybridRetriever(KeywordTableRetriever):
+    """Hybrid retrieval fusing vector and BM25 keyword search.
+
+    Both searches run concurrently and their rankings are combined with
+    reciprocal rank fusion, without LLM generated query variations.
+    """
+
+    # Constant of reciprocal rank fusion, damping the weight of top ranks
+    RRF_K = 60
+    # Each search ranks this many times `top_k` candidates for the fusion
+    CANDIDATE_FACTOR = 2
+
+    def retrieve(self) -> set[str]:
+        """Retrieve text chunks ranking best across vector and keyword search.
+
+        Returns:
+            set[str]: A set of text chunks retrieved from the database.
+        """
+        try:
+            logger.info(f"Retrieving chunks for {self.doc_id} using hybrid search.")
+            candidates = self.top_k * self.CANDIDATE_FACTOR
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                vector_future = executor.submit(self._vector_search, candidates)
+                keyword_future = executor.submit(self._keyword_search, candidates)
+                rankings = [vector_future.result(), keyword_future.result()]
+
+            chunks = set(self.fuse(rankings, self.top_k, self.RRF_K))
+            logger.info(f"Successfully retrieved {len(chunks)} chunks using hybrid.")
+            return chunks
+
+        except (ValueError, AttributeError, KeyError, ImportError) as e:
+            logger.error(f"Error during hybrid retrieval for {self.doc_id}: {e}")
+            raise RetrievalError(str(e)) from e
+        except Exception as e:
+            logger.error(
+                f"Unexpected error during hybrid retrieval for {self.doc_id}: {e}"
+            )
+            raise RetrievalError(f"Unexpected error: {str(e)}") from e
+
+    @staticmethod
+    def fuse(rankings: list[list[str]], top_k: int, rrf_k: int = RRF_K) -> list[str]:
+        """Combines rankings of chunks with reciprocal rank fusion.
+
+        Each chunk scores the sum of ``1 / (rrf_k + rank)`` over the rankings
+        holding it. Ties keep the order in which chunks were first ranked.
+
+        Args:
+            rankings (list[list[str]]): Chunks of each search, best first
+            top_k (int): Number of chunks to return
+            rrf_k (int): Constant damping the weight of top ranks
+
+        Returns:
+            list[str]: The `top_k` chunks scoring highest
+        """
+        positions: dict[str, int] = {}
+        for ranking in rankings:
+            for chunk in ranking:
+                positions.setdefault(chunk, len(positions))
+        if not positions:
+            return []
+        # Ranks of the chunks in each ranking, 0 for chunks it doesn't hold
+        ranks = np.zeros((len(rankings), len(positions)))
+        for row, ranking in enumerate(rankings):
+            for rank, chunk in enumerate(ranking, start=1):
+                if not ranks[row, positions[chunk]]:
+                    ranks[row, positions[chunk]] = rank
+        scores = np.where(ranks > 0, 1.0 / (rrf_k + ranks), 0.0).sum(axis=0)
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        chunks = list(positions)
+        return [chunks[position] for position in order]
+
+    def _vector_search(self, top_k: int) -> list[str]:
+        ranked = self.rank_cached_chunks(top_k)
+        if ranked is not None:
+            return [chunk for chunk, score in ranked if score > 0]
+
+        vector_store_index: VectorStoreIndex = self.vector_db.get_vector_store_index()
+        retriever = vector_store_index.as_retriever(
+            similarity_top_k=top_k,
+            filters=MetadataFilters(
+                filters=[
+                    ExactMatchFilter(key="doc_id", value=self.doc_id),
+                ],
+            ),
+        )
+        nodes = retriever.retrieve(self.get_query_bundle())
+        return [node.get_content() for node in nodes if node.score > 0]
+
+    def _keyword_search(self, top_k: int) -> list[str]:
+        keyword_index = self.get_keyword_index()
+        if keyword_index is None:
+            return []
+        return keyword_index.search(self.prompt, top_k)
@@ -1,9 +1,7 @@
 import logging
 
-from llama_index.core import VectorStoreIndex
-from llama_index.core.indices.keyword_table import KeywordTableIndex
-from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
-
+from unstract.prompt_service.core.chunk_cache import ChunkCache
+from unstract.prompt_service.core.keyword_index import BM25Index, KeywordIndexStore
 from unstract.prompt_service.core.retrievers.base_retriever import BaseRetriever
 from unstract.prompt_service.exceptions import RetrievalError
 
@@ -11,61 +9,27 @@ logger = logging.getLogger(__name__)
 
 
 class KeywordTableRetriever(BaseRetriever):
-    """Keyword table retrieval using LlamaIndex's native KeywordTableIndex."""
+    """Keyword retrieval scoring chunks with the BM25 index of the document."""
 
     def retrieve(self) -> set[str]:
-        """Retrieve text chunks using LlamaIndex's native KeywordTableIndex.
+        """Retrieve text chunks matching the keywords of the prompt.
+
+        The BM25 index built when the document was indexed is used. Documents
+        indexed without one get it built from their nodes in the vector DB,
+        stored only if all of their nodes could be fetched.
 
         Returns:
             set[str]: A set of text chunks retrieved from the database.
         """
         try:
-            logger.info(
-                f"Retrieving chunks for {self.doc_id} using LlamaIndex KeywordTableIndex."
-            )
-
-            # Get documents from vector index for keyword indexing
-            vector_store_index: VectorStoreIndex = self.vector_db.get_vector_store_index()
-
-            # Get all nodes for the document
-            all_retriever = vector_store_index.as_retriever(
-                similarity_top_k=1000,  # Get all nodes
-                filters=MetadataFilters(
-                    filters=[
-                        ExactMatchFilter(key="doc_id", value=self.doc_id),
-                    ],
-                ),
-            )
-
-            # Retrieve all nodes to build keyword index
-            all_nodes = all_retriever.retrieve(" ")
-
-            if not all_nodes:
-                logger.warning(f"No nodes found for doc_id: {self.doc_id}")
+            logger.info(f"Retrieving chunks for {self.doc_id} using the BM25 index.")
+            keyword_index = self.get_keyword_index()
+            if keyword_index is None:
                 return set()
 
-            # Create KeywordTableIndex from nodes using our provided LLM
-            keyword_index = KeywordTableIndex(
-                nodes=[node.node for node in all_nodes],
-                show_progress=True,
-                llm=self.llm,  # Use the provided LLM instead of defaulting to OpenAI
-            )
-
-            # Create retriever from keyword index
-            keyword_retriever = keyword_index.as_retriever(
-                similarity_top_k=self.top_k,
-            )
-
-            # Retrieve nodes using keyword matching
-            nodes = keyword_retriever.retrieve(self.prompt)
-
-            # Extract unique text chunks
-            chunks: set[str] = set()
-            for node in nodes:
-                chunks.add(node.get_content())
-
+            chunks = set(keyword_index.search(self.prompt, self.top_k))
             logger.info(
-                f"Successfully retrieved {len(chunks)} chunks using KeywordTableIndex."
+                f"Successfully retrieved {len(chunks)} chunks using the BM25 index."
             )
             return chunks
 
@@ -77,3 +41,29 @@ class KeywordTableRetriever(BaseRetriever):
                 f"Unexpected error during keyword retrieval for {self.doc_id}: {e}"
             )
             raise RetrievalError(f"Unexpected error: {str(e)}") from e
+
+    def get_keyword_index(self) -> BM25Index | None:
+        """Returns the BM25 index of the document, None if it has no nodes."""
+        keyword_index = KeywordIndexStore.load(self.fs_instance, self.doc_id)
+        if keyword_index is None:
+            keyword_index = self._build_keyword_index()
+        return keyword_index
+
+    def _build_keyword_index(self) -> BM25Index | None:
+        """Builds and stores the BM25 index from the nodes in the vector DB."""
+        logger.info(f"No keyword index found for {self.doc_id}, building it.")
+        chunks = ChunkCache.get(self.vector_db, self.doc_id)
+        if not chunks.texts:
+            logger.warning(f"No nodes found for doc_id: {self.doc_id}")
+            return None
+
+        keyword_index = BM25Index.build(chunks.texts)
+        if not chunks.complete:
+            # Not stored, so that it's rebuilt once all the nodes can be listed
+            logger.warning(
+                f"Keyword index of {self.doc_id} built from its first "
+                f"{len(chunks.texts)} nodes only"
+            )
+            return keyword_index
+        KeywordIndexStore.save(self.fs_instance, self.doc_id, keyword_index)
+        return keyword_index
@@ -27,6 +27,10 @@ class SimpleRetriever(BaseRetriever):
         return context
 
     def _simple_retrieval(self):
+        ranked = self.rank_cached_chunks(self.top_k)
+        if ranked is not None:
+            return {chunk for chunk, score in ranked if score > 0}
+
         vector_query_engine: VectorStoreIndex = self.vector_db.get_vector_store_index()
         retriever = vector_query_engine.as_retriever(
             similarity_top_k=self.top_k,
@@ -36,7 +40,7 @@ class SimpleRetriever(BaseRetriever):
                 ],
             ),
         )
-        nodes = retriever.retrieve(self.prompt)
+        nodes = retriever.retrieve(self.get_query_bundle())
         context: set[str] = set()
         for node in nodes:
             # May have to fine-tune this value for node score or keep it
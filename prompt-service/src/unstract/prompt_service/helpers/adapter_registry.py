@@ -0,0 +1,124 @@
+import copy
+import json
+import threading
+from collections.abc import Callable
+from typing import Any, Self
+
+from flask import current_app as app
+from unstract.sdk1.embedding import EmbeddingCompat
+from unstract.sdk1.llm import LLM
+from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.vector_db import VectorDB
+
+
+class AdapterRegistry:
+    """Request-scoped registry of adapter instances.
+
+    Most prompts of a tool share the same adapter instances. Constructing an
+    adapter fetches its config from platform-service and sets up its clients.
+    The registry builds each adapter once per (adapter_instance_id, usage
+    kwargs) and hands it out to every prompt of the request. Vector DB clients
+    are closed by `close()`.
+    """
+
+    def __init__(self, tool: BaseTool) -> None:
+        self._tool = tool
+        self._adapters: dict[tuple[str, ...], Any] = {}
+        self._key_locks: dict[tuple[str, ...], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_llm(
+        self,
+        adapter_instance_id: str,
+        usage_kwargs: dict[str, Any],
+        capture_metrics: bool = True,
+    ) -> LLM:
+        """Returns an LLM for the adapter instance.
+
+        Metrics are captured per prompt, so every call gets its own shallow copy
+        of the shared LLM with empty metrics.
+        """
+        llm: LLM = self._get_or_create(
+            ("llm", adapter_instance_id, self._freeze(usage_kwargs)),
+            lambda: LLM(
+                adapter_instance_id=adapter_instance_id,
+                tool=self._tool,
+                usage_kwargs=usage_kwargs,
+                capture_metrics=capture_metrics,
+            ),
+        )
+        llm = copy.copy(llm)
+        llm._metrics = {}
+        return llm
+
+    def get_embedding(
+        self, adapter_instance_id: str, usage_kwargs: dict[str, Any]
+    ) -> EmbeddingCompat:
+        return self._get_or_create(
+            ("embedding", adapter_instance_id, self._freeze(usage_kwargs)),
+            lambda: EmbeddingCompat(
+                adapter_instance_id=adapter_instance_id,
+                tool=self._tool,
+                kwargs={**usage_kwargs},
+            ),
+        )
+
+    def get_vector_db(
+        self,
+        adapter_instance_id: str,
+        embedding_instance_id: str,
+        usage_kwargs: dict[str, Any],
+    ) -> VectorDB:
+        return self._get_or_create(
+            (
+                "vector_db",
+                adapter_instance_id,
+                embedding_instance_id,
+                self._freeze(usage_kwargs),
+            ),
+            lambda: VectorDB(
+                tool=self._tool,
+                adapter_instance_id=adapter_instance_id,
+                embedding=self.get_embedding(embedding_instance_id, usage_kwargs),
+            ),
+        )
+
+    def close(self) -> None:
+        """Closes the vector DB clients created during the request."""
+        with self._lock:
+            adapters = list(self._adapters.items())
+            self._adapters.clear()
+            self._key_locks.clear()
+        for key, adapter in adapters:
+            if key[0] != "vector_db":
+                continue
+            try:
+                adapter.close()
+            except Exception as e:
+                app.logger.warning(f"Failed to close vector DB {key[1]}: {e}")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_or_create(self, key: tuple[str, ...], factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._adapters:
+                return self._adapters[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Builds distinct adapters in parallel while concurrent prompts asking
+        # for the same adapter wait for the first construction to finish.
+        with key_lock:
+            with self._lock:
+                if key in self._adapters:
+                    return self._adapters[key]
+            adapter = factory()
+            with self._lock:
+                self._adapters[key] = adapter
+            return adapter
+
+    @staticmethod
+    def _freeze(usage_kwargs: dict[str, Any]) -> str:
+        return json.dumps(usage_kwargs, sort_keys=True, default=str)
@@ -10,6 +10,7 @@ from unstract.prompt_service.extensions import db, db_context
 from unstract.prompt_service.utils.db_utils import DBUtils
 from unstract.prompt_service.utils.env_loader import get_env_or_die
 from unstract.sdk1.audit import Audit
+from unstract.sdk1.utils.usage_emitter import UsageEmitter
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,8 @@ logger = logging.getLogger(__name__)
 class UsageHelper:
     @staticmethod
     def query_usage_metadata(token: str, metadata: dict[str, Any]) -> dict[str, Any]:
+        # Usage queued in the background has to be stored before it's read back
+        UsageEmitter.flush(timeout=UsageEmitter.get_flush_timeout())
         DB_SCHEMA = get_env_or_die("DB_SCHEMA", "unstract")
         organization_uid, org_id = DBUtils.get_organization_from_bearer_token(token)
         run_id: str = metadata["run_id"]
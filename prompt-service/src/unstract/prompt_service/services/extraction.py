@@ -1,24 +1,26 @@
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from unstract.prompt_service.constants import ExecutionSource
-
-logger = logging.getLogger(__name__)
 from unstract.prompt_service.constants import IndexingConstants as IKeys
 from unstract.prompt_service.exceptions import ExtractionError
 from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.sdk1.adapters.exceptions import AdapterError
 from unstract.sdk1.adapters.x2text.constants import X2TextConstants
-from unstract.sdk1.exceptions import SdkError, X2TextError
 from unstract.sdk1.adapters.x2text.llm_whisperer.src import LLMWhisperer
 from unstract.sdk1.adapters.x2text.llm_whisperer_v2.src import LLMWhispererV2
+from unstract.sdk1.exceptions import SdkError, X2TextError
 from unstract.sdk1.ocr import OCR
 from unstract.sdk1.utils.common import log_elapsed
+from unstract.sdk1.utils.extraction_cache import ExtractionCache
 from unstract.sdk1.utils.tool import ToolUtils
 from unstract.sdk1.x2txt import TextExtractionResult, X2Text
 
+logger = logging.getLogger(__name__)
+
 MIN_EXTRACTED_TEXT_LENGTH = 50
 
 EXTRACTION_HINT_SCANNED_PDF = (
@@ -46,33 +48,29 @@ class ExtractionService:
         execution_run_data_folder: str | None = None,
     ) -> str:
         extracted_text = ""
-        try:
-            util = PromptServiceBaseTool(platform_key=platform_key)
-            x2text = X2Text(
-                tool=util,
-                adapter_instance_id=x2text_instance_id,
-                usage_kwargs=usage_kwargs,
-            )
-            fs = FileUtils.get_fs_instance(execution_source=execution_source)
-        except (X2TextError, ValueError) as e:
-            msg = str(e) if str(e) else "Text extractor or storage config error."
-            raise ExtractionError(msg, code=400) from e
-        except Exception as e:
-            msg = str(e) if str(e) else "Failed to initialize extractor."
-            raise ExtractionError(msg, code=500) from e
+        util, x2text, fs = ExtractionService._get_extractor(
+            x2text_instance_id=x2text_instance_id,
+            platform_key=platform_key,
+            usage_kwargs=usage_kwargs,
+            execution_source=execution_source,
+        )
 
         try:
-            if enable_highlight and (
+            enable_highlight = enable_highlight and (
                 isinstance(x2text.x2text_instance, LLMWhisperer)
                 or isinstance(x2text.x2text_instance, LLMWhispererV2)
-            ):
-                process_response: TextExtractionResult = x2text.process(
-                    input_file_path=file_path,
-                    output_file_path=output_file_path,
-                    enable_highlight=enable_highlight,
-                    tags=tags,
-                    fs=fs,
-                )
+            )
+            # Identical files are extracted once per organisation and config
+            process_response: TextExtractionResult = ExtractionCache.process(
+                x2text=x2text,
+                file_path=file_path,
+                output_file_path=output_file_path,
+                enable_highlight=enable_highlight,
+                fs=fs,
+                scope=platform_key,
+                tags=tags,
+            )
+            if enable_highlight:
                 ExtractionService.update_exec_metadata(
                     fs,
                     execution_source,
@@ -80,13 +78,6 @@ class ExtractionService:
                     execution_run_data_folder,
                     process_response,
                 )
-            else:
-                process_response: TextExtractionResult = x2text.process(
-                    input_file_path=file_path,
-                    output_file_path=output_file_path,
-                    tags=tags,
-                    fs=fs,
-                )
             extracted_text = process_response.extracted_text
 
             if (
@@ -108,10 +99,79 @@ class ExtractionService:
                 )
 
             return extracted_text
-        except X2TextError as e:
-            msg = str(e) if str(e) else "Text extractor error."
+        except Exception as e:
+            raise ExtractionService._get_extraction_error(e, x2text, file_path) from e
+
+    @staticmethod
+    def extract_pages(
+        x2text_instance_id: str,
+        file_path: str,
+        platform_key: str,
+        output_file_path: str | None = None,
+        usage_kwargs: dict[Any, Any] | None = None,
+        tags: list[str] | None = None,
+        execution_source: str | None = None,
+    ) -> Iterator[str]:
+        """Extracts text from a document, yielding it page by page.
+
+        Pages are yielded as the adapter extracts them, so that they can be
+        indexed before the extraction finishes, see `X2Text.process_pages`.
+        Highlighting needs the metadata of the whole extraction and the OCR
+        fallback the whole text, hence neither is supported.
+        """
+        _, x2text, fs = ExtractionService._get_extractor(
+            x2text_instance_id=x2text_instance_id,
+            platform_key=platform_key,
+            usage_kwargs=usage_kwargs or {},
+            execution_source=execution_source,
+        )
+        try:
+            for page in ExtractionCache.process_pages(
+                x2text=x2text,
+                file_path=file_path,
+                output_file_path=output_file_path,
+                enable_highlight=False,
+                fs=fs,
+                scope=platform_key,
+                tags=tags,
+            ):
+                yield page.text
+        except Exception as e:
+            raise ExtractionService._get_extraction_error(e, x2text, file_path) from e
+
+    @staticmethod
+    def _get_extractor(
+        x2text_instance_id: str,
+        platform_key: str,
+        usage_kwargs: dict[Any, Any],
+        execution_source: str | None,
+    ) -> tuple[PromptServiceBaseTool, X2Text, Any]:
+        try:
+            util = PromptServiceBaseTool(platform_key=platform_key)
+            x2text = X2Text(
+                tool=util,
+                adapter_instance_id=x2text_instance_id,
+                usage_kwargs=usage_kwargs,
+            )
+            fs = FileUtils.get_fs_instance(execution_source=execution_source)
+        except (X2TextError, ValueError) as e:
+            msg = str(e) if str(e) else "Text extractor or storage config error."
             raise ExtractionError(msg, code=400) from e
-        except AdapterError as e:
+        except Exception as e:
+            msg = str(e) if str(e) else "Failed to initialize extractor."
+            raise ExtractionError(msg, code=500) from e
+        return util, x2text, fs
+
+    @staticmethod
+    def _get_extraction_error(
+        e: Exception, x2text: X2Text, file_path: str
+    ) -> ExtractionError:
+        if isinstance(e, ExtractionError):
+            return e
+        if isinstance(e, X2TextError):
+            msg = str(e) if str(e) else "Text extractor error."
+            return ExtractionError(msg, code=400)
+        if isinstance(e, AdapterError):
             adapter_name = x2text.x2text_instance.get_name()
             msg = f"Error from text extractor '{adapter_name}'. {str(e)}"
             if isinstance(x2text.x2text_instance, LLMWhispererV2):
@@ -126,13 +186,12 @@ class ExtractionService:
                     exc_info=True,
                 )
             code = e.status_code if e.status_code != -1 else 500
-            raise ExtractionError(msg, code=code) from e
-        except (FileNotFoundError, OSError) as e:
+            return ExtractionError(msg, code=code)
+        if isinstance(e, OSError):
             msg = f"File not found or not readable: {file_path}. {e}"
-            raise ExtractionError(msg, code=404) from e
-        except Exception as e:
-            msg = str(e) if str(e) else "Extraction failed."
-            raise ExtractionError(msg, code=500) from e
+            return ExtractionError(msg, code=404)
+        msg = str(e) if str(e) else "Extraction failed."
+        return ExtractionError(msg, code=500)
 
     @staticmethod
     def _ocr_fallback(
@@ -156,14 +215,10 @@ class ExtractionService:
             return ocr_text
         except (SdkError, AdapterError) as e:
             logger.warning("OCR fallback failed: %s", e)
-            raise ExtractionError(
-                f"OCR fallback failed: {e}", code=500
-            ) from e
+            raise ExtractionError(f"OCR fallback failed: {e}", code=500) from e
         except Exception as e:
             logger.warning("OCR fallback unexpected error: %s", e)
-            raise ExtractionError(
-                f"OCR fallback failed: {e}", code=500
-            ) from e
+            raise ExtractionError(f"OCR fallback failed: {e}", code=500) from e
 
     @staticmethod
     def get_extraction_hint(
@@ -7,8 +7,9 @@ from unstract.prompt_service.dto import (
     InstanceIdentifiers,
     ProcessingOptions,
 )
-from unstract.prompt_service.exceptions import APIError
+from unstract.prompt_service.exceptions import APIError, ExtractionError
 from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
+from unstract.prompt_service.services.extraction import ExtractionService
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.sdk1.embedding import EmbeddingCompat
 from unstract.sdk1.utils.indexing import IndexingUtils
@@ -27,8 +28,17 @@ class IndexingService:
         processing_options: ProcessingOptions,
         platform_key: str,
         run_id: str,
-        extracted_text: str,
+        extracted_text: str | None,
+        input_file_path: str | None = None,
+        output_file_path: str | None = None,
     ) -> str:
+        """Indexes a document, returning its doc_id.
+
+        Without `extracted_text`, the document at `input_file_path` is
+        extracted page by page while it's indexed, and its text is written
+        to `output_file_path`. Pages are only extracted when the document
+        needs to be indexed.
+        """
         try:
             fs_instance = FileUtils.get_fs_instance(execution_source=execution_source)
             util = PromptServiceBaseTool(platform_key=platform_key)
@@ -77,15 +87,45 @@ class IndexingService:
                 embedding=embedding,
                 vector_db=vector_db,
             )
+            if doc_id_found and not processing_options.reindex:
+                # The doc_id is deterministic, so complete indexes are reused as is
+                # while the nodes of an interrupted run are replaced. Without
+                # markers an index can't be verified and is replaced as well.
+                is_complete = vector_db.is_document_complete(doc_id)
+                if is_complete:
+                    util.stream_log(f"Reusing complete index of {doc_id}")
+                    return doc_id
+                if is_complete is None:
+                    util.stream_log(
+                        f"Completeness of the index of {doc_id} is unknown, re-indexing"
+                    )
+                else:
+                    util.stream_log(f"Indexing of {doc_id} is incomplete, re-indexing")
+                processing_options.reindex = True
+
+            text_to_index = extracted_text or ""
+            if not extracted_text and input_file_path:
+                text_to_index = ExtractionService.extract_pages(
+                    x2text_instance_id=instance_identifiers.x2text_instance_id,
+                    file_path=input_file_path,
+                    platform_key=platform_key,
+                    output_file_path=output_file_path,
+                    usage_kwargs=processing_options.usage_kwargs,
+                    tags=instance_identifiers.tags,
+                    execution_source=execution_source,
+                )
 
             # Index and return doc_id
             index.perform_indexing(
                 vector_db=vector_db,
                 doc_id=doc_id,
-                extracted_text=extracted_text,
+                extracted_text=text_to_index,
                 doc_id_found=doc_id_found,
+                fs=fs_instance,
             )
             return doc_id
+        except ExtractionError:
+            raise
         except Exception as e:
             status_code = getattr(e, "status_code", 500)
             raise APIError(f"Error while indexing: {str(e)}", code=status_code) from e
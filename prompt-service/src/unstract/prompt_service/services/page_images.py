@@ -0,0 +1,279 @@
+"""Rendering of PDF pages to images, cached per document.
+
+Pages are rendered with PyMuPDF and cached as PNGs keyed by the SHA-256 of
+the document, the DPI and the page number, so that vision prompts on the same
+document (and re-runs of them) render every page only once.
+"""
+
+import base64
+import hashlib
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from unstract.core.flask.exceptions import APIError
+from unstract.prompt_service.utils.env_loader import get_env_or_die
+
+logger = logging.getLogger(__name__)
+
+
+def _import_fitz() -> Any:
+    try:
+        import fitz  # PyMuPDF
+    except ImportError as e:
+        raise APIError(
+            message="Vision table extraction requires pymupdf. Install with: pip install pymupdf",
+            code=500,
+        ) from e
+    return fitz
+
+
+def _render_pages(file_path: str, page_numbers: list[int], dpi: int) -> list[bytes]:
+    """Renders pages of a PDF to PNG bytes, in the order of `page_numbers`."""
+    fitz = _import_fitz()
+    doc = fitz.open(file_path)
+    try:
+        return [
+            doc[page_number].get_pixmap(dpi=dpi, alpha=False).tobytes("png")
+            for page_number in page_numbers
+        ]
+    finally:
+        doc.close()
+
+
+class PageImageCache:
+    """Cache of rendered page images.
+
+    The ``local`` backend is bounded: documents unused for longer than the
+    TTL, and the least recently used documents beyond the maximum size, are
+    evicted whenever pages are added.
+
+    Configurable via environment variables:
+    - VISION_PAGE_CACHE_BACKEND: ``local`` (disk of this host), ``storage``
+      (file storage of the execution, e.g. permanent storage in Prompt
+      Studio) or ``none`` (default: local)
+    - VISION_PAGE_CACHE_DIR (default: unstract-page-images in the temp
+      directory for ``local``, unstract/page-images for ``storage``)
+    - VISION_PAGE_CACHE_MAX_SIZE_MB (default: 512 MB, ``local`` only)
+    - VISION_PAGE_CACHE_TTL (default: 86400s, ``local`` only)
+    """
+
+    LOCAL = "local"
+    STORAGE = "storage"
+    DEFAULT_STORAGE_DIR = "unstract/page-images"
+
+    @staticmethod
+    def get_backend() -> str:
+        return get_env_or_die("VISION_PAGE_CACHE_BACKEND", PageImageCache.LOCAL).lower()
+
+    @staticmethod
+    def _get_dir(backend: str) -> str:
+        if backend == PageImageCache.LOCAL:
+            default_dir = str(Path(tempfile.gettempdir()) / "unstract-page-images")
+        else:
+            default_dir = PageImageCache.DEFAULT_STORAGE_DIR
+        return get_env_or_die("VISION_PAGE_CACHE_DIR", default_dir).rstrip("/")
+
+    @staticmethod
+    def _get_path(file_hash: str, dpi: int, page_number: int, backend: str) -> str:
+        cache_dir = PageImageCache._get_dir(backend)
+        return f"{cache_dir}/{file_hash}/{dpi}/{page_number}.png"
+
+    @staticmethod
+    def get(fs_instance: Any, file_hash: str, dpi: int, page_number: int) -> bytes | None:
+        """Returns the PNG of a page, None if it isn't cached."""
+        backend = PageImageCache.get_backend()
+        path = PageImageCache._get_path(file_hash, dpi, page_number, backend)
+        try:
+            if backend == PageImageCache.LOCAL:
+                return Path(path).read_bytes()
+            if backend == PageImageCache.STORAGE and fs_instance is not None:
+                if fs_instance.exists(path):
+                    return fs_instance.read(path=path, mode="rb")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Unable to read cached page image %s: %s", path, e)
+        return None
+
+    @staticmethod
+    def set(
+        fs_instance: Any, file_hash: str, dpi: int, page_number: int, image: bytes
+    ) -> None:
+        """Stores the PNG of a page, logging instead of raising on failures."""
+        backend = PageImageCache.get_backend()
+        path = PageImageCache._get_path(file_hash, dpi, page_number, backend)
+        try:
+            if backend == PageImageCache.LOCAL:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                # Written to a temp file first, so readers never see partial files
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                Path(temp_path).write_bytes(image)
+                os.replace(temp_path, path)
+            elif backend == PageImageCache.STORAGE and fs_instance is not None:
+                fs_instance.write(path=path, mode="wb", data=image)
+        except Exception as e:
+            logger.warning("Unable to cache page image %s: %s", path, e)
+
+    @staticmethod
+    def touch(file_hash: str, evict: bool = False) -> None:
+        """Marks the pages of a document as used, on the ``local`` backend.
+
+        Args:
+            file_hash (str): SHA-256 of the document
+            evict (bool): Whether to evict other documents, after pages of
+                this one were added
+        """
+        if PageImageCache.get_backend() != PageImageCache.LOCAL:
+            return
+        cache_dir = Path(PageImageCache._get_dir(PageImageCache.LOCAL))
+        try:
+            os.utime(cache_dir / file_hash)
+            if evict:
+                PageImageCache._evict(cache_dir, keep=file_hash)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Unable to evict cached page images: %s", e)
+
+    @staticmethod
+    def _evict(cache_dir: Path, keep: str) -> None:
+        """Removes expired documents, then the least recently used ones."""
+        max_size = int(get_env_or_die("VISION_PAGE_CACHE_MAX_SIZE_MB", "512")) << 20
+        ttl = int(get_env_or_die("VISION_PAGE_CACHE_TTL", "86400"))
+        documents = []
+        for document_dir in cache_dir.iterdir():
+            if document_dir.name == keep or not document_dir.is_dir():
+                continue
+            size = PageImageCache._get_size(document_dir)
+            documents.append((document_dir.stat().st_mtime, size, document_dir))
+        total_size = sum(size for _, size, _ in documents)
+        total_size += PageImageCache._get_size(cache_dir / keep)
+        expiry = time.time() - ttl
+        # Least recently used first
+        for used_at, size, document_dir in sorted(documents):
+            if used_at >= expiry and total_size <= max_size:
+                break
+            shutil.rmtree(document_dir, ignore_errors=True)
+            total_size -= size
+
+    @staticmethod
+    def _get_size(document_dir: Path) -> int:
+        return sum(path.stat().st_size for path in document_dir.rglob("*.png"))
+
+
+class PageImageService:
+    """Renders the pages of a PDF to base64 data URLs, reusing cached pages.
+
+    Pages missing from the `PageImageCache` are rendered by a process pool
+    when there are many of them.
+
+    Configurable via environment variables:
+    - VISION_RENDER_DPI (default: 150)
+    - VISION_RENDER_WORKERS (default: 1, rendering pages without a pool)
+    - VISION_RENDER_PARALLEL_MIN_PAGES (default: 8 pages)
+    """
+
+    # Pages of the same document aren't rendered by two prompts at once.
+    # Documents share a fixed set of locks, keeping memory bounded
+    _locks = [threading.Lock() for _ in range(64)]
+
+    @staticmethod
+    def get_dpi() -> int:
+        return int(get_env_or_die("VISION_RENDER_DPI", "150"))
+
+    @staticmethod
+    def get_page_images(file_bytes: bytes, fs_instance: Any = None) -> list[bytes]:
+        """Returns the PNG of every page of a PDF, in page order.
+
+        Args:
+            file_bytes (bytes): Contents of the PDF
+            fs_instance (Any): File storage of the execution, used by the
+                ``storage`` cache backend
+
+        Returns:
+            list[bytes]: PNG of each page
+        """
+        fitz = _import_fitz()
+        doc = fitz.open(stream=file_bytes, filetype="pdf")
+        try:
+            page_count = len(doc)
+        finally:
+            doc.close()
+        if not page_count:
+            return []
+
+        dpi = PageImageService.get_dpi()
+        file_hash = hashlib.sha256(file_bytes).hexdigest()
+        caching = PageImageCache.get_backend() in (
+            PageImageCache.LOCAL,
+            PageImageCache.STORAGE,
+        )
+        locks = PageImageService._locks
+        with locks[int(file_hash[:8], 16) % len(locks)]:
+            images: list[bytes | None] = [None] * page_count
+            if caching:
+                images = [
+                    PageImageCache.get(fs_instance, file_hash, dpi, page_number)
+                    for page_number in range(page_count)
+                ]
+            missing = [number for number, image in enumerate(images) if image is None]
+            if missing:
+                logger.info(
+                    "Rendering %d of %d pages at %d DPI", len(missing), page_count, dpi
+                )
+                rendered = PageImageService._render(file_bytes, missing, dpi)
+                for page_number, image in zip(missing, rendered, strict=True):
+                    images[page_number] = image
+                    if caching:
+                        PageImageCache.set(
+                            fs_instance, file_hash, dpi, page_number, image
+                        )
+            if caching:
+                PageImageCache.touch(file_hash, evict=bool(missing))
+        return images
+
+    @staticmethod
+    def get_base64_images(file_bytes: bytes, fs_instance: Any = None) -> list[str]:
+        """Returns a base64 PNG data URL for every page of a PDF."""
+        return [
+            f"data:image/png;base64,{base64.standard_b64encode(image).decode('ascii')}"
+            for image in PageImageService.get_page_images(file_bytes, fs_instance)
+        ]
+
+    @staticmethod
+    def _render(file_bytes: bytes, page_numbers: list[int], dpi: int) -> list[bytes]:
+        workers = int(get_env_or_die("VISION_RENDER_WORKERS", "1"))
+        min_pages = int(get_env_or_die("VISION_RENDER_PARALLEL_MIN_PAGES", "8"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = str(Path(temp_dir) / "document.pdf")
+            Path(file_path).write_bytes(file_bytes)
+            # Daemonic processes, e.g. pool workers, can't have child processes
+            if (
+                workers <= 1
+                or len(page_numbers) < min_pages
+                or multiprocessing.current_process().daemon
+            ):
+                return _render_pages(file_path, page_numbers, dpi)
+
+            workers = min(workers, len(page_numbers))
+            chunks = [page_numbers[index::workers] for index in range(workers)]
+            # Forking a process with running threads isn't safe, hence spawn
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                rendered = executor.map(
+                    _render_pages, repeat(file_path), chunks, repeat(dpi)
+                )
+                images = {}
+                for chunk, chunk_images in zip(chunks, rendered, strict=True):
+                    images.update(zip(chunk, chunk_images, strict=True))
+        return [images[page_number] for page_number in page_numbers]
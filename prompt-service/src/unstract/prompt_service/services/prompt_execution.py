@@ -0,0 +1,193 @@
+import contextvars
+import re
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from flask import current_app as app
+from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
+from unstract.prompt_service.constants import VariableConstants, VariableType
+from unstract.prompt_service.helpers.variable_replacement import (
+    VariableReplacementHelper,
+)
+from unstract.prompt_service.utils.env_loader import get_env_or_die
+
+
+class PromptExecutionService:
+    """Schedules the prompts of a tool, optionally running them concurrently.
+
+    Prompts reference the output of other prompts through ``%name%`` and
+    ``{{name}}`` variables. Those references form a dependency graph: prompts
+    without pending dependencies run on a bounded thread pool and dependent
+    prompts are started as soon as all of their inputs are available in the
+    structured output.
+    """
+
+    @staticmethod
+    def get_max_workers(tool_settings: dict[str, Any]) -> int:
+        """Returns the concurrency cap for the current request.
+
+        The per-request value from ``tool_settings``, else the process-wide
+        ``PROMPT_CONCURRENCY_DEFAULT`` (default: 1, serial execution), is
+        clamped to the process-wide ``PROMPT_CONCURRENCY_LIMIT``.
+
+        Args:
+            tool_settings (dict[str, Any]): Tool settings of the request
+
+        Returns:
+            int: Maximum number of prompts executed at the same time
+        """
+        limit = int(get_env_or_die("PROMPT_CONCURRENCY_LIMIT", "4"))
+        default = get_env_or_die("PROMPT_CONCURRENCY_DEFAULT", "1")
+        try:
+            requested = int(tool_settings.get(PSKeys.PROMPT_CONCURRENCY) or default)
+        except (TypeError, ValueError):
+            requested = 1
+        return max(1, min(requested, limit))
+
+    @staticmethod
+    def get_dependencies(
+        prompts: list[dict[str, Any]], variable_names: list[str]
+    ) -> list[set[int]]:
+        """Builds the dependency graph of the prompts.
+
+        Args:
+            prompts (list[dict[str, Any]]): Prompts of the tool, in order
+            variable_names (list[str]): Names of the prompts, in order
+
+        Returns:
+            list[set[int]]: For each prompt, indices of the prompts it depends on
+        """
+        positions = {name: index for index, name in enumerate(variable_names)}
+        dependencies: list[set[int]] = []
+        for prompt in prompts:
+            prompt_text = prompt[PSKeys.PROMPT]
+            referenced = {name for name in variable_names if f"%{name}%" in prompt_text}
+            for variable in VariableReplacementHelper.extract_variables_from_prompt(
+                prompt_text
+            ):
+                variable_type = VariableReplacementHelper.identify_variable_type(
+                    variable=variable
+                )
+                if variable_type == VariableType.STATIC:
+                    referenced.add(variable)
+                elif variable_type == VariableType.DYNAMIC:
+                    referenced.update(
+                        re.findall(
+                            VariableConstants.DYNAMIC_VARIABLE_DATA_REGEX, variable
+                        )
+                    )
+            dependencies.append(
+                {positions[name] for name in referenced if name in positions}
+            )
+        return dependencies
+
+    @staticmethod
+    def can_run_concurrently(
+        prompts: list[dict[str, Any]],
+        dependencies: list[set[int]],
+        tool_settings: dict[str, Any],
+    ) -> bool:
+        """Checks if running the prompts concurrently preserves serial results.
+
+        Table prompts (and vision record prompts) end the request early with
+        the output gathered so far, and forward / self references fail or stay
+        unresolved when run serially. Both depend on the serial order, so such
+        tools are always executed serially.
+        """
+        use_vision = tool_settings.get(PSKeys.USE_VISION_TABLE_EXTRACTION)
+        for index, prompt in enumerate(prompts):
+            prompt_type = prompt.get(PSKeys.TYPE)
+            if prompt_type == PSKeys.TABLE:
+                return False
+            if prompt_type == PSKeys.RECORD and use_vision:
+                return False
+            if any(dependency >= index for dependency in dependencies[index]):
+                return False
+        return True
+
+    @staticmethod
+    def run_concurrently(
+        prompts: list[dict[str, Any]],
+        dependencies: list[set[int]],
+        execute: Callable[[dict[str, Any]], Any],
+        max_workers: int,
+    ) -> None:
+        """Executes the prompts on a bounded pool, honouring dependencies.
+
+        Each prompt runs in a copy of the caller's context so that Flask's
+        application and request context remain available to it. On failure no
+        further prompts are started, the in-flight ones are awaited and the
+        error of the earliest failed prompt is raised.
+
+        Args:
+            prompts (list[dict[str, Any]]): Prompts of the tool, in order
+            dependencies (list[set[int]]): Output of `get_dependencies`
+            execute (Callable): Executes a single prompt
+            max_workers (int): Maximum number of prompts run at the same time
+        """
+        waiting = list(range(len(prompts)))
+        completed: set[int] = set()
+        running: dict[Future, int] = {}
+        errors: dict[int, BaseException] = {}
+        app.logger.info(
+            f"Executing {len(prompts)} prompt(s) with concurrency {max_workers}"
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prompt"
+        ) as executor:
+
+            def submit_ready() -> None:
+                for index in list(waiting):
+                    if dependencies[index] <= completed:
+                        waiting.remove(index)
+                        context = contextvars.copy_context()
+                        future = executor.submit(context.run, execute, prompts[index])
+                        running[future] = index
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    if future.cancelled():
+                        continue
+                    error = future.exception()
+                    if error:
+                        errors[index] = error
+                    else:
+                        completed.add(index)
+                if errors:
+                    for future in running:
+                        future.cancel()
+                    continue
+                submit_ready()
+
+        if errors:
+            raise errors[min(errors)]
+
+    @staticmethod
+    def restore_prompt_order(
+        variable_names: list[str],
+        structured_output: dict[str, Any],
+        metadata: dict[str, Any],
+        metrics: dict[str, Any],
+    ) -> None:
+        """Reorders the outputs in place to match serial execution.
+
+        Concurrently executed prompts finish in any order, so the keys of the
+        per-prompt dicts are rearranged into the order of the prompts.
+        """
+        PromptExecutionService._reorder(structured_output, variable_names)
+        PromptExecutionService._reorder(metrics, variable_names)
+        for value in metadata.values():
+            if isinstance(value, dict):
+                PromptExecutionService._reorder(value, variable_names)
+
+    @staticmethod
+    def _reorder(data: dict[str, Any], keys: list[str]) -> None:
+        ordered = {key: data[key] for key in keys if key in data}
+        ordered.update({key: value for key, value in data.items() if key not in ordered})
+        data.clear()
+        data.update(ordered)
@@ -5,21 +5,34 @@ from flask import current_app as app
 
 from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
 from unstract.prompt_service.constants import RetrievalStrategy
+from unstract.prompt_service.core.query_embedding_cache import QueryEmbeddingCache
 from unstract.prompt_service.core.retrievers.automerging import AutomergingRetriever
 from unstract.prompt_service.core.retrievers.fusion import FusionRetriever
+from unstract.prompt_service.core.retrievers.hybrid import HybridRetriever
 from unstract.prompt_service.core.retrievers.keyword_table import KeywordTableRetriever
 from unstract.prompt_service.core.retrievers.recursive import RecursiveRetrieval
 from unstract.prompt_service.core.retrievers.router import RouterRetriever
 from unstract.prompt_service.core.retrievers.simple import SimpleRetriever
 from unstract.prompt_service.core.retrievers.subquestion import SubquestionRetriever
+from unstract.prompt_service.helpers.adapter_registry import AdapterRegistry
 from unstract.prompt_service.services.answer_prompt import AnswerPromptService
+from unstract.prompt_service.services.variable_replacement import (
+    VariableReplacementService,
+)
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.prompt_service.utils.metrics import Metrics
+from unstract.sdk1.file_storage import FileStorage
 from unstract.sdk1.llm import LLM
 from unstract.sdk1.vector_db import VectorDB
 
 
 class RetrievalService:
+    # Strategies querying the vector DB with the embedding of the prompt
+    EMBEDDED_QUERY_STRATEGIES = (
+        RetrievalStrategy.SIMPLE.value,
+        RetrievalStrategy.HYBRID.value,
+    )
+
     @staticmethod
     def perform_retrieval(  # type:ignore
         tool_settings: dict[str, Any],
@@ -53,6 +66,13 @@ class RetrievalService:
                 prompt_key=prompt_name,
             )
         else:
+            # Keyword retrieval reads the index persisted along with the document
+            fs_instance = None
+            if retrieval_type in (
+                RetrievalStrategy.KEYWORD_TABLE.value,
+                RetrievalStrategy.HYBRID.value,
+            ):
+                fs_instance = FileUtils.get_fs_instance(execution_source=execution_source)
             context = RetrievalService.run_retrieval(
                 output=output,
                 doc_id=doc_id,
@@ -60,6 +80,7 @@ class RetrievalService:
                 vector_db=vector_db,
                 retrieval_type=retrieval_type,
                 context_retrieval_metrics=context_retrieval_metrics,
+                fs_instance=fs_instance,
             )
         answer = AnswerPromptService.construct_and_run_prompt(  # type:ignore
             tool_settings=tool_settings,
@@ -73,6 +94,67 @@ class RetrievalService:
         )
         return answer, context
 
+    @staticmethod
+    def embed_queries(
+        prompts: list[dict[str, Any]],
+        variable_names: list[str],
+        tool_settings: dict[str, Any],
+        adapters: AdapterRegistry,
+        usage_kwargs: dict[str, Any],
+    ) -> None:
+        """Embeds the prompts of a request in a single batch per embedding.
+
+        Only prompts without variables are known before any prompt runs.
+        Their vectors are kept in the `QueryEmbeddingCache`, from which the
+        retrievers read them. Failures are logged, leaving the prompts to be
+        embedded during retrieval.
+
+        Args:
+            prompts (list[dict[str, Any]]): Prompts of the request
+            variable_names (list[str]): Names of the prompts, which other
+                prompts can refer to as variables
+            tool_settings (dict[str, Any]): Settings of the tool
+            adapters (AdapterRegistry): Adapters of the request
+            usage_kwargs (dict[str, Any]): Usage kwargs of the adapters
+        """
+        if QueryEmbeddingCache.get_size() <= 0:
+            return
+        valid_strategies = {strategy.value for strategy in RetrievalStrategy}
+        use_vision = tool_settings.get(PSKeys.USE_VISION_TABLE_EXTRACTION)
+        batches: dict[str, tuple[str, list[str]]] = {}
+        for output in prompts:
+            prompt = output[PSKeys.PROMPT]
+            strategy = output.get(PSKeys.RETRIEVAL_STRATEGY)
+            if strategy not in valid_strategies:
+                strategy = RetrievalStrategy.SIMPLE.value
+            if (
+                output[PSKeys.CHUNK_SIZE] <= 0
+                or strategy not in RetrievalService.EMBEDDED_QUERY_STRATEGIES
+                or output[PSKeys.TYPE] == PSKeys.TABLE
+                or (output[PSKeys.TYPE] == PSKeys.RECORD and use_vision)
+                or VariableReplacementService.is_variables_present(prompt_text=prompt)
+                or any(f"%{name}%" in prompt for name in variable_names)
+            ):
+                continue
+            # Queries are cached per embedding, any of its vector DBs embeds them
+            _, queries = batches.setdefault(
+                output[PSKeys.EMBEDDING], (output[PSKeys.VECTOR_DB], [])
+            )
+            queries.append(prompt)
+
+        for embedding_id, (vector_db_id, queries) in batches.items():
+            try:
+                vector_db = adapters.get_vector_db(
+                    adapter_instance_id=vector_db_id,
+                    embedding_instance_id=embedding_id,
+                    usage_kwargs=usage_kwargs,
+                )
+                QueryEmbeddingCache.warm(vector_db, queries)
+            except Exception as e:
+                app.logger.warning(
+                    f"Unable to embed {len(queries)} prompts in a batch: {e}"
+                )
+
     @staticmethod
     def run_retrieval(  # type:ignore
         output: dict[str, Any],
@@ -81,6 +163,7 @@ class RetrievalService:
         vector_db: VectorDB,
         retrieval_type: str,
         context_retrieval_metrics: dict[str, Any],
+        fs_instance: FileStorage | None = None,
     ) -> list[str]:
         context: set[str]
         prompt = output[PSKeys.PROMPTX]
@@ -97,6 +180,7 @@ class RetrievalService:
             RetrievalStrategy.ROUTER.value: RouterRetriever,
             RetrievalStrategy.KEYWORD_TABLE.value: KeywordTableRetriever,
             RetrievalStrategy.AUTOMERGING.value: AutomergingRetriever,
+            RetrievalStrategy.HYBRID.value: HybridRetriever,
         }
 
         # Get the appropriate retriever class
@@ -111,6 +195,7 @@ class RetrievalService:
             prompt=prompt,
             top_k=top_k,
             llm=llm,
+            fs_instance=fs_instance,
         )
         context = retriever.retrieve()
         elapsed = Metrics.elapsed_time(start_time=retrieval_start_time)
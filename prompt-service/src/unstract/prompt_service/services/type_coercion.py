@@ -0,0 +1,291 @@
+"""Deterministic coercion of prompt answers to NUMBER, EMAIL, DATE and BOOLEAN.
+
+Answers are parsed locally before asking the LLM to convert them. A parser
+returns None unless the answer is unambiguous, e.g. it is a number or a yes /
+no on its own, or it holds a single date whose day and month can't be
+swapped, in which case the conversion is left to the LLM.
+"""
+
+import logging
+import re
+import threading
+from collections import Counter
+from datetime import date, datetime
+from typing import Any
+
+from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
+from unstract.prompt_service.utils.env_loader import get_env_or_die
+
+logger = logging.getLogger(__name__)
+
+# Matched against the whole answer, e.g. "-$1,250.50", "(1,200)" or "12%"
+_NUMBER_RE = re.compile(
+    r"(?<!\w)(?P<negative>[-−(])?\s*(?:[$€£¥₹]|usd|eur|gbp)?\s*"
+    r"(?P<number>\d(?:[\d,.'\u00a0\u202f]*\d)?)"
+    r"(?:\s*(?P<scale>thousand|million|billion|trillion|k|mn|bn))?"
+    r"\s*(?:%|[$€£¥₹]|usd|eur|gbp)?\s*\)?",
+    re.IGNORECASE,
+)
+_SCALES = {
+    "k": 1e3,
+    "thousand": 1e3,
+    "mn": 1e6,
+    "million": 1e6,
+    "bn": 1e9,
+    "billion": 1e9,
+    "trillion": 1e12,
+}
+
+_EMAIL_RE = re.compile(
+    r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+"
+    r"@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+"
+)
+
+# Month names and abbreviations in English, German, French, Spanish,
+# Italian, Dutch and Portuguese
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            "january jan januar janv janvier enero ene gennaio gen januari janeiro",
+            "february feb februar fev fevr fevrier febrero febbraio februari fevereiro",
+            "march mar marz maerz mars marzo mrt maart marco",
+            "april apr avr avril abril abr aprile",
+            "may mai mayo maggio mag mei maio",
+            "june jun juni juin junio giugno giu junho",
+            "july jul juli juil juillet julio luglio lug julho",
+            "august aug aout agosto ago augustus",
+            "september sep sept septembre septiembre settembre set setembro",
+            "october oct oktober octobre octubre ottobre ott okt outubro out",
+            "november nov novembre noviembre novembro",
+            "december dec dezember dez decembre diciembre dic dicembre dezembro",
+        ),
+        start=1,
+    )
+    for name in names.split()
+}
+_ACCENTS = str.maketrans("äàâéèêëûüùôöçíóñ", "aaaeeeeuuuoocion")
+_MONTH_NAME = r"(?P<month_name>[^\W\d_]{3,10})\.?"
+_DAY = r"(?P<day>\d{1,2})(?:st|nd|rd|th|er|º|\.)?"
+_YEAR = r"(?P<year>\d{4})"
+_CONNECTOR = r"(?:\s*,\s*|\s+(?:de\s+|of\s+)?|\s*[-/]\s*)"
+_DATE_PATTERNS = (
+    re.compile(
+        r"\b(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+        r"(?:[t ](?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?"
+    ),
+    re.compile(r"\b(?P<year>\d{4})[/.](?P<month>\d{1,2})[/.](?P<day>\d{1,2})\b"),
+    re.compile(
+        r"\b(?P<first>\d{1,2})(?P<separator>[/.-])(?P<second>\d{1,2})"
+        r"(?P=separator)(?P<year>\d{4})\b"
+    ),
+    re.compile(rf"\b{_DAY}{_CONNECTOR}{_MONTH_NAME}{_CONNECTOR}{_YEAR}\b"),
+    re.compile(rf"\b{_MONTH_NAME}{_CONNECTOR}{_DAY}{_CONNECTOR}{_YEAR}\b"),
+)
+
+_TRUE_WORDS = {"yes", "y", "true", "correct", "affirmative", "ja", "oui", "si"}
+_FALSE_WORDS = {"no", "n", "false", "incorrect", "negative", "nein", "non"}
+
+
+class TypeCoercionService:
+    """Parses answers of typed prompts without an LLM call.
+
+    Counts how often each type is coerced locally and how often the LLM is
+    needed, see `get_stats`.
+
+    Configurable via environment variables:
+    - TYPE_COERCION_FAST_PATH (default: true)
+    """
+
+    TYPES = (PSKeys.NUMBER, PSKeys.EMAIL, PSKeys.DATE, PSKeys.BOOLEAN)
+    FAST_PATH = "fast_path"
+    LLM = "llm"
+
+    _stats: Counter[tuple[str, str]] = Counter()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return get_env_or_die("TYPE_COERCION_FAST_PATH", "true").lower() == "true"
+
+    @staticmethod
+    def coerce(output_type: str, answer: str) -> Any:
+        """Coerces an answer to the type of its prompt.
+
+        Args:
+            output_type (str): Type of the prompt, e.g. ``number``
+            answer (str): Answer returned by the LLM
+
+        Returns:
+            Any: Coerced value, None if the answer needs the LLM to convert it
+        """
+        parsers = {
+            PSKeys.NUMBER: TypeCoercionService.parse_number,
+            PSKeys.EMAIL: TypeCoercionService.parse_email,
+            PSKeys.DATE: TypeCoercionService.parse_date,
+            PSKeys.BOOLEAN: TypeCoercionService.parse_boolean,
+        }
+        value = None
+        if TypeCoercionService.is_enabled() and output_type in parsers:
+            value = parsers[output_type](answer)
+        path = TypeCoercionService.LLM if value is None else TypeCoercionService.FAST_PATH
+        with TypeCoercionService._lock:
+            TypeCoercionService._stats[(output_type, path)] += 1
+            taken = TypeCoercionService._stats[
+                (output_type, TypeCoercionService.FAST_PATH)
+            ]
+            total = (
+                taken + TypeCoercionService._stats[(output_type, TypeCoercionService.LLM)]
+            )
+        logger.info(
+            "Coercing %s answer via %s (fast path taken %d of %d times)",
+            output_type,
+            path,
+            taken,
+            total,
+        )
+        return value
+
+    @staticmethod
+    def get_stats() -> dict[str, dict[str, int]]:
+        """Returns the number of fast path and LLM coercions of each type."""
+        stats: dict[str, dict[str, int]] = {}
+        with TypeCoercionService._lock:
+            for (output_type, path), count in TypeCoercionService._stats.items():
+                stats.setdefault(
+                    output_type,
+                    {TypeCoercionService.FAST_PATH: 0, TypeCoercionService.LLM: 0},
+                )[path] = count
+        return stats
+
+    @staticmethod
+    def reset_stats() -> None:
+        with TypeCoercionService._lock:
+            TypeCoercionService._stats.clear()
+
+    @staticmethod
+    def parse_number(answer: str) -> float | None:
+        """Parses an answer which is a number on its own, e.g. ``$1.2 million``.
+
+        Thousands separators of any locale are removed and scale words are
+        expanded. Percentages are returned without the percent sign. Numbers
+        like "1,250", whose only separator may be a thousands or a decimal one,
+        and numbers within a sentence, e.g. "Unit B-12 rent is unknown", are
+        left to the LLM.
+        """
+        match = _NUMBER_RE.fullmatch(answer.strip().rstrip("."))
+        if match is None:
+            return None
+        number = TypeCoercionService._parse_decimal(match["number"])
+        if number is None:
+            return None
+        if match["scale"]:
+            number *= _SCALES[match["scale"].lower()]
+        if match["negative"]:
+            number = -number
+        return number
+
+    @staticmethod
+    def _parse_decimal(text: str) -> float | None:
+        text = re.sub(r"['\u00a0\u202f]", "", text)
+        # A single separator followed by 3 digits, e.g. "1,250" or "1.250", is
+        # a thousands separator in some locales and a decimal one in others
+        if re.fullmatch(r"\d+[,.]\d{3}", text):
+            return None
+        if "," in text and "." in text:
+            # The separator used last is the decimal separator
+            grouping = "," if text.rfind(".") > text.rfind(",") else "."
+            text = text.replace(grouping, "")
+        elif text.count(",") > 1 or re.fullmatch(r"\d{1,3}(,\d{3})+", text):
+            text = text.replace(",", "")
+        elif text.count(".") > 1:
+            text = text.replace(".", "")
+        text = text.replace(",", ".")
+        if not re.fullmatch(r"\d+(\.\d+)?", text):
+            return None
+        return float(text)
+
+    @staticmethod
+    def parse_email(answer: str) -> str | None:
+        """Parses an answer mentioning a single email address."""
+        emails: dict[str, str] = {}
+        for email in _EMAIL_RE.findall(answer):
+            email = email.rstrip(".")
+            emails.setdefault(email.lower(), email)
+        if len(emails) != 1:
+            return None
+        return next(iter(emails.values()))
+
+    @staticmethod
+    def parse_date(answer: str) -> str | None:
+        """Parses an answer mentioning a single date, as an ISO date.
+
+        Numeric dates are read day first when separated by dots, and as
+        whichever of day or month first is valid otherwise. Dates like
+        ``03/04/2024`` are ambiguous and left to the LLM.
+        """
+        text = answer.lower().translate(_ACCENTS)
+        dates: set[str] = set()
+        spans: list[tuple[int, int]] = []
+        for pattern in _DATE_PATTERNS:
+            for match in pattern.finditer(text):
+                if any(
+                    start < match.end() and match.start() < end for start, end in spans
+                ):
+                    continue
+                # Words before a day and year which aren't months, e.g. "unit"
+                month_name = match.groupdict().get("month_name")
+                if month_name and month_name not in _MONTHS:
+                    continue
+                parsed = TypeCoercionService._parse_date_match(match)
+                if parsed is None:
+                    return None
+                spans.append(match.span())
+                dates.add(parsed)
+        if len(dates) != 1:
+            return None
+        return dates.pop()
+
+    @staticmethod
+    def _parse_date_match(match: re.Match[str]) -> str | None:
+        groups = match.groupdict()
+        year = int(groups["year"])
+        if groups.get("first"):
+            first, second = int(groups["first"]), int(groups["second"])
+            if groups["separator"] == "." or first > 12 or first == second:
+                day, month = first, second
+            elif second > 12:
+                day, month = second, first
+            else:
+                return None
+        elif groups.get("month_name"):
+            month, day = _MONTHS[groups["month_name"]], int(groups["day"])
+        else:
+            day, month = int(groups["day"]), int(groups["month"])
+        try:
+            if groups.get("hour"):
+                return datetime(
+                    year,
+                    month,
+                    day,
+                    int(groups["hour"]),
+                    int(groups["minute"]),
+                    int(groups["second"] or 0),
+                ).isoformat()
+            return date(year, month, day).isoformat()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_boolean(answer: str) -> bool | None:
+        """Parses an answer which is a yes or no on its own, in a few languages.
+
+        Answers like "no idea" or "Non-refundable deposit" are left to the LLM.
+        """
+        text = answer.lower().translate(_ACCENTS).strip().rstrip(".!")
+        if text in _TRUE_WORDS:
+            return True
+        if text in _FALSE_WORDS:
+            return False
+        return None
@@ -1,24 +1,39 @@
 """Vision-based table extraction: document (PDF) -> OpenAI vision -> structured table.
 
 Uses the raw document (no x2text). Converts PDF pages to images and calls
-a vision-capable LLM to extract tabular data as JSON.
+a vision-capable LLM to extract tabular data as JSON. Long documents are split
+into overlapping windows of pages, extracted concurrently and merged.
 """
 
-import base64
 import json
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import litellm
 
 from unstract.core.flask.exceptions import APIError
 from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
+from unstract.prompt_service.services.page_images import PageImageService
+from unstract.prompt_service.utils.env_loader import get_env_or_die
 
 logger = logging.getLogger(__name__)
 
 
 class VisionTableExtractionService:
-    """Extract table data from a document using a vision-capable LLM (e.g. OpenAI)."""
+    """Extract table data from a document using a vision-capable LLM (e.g. OpenAI).
+
+    When windows are enabled, documents with more pages than a window are
+    extracted one window at a time, with consecutive windows sharing the
+    overlapping pages. Rows are returned with the page they are on, and rows
+    of the overlapping pages repeated by the next window are dropped on merge.
+
+    Configurable via environment variables:
+    - VISION_WINDOW_PAGES (default: 0, sending every page in a single call)
+    - VISION_WINDOW_OVERLAP (default: 1 page)
+    - VISION_CONCURRENCY_LIMIT (default: 4 calls at a time)
+    """
 
     SYSTEM_PROMPT = (
         "You are an expert at extracting structured tabular data from documents. "
@@ -27,29 +42,18 @@ class VisionTableExtractionService:
         "identifying each table and values as arrays of row objects. "
         "Do not include any explanation, only the JSON."
     )
+    # Key of the rows of windows returning an array, when others return tables
+    UNNAMED_TABLE = "table"
+    # Key of the page number of a row, returned by windowed calls
+    PAGE_KEY = "_page"
 
     @staticmethod
-    def _pdf_to_base64_images(file_bytes: bytes) -> list[str]:
-        """Convert PDF bytes to a list of base64 data URLs (one per page)."""
-        try:
-            import fitz  # PyMuPDF
-        except ImportError as e:
-            raise APIError(
-                message="Vision table extraction requires pymupdf. Install with: pip install pymupdf",
-                code=500,
-            ) from e
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        images = []
-        try:
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                pix = page.get_pixmap(dpi=150, alpha=False)
-                img_bytes = pix.tobytes("png")
-                b64 = base64.standard_b64encode(img_bytes).decode("ascii")
-                images.append(f"data:image/png;base64,{b64}")
-        finally:
-            doc.close()
-        return images
+    def _pdf_to_base64_images(file_bytes: bytes, fs_instance: Any = None) -> list[str]:
+        """Convert PDF bytes to a list of base64 data URLs (one per page).
+
+        Rendered pages are cached, see `PageImageService`.
+        """
+        return PageImageService.get_base64_images(file_bytes, fs_instance=fs_instance)
 
     @staticmethod
     def _build_vision_messages(
@@ -98,6 +102,7 @@ class VisionTableExtractionService:
                 from unstract.prompt_service.utils.json_repair_helper import (
                     repair_json_with_best_structure,
                 )
+
                 return repair_json_with_best_structure(json_str)
             except Exception as repair_e:
                 raise APIError(
@@ -141,19 +146,55 @@ class VisionTableExtractionService:
                 code=400,
             )
 
-        image_urls = VisionTableExtractionService._pdf_to_base64_images(file_bytes)
+        image_urls = VisionTableExtractionService._pdf_to_base64_images(
+            file_bytes, fs_instance=fs_instance
+        )
         if not image_urls:
             raise APIError(message="PDF produced no pages.", code=400)
 
         preamble = tool_settings.get(PSKeys.PREAMBLE, "")
         postamble = tool_settings.get(PSKeys.POSTAMBLE, "")
         instruction_parts = [p for p in (preamble, prompt, postamble) if p]
-        instruction = "\n\n".join(instruction_parts).strip() or "Extract all tabular data from this document as JSON."
+        instruction = (
+            "\n\n".join(instruction_parts).strip()
+            or "Extract all tabular data from this document as JSON."
+        )
 
-        messages = VisionTableExtractionService._build_vision_messages(
-            instruction, image_urls
+        windows = VisionTableExtractionService._get_windows(len(image_urls))
+        if len(windows) == 1:
+            messages = VisionTableExtractionService._build_vision_messages(
+                instruction, image_urls
+            )
+            return VisionTableExtractionService._complete(messages, llm)
+
+        limit = int(get_env_or_die("VISION_CONCURRENCY_LIMIT", "4"))
+        logger.info(
+            "Extracting %d pages in %d windows, %d at a time",
+            len(image_urls),
+            len(windows),
+            limit,
         )
 
+        def extract_window(window: tuple[int, int]) -> Any:
+            start, end = window
+            window_instruction = (
+                f"{instruction}\n\nThe images are pages {start + 1} to {end} of a "
+                f"{len(image_urls)} page document. Extract only the data on these "
+                f'pages, and add a "{VisionTableExtractionService.PAGE_KEY}" key '
+                "to each row object holding the number of the page the row is on."
+            )
+            messages = VisionTableExtractionService._build_vision_messages(
+                window_instruction, image_urls[start:end]
+            )
+            return VisionTableExtractionService._complete(messages, llm)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(limit, len(windows)))) as executor:
+            results = list(executor.map(extract_window, windows))
+        return VisionTableExtractionService._merge_results(results, windows)
+
+    @staticmethod
+    def _complete(messages: list[dict[str, Any]], llm: Any) -> Any:
+        """Calls the vision LLM and parses the JSON it returns."""
         # Call litellm with the same adapter config as the SDK LLM
         completion_kwargs = dict(llm.kwargs)
         # litellm expects 'model' and provider-specific keys
@@ -173,3 +214,107 @@ class VisionTableExtractionService:
             response.get("choices", [{}])[0].get("message", {}).get("content") or ""
         )
         return VisionTableExtractionService._parse_json_from_response(response_text)
+
+    @staticmethod
+    def _get_windows(page_count: int) -> list[tuple[int, int]]:
+        """Splits pages into windows, as (start, end) page indexes.
+
+        Consecutive windows share `VISION_WINDOW_OVERLAP` pages, so that rows
+        of tables spanning a page break are seen whole by one of the calls.
+        """
+        window_pages = int(get_env_or_die("VISION_WINDOW_PAGES", "0"))
+        if window_pages <= 0 or page_count <= window_pages:
+            return [(0, page_count)]
+        overlap = int(get_env_or_die("VISION_WINDOW_OVERLAP", "1"))
+        step = max(1, window_pages - max(0, overlap))
+        windows = []
+        start = 0
+        while True:
+            end = min(start + window_pages, page_count)
+            windows.append((start, end))
+            if end >= page_count:
+                return windows
+            start += step
+
+    @staticmethod
+    def _row_key(row: Any) -> str:
+        """Canonical form of a row, ignoring key order and padding of values."""
+        if isinstance(row, dict):
+            row = {
+                key: value.strip() if isinstance(value, str) else value
+                for key, value in row.items()
+            }
+        return json.dumps(row, sort_keys=True, default=str)
+
+    @staticmethod
+    def _pop_page(row: Any) -> int | None:
+        """Removes the page number from a row, returning it if valid."""
+        if not isinstance(row, dict):
+            return None
+        page = row.pop(VisionTableExtractionService.PAGE_KEY, None)
+        try:
+            return int(page)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _merge_rows(
+        windows_rows: list[list[Any]], windows: list[tuple[int, int]]
+    ) -> list[Any]:
+        """Concatenates the rows of windows, in page order.
+
+        A row on a page two windows overlap on is dropped if the previous
+        window returned the same row on those pages, as both windows saw it.
+        Rows of other pages, rows without a page and rows repeated within a
+        window are kept, as the table really holds them.
+        """
+        merged: list[Any] = []
+        previous: Counter[tuple[int, str]] = Counter()
+        previous_end = 0
+        for rows, (start, end) in zip(windows_rows, windows, strict=True):
+            # 1-based numbers of the pages shared with the previous window
+            overlap = range(start + 1, previous_end + 1)
+            repeatable = previous
+            previous = Counter()
+            for row in rows:
+                page = VisionTableExtractionService._pop_page(row)
+                if page is None:
+                    merged.append(row)
+                    continue
+                key = (page, VisionTableExtractionService._row_key(row))
+                previous[key] += 1
+                if page in overlap and repeatable[key] > 0:
+                    repeatable[key] -= 1
+                    continue
+                merged.append(row)
+            previous_end = end
+        return merged
+
+    @staticmethod
+    def _merge_results(results: list[Any], windows: list[tuple[int, int]]) -> Any:
+        """Merges the JSON extracted from each window into one result.
+
+        Arrays of rows are concatenated. Objects are merged by key, with
+        arrays of rows (one per table) concatenated and other values taken
+        from the first window returning them.
+        """
+        if all(isinstance(result, list) for result in results):
+            return VisionTableExtractionService._merge_rows(results, windows)
+
+        # Rows of each table, per window, with windows missing it left empty
+        tables: dict[str, list[list[Any]]] = {}
+        merged: dict[str, Any] = {}
+        for index, result in enumerate(results):
+            if isinstance(result, list):
+                result = {VisionTableExtractionService.UNNAMED_TABLE: result}
+            if not isinstance(result, dict):
+                continue
+            for key, value in result.items():
+                if isinstance(value, list):
+                    tables.setdefault(key, [[] for _ in results])[index] = value
+                    merged.setdefault(key, [])
+                elif merged.get(key) in (None, "", [], {}):
+                    merged[key] = value
+        for key, windows_rows in tables.items():
+            merged[key] = VisionTableExtractionService._merge_rows(windows_rows, windows)
+        return merged
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from unstract.prompt_service.helpers import adapter_registry
+from unstract.prompt_service.helpers.adapter_registry import AdapterRegistry
+
+
+@pytest.fixture
+def adapters(mocker):
+    mocker.patch.object(adapter_registry, "LLM", side_effect=lambda **_: MagicMock())
+    mocker.patch.object(
+        adapter_registry, "EmbeddingCompat", side_effect=lambda **_: MagicMock()
+    )
+    vector_db_cls = mocker.patch.object(adapter_registry, "VectorDB")
+    vector_db_cls.side_effect = lambda **_: MagicMock(spec=["close"])
+    app = Flask(__name__)
+    with app.app_context():
+        yield AdapterRegistry(tool=MagicMock())
+
+
+def test_adapters_are_built_once_per_key(adapters):
+    usage = {"run_id": "run-1"}
+
+    first = adapters.get_vector_db("vdb-1", "emb-1", usage)
+    second = adapters.get_vector_db("vdb-1", "emb-1", dict(usage))
+    other = adapters.get_vector_db("vdb-1", "emb-1", {"run_id": "run-2"})
+
+    assert first is second
+    assert first is not other
+    assert adapter_registry.EmbeddingCompat.call_count == 2
+
+
+def test_llm_copies_have_separate_metrics(adapters):
+    usage = {"run_id": "run-1", "llm_usage_reason": "extraction"}
+
+    first = adapters.get_llm("llm-1", usage)
+    first._metrics["time_taken(s)"] = 1.0
+    second = adapters.get_llm("llm-1", usage)
+
+    assert adapter_registry.LLM.call_count == 1
+    assert second._metrics == {}
+
+
+def test_close_closes_vector_dbs(adapters):
+    with adapters:
+        vector_db = adapters.get_vector_db("vdb-1", "emb-1", {})
+    vector_db.close.assert_called_once()
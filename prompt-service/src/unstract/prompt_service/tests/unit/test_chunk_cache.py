@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from unstract.prompt_service.core.chunk_cache import ChunkCache, DocumentChunks
+from unstract.prompt_service.core.retrievers.simple import SimpleRetriever
+from unstract.sdk1.vector_db import VectorDB
+
+CHUNKS = {
+    "Monthly rent is 1250.00.": [1.0, 0.0, 0.0],
+    "The security deposit is 2500.00.": [0.6, 0.8, 0.0],
+    "Parking is assigned by the manager.": [0.0, 0.0, 2.0],
+}
+
+
+@pytest.fixture
+def vector_db():
+    ChunkCache.clear()
+    vector_db = MagicMock(_adapter_instance_id="vector-db-1")
+    vector_db.get_document_nodes.return_value = [
+        MagicMock(embedding=embedding, **{"get_content.return_value": text})
+        for text, embedding in CHUNKS.items()
+    ]
+    vector_db.get_query_embedding.return_value = [0.0, 1.0, 0.0]
+    yield vector_db
+    ChunkCache.clear()
+
+
+def test_rank_orders_by_cosine_similarity():
+    chunks = DocumentChunks(list(CHUNKS), list(CHUNKS.values()))
+
+    ranked = chunks.rank([0.0, 2.0, 0.0], top_k=2)
+
+    assert [text for text, _ in ranked] == [
+        "The security deposit is 2500.00.",
+        "Monthly rent is 1250.00.",
+    ]
+    assert np.isclose(ranked[0][1], 0.8)
+    assert not DocumentChunks(["a"], [None]).can_rank()
+
+
+def test_prompts_on_a_document_share_its_chunks(vector_db):
+    for prompt in ("deposit", "rent"):
+        retriever = SimpleRetriever(
+            vector_db=vector_db, prompt=prompt, doc_id="doc-1", top_k=1
+        )
+        assert retriever.retrieve() == {"The security deposit is 2500.00."}
+
+    vector_db.get_document_nodes.assert_called_once_with("doc-1")
+    vector_db.get_vector_store_index.assert_not_called()
+
+
+def test_disabled_cache_queries_the_vector_db(vector_db, monkeypatch):
+    monkeypatch.setenv("CHUNK_CACHE_SIZE", "0")
+    node = MagicMock(score=0.5, **{"get_content.return_value": "from the DB"})
+    vector_store_index = vector_db.get_vector_store_index.return_value
+    vector_store_index.as_retriever.return_value.retrieve.return_value = [node]
+
+    retriever = SimpleRetriever(
+        vector_db=vector_db, prompt="rent", doc_id="doc-1", top_k=1
+    )
+
+    assert retriever.retrieve() == {"from the DB"}
+    vector_db.get_document_nodes.assert_not_called()
+
+
+def test_capped_chunks_are_ranked_by_the_vector_db(vector_db, monkeypatch):
+    monkeypatch.setattr(VectorDB, "MAX_DOCUMENT_NODES", len(CHUNKS))
+    node = MagicMock(score=0.5, **{"get_content.return_value": "from the DB"})
+    vector_store_index = vector_db.get_vector_store_index.return_value
+    vector_store_index.as_retriever.return_value.retrieve.return_value = [node]
+
+    retriever = SimpleRetriever(
+        vector_db=vector_db, prompt="rent", doc_id="doc-1", top_k=1
+    )
+
+    assert retriever.retrieve() == {"from the DB"}
+    assert not ChunkCache.get(vector_db, "doc-1").complete
@@ -0,0 +1,61 @@
+import pytest
+from flask import Flask
+from unstract.prompt_service.services import extraction
+from unstract.prompt_service.services.extraction import ExtractionService
+from unstract.sdk1.adapters.x2text.dto import TextExtractionResult
+from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk1.utils.extraction_cache import ExtractionCache
+
+
+@pytest.fixture
+def x2text(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("PERMANENT_REMOTE_STORAGE", '{"provider": "local"}')
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    ExtractionCache.reset()
+    mocker.patch.object(
+        extraction.FileUtils,
+        "get_fs_instance",
+        return_value=FileStorage(FileStorageProvider.LOCAL),
+    )
+    x2text = mocker.patch.object(extraction, "X2Text").return_value
+    x2text.x2text_adapter_id = "unstructuredio|1"
+    x2text.x2text_metadata = {"api_key": "secret"}
+    x2text.process.return_value = TextExtractionResult(
+        extracted_text="Monthly rent is 1250.00 for unit B-12 of the building.",
+        extraction_metadata=None,
+    )
+    app = Flask(__name__)
+    with app.app_context():
+        yield x2text
+    ExtractionCache.reset()
+
+
+def _extract(tmp_path, platform_key: str) -> str:
+    input_file = tmp_path / "lease.pdf"
+    input_file.write_bytes(b"%PDF lease")
+    return ExtractionService.perform_extraction(
+        x2text_instance_id="x2text-1",
+        file_path=str(input_file),
+        run_id="run-1",
+        platform_key=platform_key,
+        output_file_path=str(tmp_path / "lease.txt"),
+    )
+
+
+def test_files_are_extracted_once_per_organisation(x2text, tmp_path):
+    first = _extract(tmp_path, platform_key="org-1-key")
+    second = _extract(tmp_path, platform_key="org-1-key")
+
+    assert first == second
+    assert x2text.process.call_count == 1
+
+    _extract(tmp_path, platform_key="org-2-key")
+    assert x2text.process.call_count == 2
+
+
+def test_other_credentials_are_extracted_again(x2text, tmp_path):
+    _extract(tmp_path, platform_key="org-1-key")
+    x2text.x2text_metadata = {"api_key": "other-account"}
+    _extract(tmp_path, platform_key="org-1-key")
+
+    assert x2text.process.call_count == 2
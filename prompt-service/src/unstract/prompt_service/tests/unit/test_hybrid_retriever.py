@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.prompt_service.core.keyword_index import BM25Index, KeywordIndexStore
+from unstract.prompt_service.core.retrievers.hybrid import HybridRetriever
+
+CHUNKS = [
+    "Unit 101 is leased to Acme Corp. Monthly rent is 1250.00.",
+    "The security deposit for unit 101 is 2500.00.",
+    "Parking spaces are assigned by the property manager.",
+    "Late fees of 50.00 apply after the fifth day of the month.",
+]
+
+
+@pytest.fixture(autouse=True)
+def keyword_index():
+    KeywordIndexStore.clear_cache()
+    KeywordIndexStore.save(None, "doc-1", BM25Index.build(CHUNKS))
+    yield
+    KeywordIndexStore.clear_cache()
+
+
+def test_fuse_ranks_chunks_found_by_both_searches_first():
+    fused = HybridRetriever.fuse(
+        [["a", "b", "c"], ["c", "d", "b"]],
+        top_k=3,
+    )
+
+    assert fused == ["c", "b", "a"]
+    assert HybridRetriever.fuse([[], []], top_k=3) == []
+
+
+def test_hybrid_fuses_vector_and_keyword_search():
+    nodes = [
+        MagicMock(score=0.8, **{"get_content.return_value": CHUNKS[3]}),
+        MagicMock(score=0.7, **{"get_content.return_value": CHUNKS[1]}),
+        MagicMock(score=0.0, **{"get_content.return_value": CHUNKS[2]}),
+    ]
+    vector_db = MagicMock()
+    vector_store_index = vector_db.get_vector_store_index.return_value
+    vector_store_index.as_retriever.return_value.retrieve.return_value = nodes
+
+    retriever = HybridRetriever(
+        vector_db=vector_db,
+        prompt="security deposit amount",
+        doc_id="doc-1",
+        top_k=1,
+    )
+
+    assert retriever.retrieve() == {CHUNKS[1]}
+    assert vector_store_index.as_retriever.call_args.kwargs["similarity_top_k"] == 2
@@ -0,0 +1,94 @@
+import pytest
+from unstract.prompt_service.dto import (
+    ChunkingConfig,
+    FileInfo,
+    InstanceIdentifiers,
+    ProcessingOptions,
+)
+from unstract.prompt_service.services import indexing
+from unstract.prompt_service.services.indexing import IndexingService
+
+
+@pytest.fixture
+def index(mocker):
+    mocker.patch.object(indexing, "FileUtils")
+    mocker.patch.object(indexing, "PromptServiceBaseTool")
+    mocker.patch.object(indexing, "EmbeddingCompat")
+    mocker.patch.object(
+        indexing.IndexingUtils, "generate_index_key", return_value="doc-1"
+    )
+    index = mocker.patch.object(indexing, "Index").return_value
+    index.is_document_indexed.return_value = True
+    return index
+
+
+def _index(processing_options: ProcessingOptions) -> str:
+    return IndexingService.index(
+        execution_source="tool",
+        chunking_config=ChunkingConfig(chunk_size=512, chunk_overlap=64),
+        file_info=FileInfo(file_path="lease.pdf", file_hash="hash-1"),
+        instance_identifiers=InstanceIdentifiers(
+            embedding_instance_id="embedding-1",
+            vector_db_instance_id="vector-db-1",
+            x2text_instance_id="x2text-1",
+            llm_instance_id="llm-1",
+            tool_id="tool-1",
+        ),
+        processing_options=processing_options,
+        platform_key="platform-key",
+        run_id="run-1",
+        extracted_text="Monthly rent is 1250.00",
+    )
+
+
+@pytest.mark.parametrize(
+    "is_complete, reused",
+    [(True, True), (False, False), (None, False)],
+)
+def test_only_verified_complete_indexes_are_reused(index, mocker, is_complete, reused):
+    vector_db = mocker.patch.object(indexing, "VectorDB").return_value
+    vector_db.is_document_complete.return_value = is_complete
+    processing_options = ProcessingOptions(reindex=False)
+
+    assert _index(processing_options) == "doc-1"
+
+    assert index.perform_indexing.called is not reused
+    assert processing_options.reindex is not reused
+    vector_db.close.assert_called_once()
+
+
+@pytest.mark.parametrize("is_complete", [True, False])
+def test_documents_without_text_are_extracted_only_to_be_indexed(
+    index, mocker, is_complete
+):
+    vector_db = mocker.patch.object(indexing, "VectorDB").return_value
+    vector_db.is_document_complete.return_value = is_complete
+    extract_pages = mocker.patch.object(indexing.ExtractionService, "extract_pages")
+
+    IndexingService.index(
+        execution_source="tool",
+        chunking_config=ChunkingConfig(chunk_size=512, chunk_overlap=64),
+        file_info=FileInfo(file_path="EXTRACT", file_hash="hash-1"),
+        instance_identifiers=InstanceIdentifiers(
+            embedding_instance_id="embedding-1",
+            vector_db_instance_id="vector-db-1",
+            x2text_instance_id="x2text-1",
+            llm_instance_id="llm-1",
+            tool_id="tool-1",
+        ),
+        processing_options=ProcessingOptions(reindex=False),
+        platform_key="platform-key",
+        run_id="run-1",
+        extracted_text=None,
+        input_file_path="lease.pdf",
+        output_file_path="EXTRACT",
+    )
+
+    assert extract_pages.called is not is_complete
+    if not is_complete:
+        assert extract_pages.call_args.kwargs["file_path"] == "lease.pdf"
+        assert extract_pages.call_args.kwargs["output_file_path"] == "EXTRACT"
+        assert (
+            index.perform_indexing.call_args.kwargs["extracted_text"]
+            is extract_pages.return_value
+        )
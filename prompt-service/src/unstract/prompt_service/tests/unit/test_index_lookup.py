@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.prompt_service.core.index_v2 import Index
+
+
+@pytest.fixture
+def index():
+    return Index(
+        tool=MagicMock(),
+        instance_identifiers=MagicMock(vector_db_instance_id="vector-db-1"),
+        chunking_config=MagicMock(),
+        processing_options=MagicMock(reindex=False),
+    )
+
+
+@pytest.mark.parametrize("found", [True, False])
+def test_native_lookup_skips_the_similarity_query(index, found):
+    vector_db = MagicMock(**{"has_document.return_value": found})
+    embedding = MagicMock()
+
+    assert index.is_document_indexed("doc-1", embedding, vector_db) is found
+
+    vector_db.has_document.assert_called_once_with("doc-1")
+    embedding.get_query_embedding.assert_not_called()
+    vector_db.query.assert_not_called()
+
+
+def test_similarity_query_without_native_lookup(index):
+    vector_db = MagicMock(**{"has_document.return_value": None})
+    vector_db.query.return_value.nodes = [MagicMock()]
+    embedding = MagicMock()
+
+    assert index.is_document_indexed("doc-1", embedding, vector_db) is True
+
+    embedding.get_query_embedding.assert_called_once_with(" ")
+    assert vector_db.query.call_args.kwargs["query"].doc_ids == ["doc-1"]
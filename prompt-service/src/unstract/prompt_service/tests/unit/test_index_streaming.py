@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.prompt_service.core import index_v2
+from unstract.prompt_service.core.index_v2 import Index
+from unstract.prompt_service.dto import ChunkingConfig, ProcessingOptions
+from unstract.prompt_service.exceptions import ExtractionError
+from unstract.sdk1.exceptions import SdkError
+
+
+@pytest.fixture
+def index(mocker, monkeypatch):
+    monkeypatch.setenv("INDEX_STREAMING_BATCH_PAGES", "10")
+    mocker.patch.object(index_v2, "KeywordIndexStore")
+    return Index(
+        tool=MagicMock(),
+        instance_identifiers=MagicMock(vector_db_instance_id="vector-db-1"),
+        chunking_config=ChunkingConfig(chunk_size=512, chunk_overlap=0),
+        processing_options=ProcessingOptions(reindex=True),
+    )
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def vector_db(events):
+    def index_document_batches(document_batches, **kwargs):
+        for documents in document_batches:
+            events.append(f"indexed {len(documents)}")
+
+    vector_db = MagicMock()
+    vector_db.get_vector_db.return_value = MagicMock()
+    vector_db.index_document_batches.side_effect = index_document_batches
+    vector_db.delete.side_effect = lambda ref_doc_id: events.append("deleted")
+    return vector_db
+
+
+def _pages(events, count):
+    for page in range(1, count + 1):
+        events.append(f"page {page}")
+        yield f"Unit {page} rent 1250.00"
+
+
+def test_pages_are_indexed_while_extracted(index, vector_db, events):
+    index.perform_indexing(
+        vector_db=vector_db,
+        doc_id="doc-1",
+        extracted_text=_pages(events, 25),
+        doc_id_found=True,
+    )
+
+    assert events.index("deleted") < events.index("indexed 1")
+    assert events.index("indexed 1") < events.index("page 11")
+    assert events.count("indexed 1") == 3
+    vector_db.index_document.assert_not_called()
+    keyword_index = index_v2.KeywordIndexStore.save.call_args.args[2]
+    assert len(keyword_index.chunks) == 3
+
+
+def test_nodes_are_kept_without_text(index, vector_db, events):
+    with pytest.raises(SdkError, match="No text available to index"):
+        index.perform_indexing(
+            vector_db=vector_db,
+            doc_id="doc-1",
+            extracted_text=iter(["", ""]),
+            doc_id_found=True,
+        )
+
+    assert "deleted" not in events
+
+
+def test_extraction_errors_are_raised_as_is(index, vector_db, events):
+    def pages():
+        yield "Unit 1 rent 1250.00"
+        raise ExtractionError("File not found", code=404)
+
+    with pytest.raises(ExtractionError) as e:
+        index.perform_indexing(
+            vector_db=vector_db,
+            doc_id="doc-1",
+            extracted_text=pages(),
+            doc_id_found=False,
+        )
+
+    assert e.value.code == 404
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.prompt_service.core.chunk_cache import ChunkCache
+from unstract.prompt_service.core.keyword_index import BM25Index, KeywordIndexStore
+from unstract.prompt_service.core.retrievers.keyword_table import KeywordTableRetriever
+from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk1.vector_db import VectorDB
+
+CHUNKS = [
+    "Unit 101 is leased to Acme Corp. Monthly rent is 1250.00.",
+    "The security deposit for unit 101 is 2500.00.",
+    "Parking spaces are assigned by the property manager.",
+]
+
+
+@pytest.fixture
+def fs_instance(monkeypatch, tmp_path):
+    monkeypatch.setenv("KEYWORD_INDEX_DIR", str(tmp_path / "keyword-index"))
+    KeywordIndexStore.clear_cache()
+    ChunkCache.clear()
+    yield FileStorage(FileStorageProvider.LOCAL)
+    KeywordIndexStore.clear_cache()
+    ChunkCache.clear()
+
+
+def _retriever(fs_instance, vector_db, prompt="security deposit"):
+    return KeywordTableRetriever(
+        vector_db=vector_db,
+        prompt=prompt,
+        doc_id="doc-1",
+        top_k=1,
+        fs_instance=fs_instance,
+    )
+
+
+def test_bm25_ranks_matching_chunks_first():
+    index = BM25Index.build(CHUNKS)
+
+    assert index.search("What is the security deposit?", 1) == [CHUNKS[1]]
+    assert index.search("parking manager", 2)[0] == CHUNKS[2]
+    assert index.search("elevator", 2) == []
+    restored = BM25Index.from_dict(index.to_dict())
+    assert restored.search("monthly rent", 1) == [CHUNKS[0]]
+
+
+def test_retrieval_uses_persisted_index(fs_instance):
+    KeywordIndexStore.save(fs_instance, "doc-1", BM25Index.build(CHUNKS))
+    KeywordIndexStore.clear_cache()
+    vector_db = MagicMock()
+
+    assert _retriever(fs_instance, vector_db).retrieve() == {CHUNKS[1]}
+    vector_db.get_vector_store_index.assert_not_called()
+
+
+def test_missing_index_is_built_from_vector_db(fs_instance):
+    nodes = [
+        MagicMock(embedding=None, **{"get_content.return_value": chunk})
+        for chunk in CHUNKS
+    ]
+    vector_db = MagicMock()
+    vector_db.get_document_nodes.return_value = nodes
+
+    assert _retriever(fs_instance, vector_db).retrieve() == {CHUNKS[1]}
+    KeywordIndexStore.clear_cache()
+    assert _retriever(fs_instance, MagicMock(), "parking").retrieve() == {CHUNKS[2]}
+    vector_db.get_document_nodes.assert_called_once_with("doc-1")
+
+
+def test_index_of_capped_nodes_is_not_stored(fs_instance, monkeypatch):
+    monkeypatch.setattr(VectorDB, "MAX_DOCUMENT_NODES", len(CHUNKS))
+    vector_db = MagicMock()
+    vector_db.get_document_nodes.return_value = [
+        MagicMock(embedding=None, **{"get_content.return_value": chunk})
+        for chunk in CHUNKS
+    ]
+
+    assert _retriever(fs_instance, vector_db).retrieve() == {CHUNKS[1]}
+    KeywordIndexStore.clear_cache()
+    assert KeywordIndexStore.load(fs_instance, "doc-1") is None
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import time
+from unittest.mock import MagicMock
+
+import fitz
+import pytest
+from unstract.prompt_service.services import page_images
+from unstract.prompt_service.services.page_images import PageImageService
+
+
+def _pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for page_number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Unit {page_number + 1} rent 1250.00")
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+@pytest.fixture
+def rendered_pages(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("VISION_PAGE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("VISION_RENDER_DPI", "30")
+    monkeypatch.setenv("VISION_RENDER_WORKERS", "1")
+    render = mocker.spy(page_images, "_render_pages")
+    return render
+
+
+def test_pages_are_rendered_once(rendered_pages, monkeypatch):
+    monkeypatch.setenv("VISION_PAGE_CACHE_BACKEND", "local")
+    file_bytes = _pdf(3)
+
+    first = PageImageService.get_base64_images(file_bytes)
+    second = PageImageService.get_base64_images(file_bytes)
+
+    assert len(first) == 3
+    assert first == second
+    assert first[0].startswith("data:image/png;base64,")
+    assert rendered_pages.call_count == 1
+    assert rendered_pages.call_args.args[1] == [0, 1, 2]
+
+
+def test_storage_backend_uses_file_storage(rendered_pages, monkeypatch):
+    monkeypatch.setenv("VISION_PAGE_CACHE_BACKEND", "storage")
+    files: dict[str, bytes] = {}
+    fs_instance = MagicMock()
+    fs_instance.exists.side_effect = lambda path: path in files
+    fs_instance.read.side_effect = lambda path, mode: files[path]
+    fs_instance.write.side_effect = lambda path, mode, data: files.update({path: data})
+    file_bytes = _pdf(2)
+
+    first = PageImageService.get_page_images(file_bytes, fs_instance=fs_instance)
+    second = PageImageService.get_page_images(file_bytes, fs_instance=fs_instance)
+
+    assert first == second
+    assert len(files) == 2
+    assert all(path.endswith(("/30/0.png", "/30/1.png")) for path in files)
+    assert rendered_pages.call_count == 1
+
+
+def test_parallel_rendering_keeps_page_order(monkeypatch):
+    monkeypatch.setenv("VISION_PAGE_CACHE_BACKEND", "none")
+    monkeypatch.setenv("VISION_RENDER_DPI", "30")
+    file_bytes = _pdf(5)
+    monkeypatch.setenv("VISION_RENDER_WORKERS", "1")
+    serial = PageImageService.get_page_images(file_bytes)
+
+    monkeypatch.setenv("VISION_RENDER_WORKERS", "2")
+    monkeypatch.setenv("VISION_RENDER_PARALLEL_MIN_PAGES", "2")
+    parallel = PageImageService.get_page_images(file_bytes)
+
+    assert parallel == serial
+
+
+def test_local_cache_evicts_expired_and_least_recently_used_documents(
+    rendered_pages, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("VISION_PAGE_CACHE_BACKEND", "local")
+    monkeypatch.setenv("VISION_PAGE_CACHE_TTL", "3600")
+    cache_dir = tmp_path / "cache"
+    lease, rent_roll, invoice = _pdf(1), _pdf(2), _pdf(3)
+    PageImageService.get_page_images(lease)
+    PageImageService.get_page_images(rent_roll)
+    day_ago = time.time() - 86400
+    os.utime(cache_dir / hashlib.sha256(lease).hexdigest(), (day_ago, day_ago))
+
+    PageImageService.get_page_images(invoice)
+
+    assert {path.name for path in cache_dir.iterdir()} == {
+        hashlib.sha256(rent_roll).hexdigest(),
+        hashlib.sha256(invoice).hexdigest(),
+    }
+
+    monkeypatch.setenv("VISION_PAGE_CACHE_MAX_SIZE_MB", "0")
+    PageImageService.get_page_images(lease)
+
+    assert {path.name for path in cache_dir.iterdir()} == {
+        hashlib.sha256(lease).hexdigest()
+    }
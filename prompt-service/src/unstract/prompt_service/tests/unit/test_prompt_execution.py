@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+from flask import Flask
+from unstract.prompt_service.services.prompt_execution import PromptExecutionService
+
+
+@pytest.fixture
+def app_context():
+    app = Flask(__name__)
+    with app.app_context():
+        yield
+
+
+def _prompts(*prompts: tuple[str, str], prompt_type: str = "text") -> list[dict]:
+    return [{"name": name, "prompt": text, "type": prompt_type} for name, text in prompts]
+
+
+def test_dependencies_from_variables(app_context):
+    prompts = _prompts(
+        ("invoice_no", "What is the invoice number?"),
+        ("total", "Total for invoice %invoice_no%"),
+        ("vendor", "Vendor of {{invoice_no}} and {{custom_data.region}}"),
+        ("summary", "Summarize %total% for {{vendor}}"),
+    )
+    names = [prompt["name"] for prompt in prompts]
+
+    dependencies = PromptExecutionService.get_dependencies(prompts, names)
+
+    assert dependencies == [set(), {0}, {0}, {1, 2}]
+    assert PromptExecutionService.can_run_concurrently(prompts, dependencies, {})
+
+
+def test_forward_reference_and_table_run_serially(app_context):
+    prompts = _prompts(("first", "Uses %second%"), ("second", "Plain"))
+    names = [prompt["name"] for prompt in prompts]
+    dependencies = PromptExecutionService.get_dependencies(prompts, names)
+    assert not PromptExecutionService.can_run_concurrently(prompts, dependencies, {})
+
+    tables = _prompts(("rows", "Extract rows"), prompt_type="table")
+    assert not PromptExecutionService.can_run_concurrently(tables, [set()], {})
+
+
+@pytest.mark.parametrize(
+    "requested,expected", [(None, 1), (2, 2), ("3", 3), (100, 4), ("bad", 1)]
+)
+def test_max_workers_is_capped(monkeypatch, requested, expected):
+    monkeypatch.setenv("PROMPT_CONCURRENCY_LIMIT", "4")
+    monkeypatch.setenv("PROMPT_CONCURRENCY_DEFAULT", "1")
+    tool_settings = {"prompt_concurrency": requested}
+    assert PromptExecutionService.get_max_workers(tool_settings) == expected
+
+
+def test_max_workers_defaults_to_env(monkeypatch):
+    monkeypatch.setenv("PROMPT_CONCURRENCY_LIMIT", "4")
+    monkeypatch.setenv("PROMPT_CONCURRENCY_DEFAULT", "3")
+
+    assert PromptExecutionService.get_max_workers({}) == 3
+    assert PromptExecutionService.get_max_workers({"prompt_concurrency": 2}) == 2
+    monkeypatch.setenv("PROMPT_CONCURRENCY_DEFAULT", "8")
+    assert PromptExecutionService.get_max_workers({}) == 4
+
+
+def test_run_concurrently_honours_dependencies_and_order(app_context):
+    prompts = _prompts(
+        ("a", "A"), ("b", "B from %a%"), ("c", "C"), ("d", "D from %b% and %c%")
+    )
+    names = [prompt["name"] for prompt in prompts]
+    dependencies = PromptExecutionService.get_dependencies(prompts, names)
+    structured_output: dict[str, Any] = {}
+    active = []
+    lock = threading.Lock()
+
+    def execute(prompt: dict[str, Any]) -> None:
+        index = names.index(prompt["name"])
+        assert all(names[dep] in structured_output for dep in dependencies[index])
+        with lock:
+            active.append(prompt["name"])
+        time.sleep(0.05 if prompt["name"] in ("a", "c") else 0.01)
+        structured_output[prompt["name"]] = prompt["name"].upper()
+
+    PromptExecutionService.run_concurrently(prompts, dependencies, execute, 2)
+    metadata = {"context": {"d": [], "c": [], "a": [], "b": []}}
+    PromptExecutionService.restore_prompt_order(names, structured_output, metadata, {})
+
+    assert active[:2] in (["a", "c"], ["c", "a"])
+    assert list(structured_output) == names
+    assert list(metadata["context"]) == names
+
+
+def test_run_concurrently_raises_earliest_failure(app_context):
+    prompts = _prompts(("a", "A"), ("b", "B"), ("c", "C from %a%"))
+    names = [prompt["name"] for prompt in prompts]
+    dependencies = PromptExecutionService.get_dependencies(prompts, names)
+    executed = []
+
+    def execute(prompt: dict[str, Any]) -> None:
+        executed.append(prompt["name"])
+        if prompt["name"] == "a":
+            raise ValueError("failed a")
+
+    with pytest.raises(ValueError, match="failed a"):
+        PromptExecutionService.run_concurrently(prompts, dependencies, execute, 2)
+    assert "c" not in executed
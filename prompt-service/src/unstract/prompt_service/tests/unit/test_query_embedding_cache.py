@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
+from unstract.prompt_service.core.query_embedding_cache import QueryEmbeddingCache
+from unstract.prompt_service.core.retrievers.simple import SimpleRetriever
+from unstract.prompt_service.services.retrieval import RetrievalService
+
+
+def _embed(queries: list[str]) -> list[list[float]]:
+    return [[float(len(query)), 1.0] for query in queries]
+
+
+def _vector_db(config_hash: str | None = "config-1") -> MagicMock:
+    vector_db = MagicMock()
+    vector_db.get_embedding_config_hash.return_value = config_hash
+    vector_db.get_query_embeddings.side_effect = _embed
+    vector_db.get_query_embedding.side_effect = lambda query: _embed([query])[0]
+    return vector_db
+
+
+def _prompt(prompt: str, **settings) -> dict:
+    return {
+        PSKeys.NAME: prompt.split()[0].lower(),
+        PSKeys.PROMPT: prompt,
+        PSKeys.TYPE: PSKeys.TEXT,
+        PSKeys.CHUNK_SIZE: 512,
+        PSKeys.RETRIEVAL_STRATEGY: "simple",
+        PSKeys.VECTOR_DB: "vector-db-1",
+        PSKeys.EMBEDDING: "embedding-1",
+        **settings,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    QueryEmbeddingCache.clear()
+    yield
+    QueryEmbeddingCache.clear()
+
+
+def test_warm_embeds_misses_in_a_single_batch():
+    vector_db = _vector_db()
+    QueryEmbeddingCache.get(vector_db, "rent")
+
+    embedded = QueryEmbeddingCache.warm(
+        vector_db, ["rent", "tenant", "deposit", "tenant"]
+    )
+
+    assert embedded == 2
+    vector_db.get_query_embeddings.assert_called_once_with(["tenant", "deposit"])
+    assert QueryEmbeddingCache.get(vector_db, "deposit") == [7.0, 1.0]
+    assert vector_db.get_query_embedding.call_count == 1
+    # Another embedding config doesn't reuse the vectors
+    other = _vector_db(config_hash="config-2")
+    QueryEmbeddingCache.get(other, "deposit")
+    other.get_query_embedding.assert_called_once_with("deposit")
+
+
+def test_cache_is_skipped_without_config_hash_or_size(monkeypatch):
+    vector_db = _vector_db(config_hash=None)
+    assert QueryEmbeddingCache.warm(vector_db, ["rent"]) == 0
+    QueryEmbeddingCache.get(vector_db, "rent")
+    QueryEmbeddingCache.get(vector_db, "rent")
+    assert vector_db.get_query_embedding.call_count == 2
+
+    monkeypatch.setenv("QUERY_EMBEDDING_CACHE_SIZE", "0")
+    vector_db = _vector_db()
+    assert QueryEmbeddingCache.warm(vector_db, ["rent"]) == 0
+    vector_db.get_query_embeddings.assert_not_called()
+
+
+def test_embed_queries_batches_prompts_known_upfront():
+    vector_db = _vector_db()
+    adapters = MagicMock(**{"get_vector_db.return_value": vector_db})
+    prompts = [
+        _prompt("Tenant name"),
+        _prompt("Deposit amount", **{PSKeys.RETRIEVAL_STRATEGY: "hybrid"}),
+        _prompt("Rent of %tenant%"),
+        _prompt("Unit table", **{PSKeys.TYPE: PSKeys.TABLE}),
+        _prompt("Lease text", **{PSKeys.CHUNK_SIZE: 0}),
+        _prompt("Landlord", **{PSKeys.RETRIEVAL_STRATEGY: "keyword_table"}),
+    ]
+
+    RetrievalService.embed_queries(
+        prompts=prompts,
+        variable_names=[prompt[PSKeys.NAME] for prompt in prompts],
+        tool_settings={},
+        adapters=adapters,
+        usage_kwargs={"run_id": "run-1"},
+    )
+
+    vector_db.get_query_embeddings.assert_called_once_with(
+        ["Tenant name", "Deposit amount"]
+    )
+    adapters.get_vector_db.assert_called_once_with(
+        adapter_instance_id="vector-db-1",
+        embedding_instance_id="embedding-1",
+        usage_kwargs={"run_id": "run-1"},
+    )
+
+
+def test_retrieval_queries_the_vector_db_with_the_cached_embedding(monkeypatch):
+    monkeypatch.setenv("CHUNK_CACHE_SIZE", "0")
+    vector_db = _vector_db()
+    QueryEmbeddingCache.warm(vector_db, ["rent"])
+    node = MagicMock(score=0.5, **{"get_content.return_value": "Rent is 1250.00"})
+    retriever = vector_db.get_vector_store_index.return_value.as_retriever.return_value
+    retriever.retrieve.return_value = [node]
+
+    context = SimpleRetriever(
+        vector_db=vector_db, prompt="rent", doc_id="doc-1", top_k=1
+    ).retrieve()
+
+    assert context == {"Rent is 1250.00"}
+    query_bundle = retriever.retrieve.call_args.args[0]
+    assert query_bundle.query_str == "rent"
+    assert query_bundle.embedding == [4.0, 1.0]
+    vector_db.get_query_embedding.assert_not_called()
@@ -0,0 +1,99 @@
+import pytest
+from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
+from unstract.prompt_service.services.type_coercion import TypeCoercionService
+
+
+@pytest.mark.parametrize(
+    ("answer", "expected"),
+    [
+        ("1250", 1250.0),
+        ("$1,250.50.", 1250.5),
+        ("-1,250.00 USD", -1250.0),
+        ("1,250", None),
+        ("1.250", None),
+        ("1,250,000", 1250000.0),
+        ("The monthly rent is $1,250.50.", None),
+        ("1.250.000,75 €", 1250000.75),
+        ("1 250,5", None),
+        ("3,5", 3.5),
+        ("$2.3 million", 2300000.0),
+        ("12k", 12000.0),
+        ("(1,200.00)", -1200.0),
+        ("12%", 12.0),
+        ("2 units at 1,250", None),
+        ("not mentioned", None),
+        ("Unit B-12 rent is unknown", None),
+        ("COVID-19", None),
+        ("Net-30 payment terms", None),
+        ("The value is 3 and a half", None),
+    ],
+)
+def test_parse_number(answer, expected):
+    assert TypeCoercionService.parse_number(answer) == expected
+
+
+@pytest.mark.parametrize(
+    ("answer", "expected"),
+    [
+        ("2024-03-15", "2024-03-15"),
+        ("2024-03-15T10:30:00", "2024-03-15T10:30:00"),
+        ("The lease starts on March 15th, 2024.", "2024-03-15"),
+        ("15. März 2024", "2024-03-15"),
+        ("15 de marzo de 2024", "2024-03-15"),
+        ("15/03/2024", "2024-03-15"),
+        ("03/15/2024", "2024-03-15"),
+        ("03.04.2024", "2024-04-03"),
+        ("03/04/2024", None),
+        ("From 1 March 2024 to 28 February 2025", None),
+        ("31/02/2024", None),
+        ("Unit 15 2024", None),
+    ],
+)
+def test_parse_date(answer, expected):
+    assert TypeCoercionService.parse_date(answer) == expected
+
+
+@pytest.mark.parametrize(
+    ("answer", "expected"),
+    [
+        ("Contact: Jane.Doe@example.co.uk.", "Jane.Doe@example.co.uk"),
+        ("jane@example.com or JANE@example.com", "jane@example.com"),
+        ("jane@example.com, bob@example.com", None),
+        ("no email", None),
+    ],
+)
+def test_parse_email(answer, expected):
+    assert TypeCoercionService.parse_email(answer) == expected
+
+
+@pytest.mark.parametrize(
+    ("answer", "expected"),
+    [
+        ("Yes", True),
+        ("No.", False),
+        ("True", True),
+        ("N", False),
+        ("Sí", True),
+        ("N/A", None),
+        ("The lease allows pets", None),
+        ("No, pets are not allowed.", None),
+        ("no idea", None),
+        ("Non-refundable deposit", None),
+    ],
+)
+def test_parse_boolean(answer, expected):
+    assert TypeCoercionService.parse_boolean(answer) is expected
+
+
+def test_coerce_counts_fast_path(monkeypatch):
+    TypeCoercionService.reset_stats()
+
+    assert TypeCoercionService.coerce(PSKeys.NUMBER, "1,250.00") == 1250.0
+    assert TypeCoercionService.coerce(PSKeys.NUMBER, "1 or 2") is None
+    monkeypatch.setenv("TYPE_COERCION_FAST_PATH", "false")
+    assert TypeCoercionService.coerce(PSKeys.BOOLEAN, "yes") is None
+
+    assert TypeCoercionService.get_stats() == {
+        PSKeys.NUMBER: {"fast_path": 1, "llm": 1},
+        PSKeys.BOOLEAN: {"fast_path": 0, "llm": 1},
+    }
@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from unstract.prompt_service.services import vision_table_extraction
+from unstract.prompt_service.services.vision_table_extraction import (
+    VisionTableExtractionService,
+)
+
+
+@pytest.fixture
+def document(mocker, monkeypatch):
+    monkeypatch.setenv("VISION_WINDOW_PAGES", "4")
+    monkeypatch.setenv("VISION_WINDOW_OVERLAP", "1")
+    monkeypatch.setenv("VISION_CONCURRENCY_LIMIT", "4")
+    mocker.patch.object(
+        VisionTableExtractionService,
+        "_pdf_to_base64_images",
+        return_value=[f"page-{number}" for number in range(1, 11)],
+    )
+    fs_instance = MagicMock()
+    fs_instance.read.return_value = b"%PDF"
+    return fs_instance
+
+
+def _rows(messages):
+    """Answers with one row per page image, as a vision LLM would."""
+    pages = [
+        int(part["image_url"]["url"].removeprefix("page-"))
+        for part in messages[1]["content"]
+        if part["type"] == "image_url"
+    ]
+    rows = [{"unit": str(page), "rent": "1250.00 ", "_page": page} for page in pages]
+    return {"choices": [{"message": {"content": json.dumps(rows)}}]}
+
+
+def test_windows_overlap(monkeypatch):
+    assert VisionTableExtractionService._get_windows(10) == [(0, 10)]
+    monkeypatch.setenv("VISION_WINDOW_PAGES", "4")
+    assert VisionTableExtractionService._get_windows(3) == [(0, 3)]
+    assert VisionTableExtractionService._get_windows(10) == [(0, 4), (3, 7), (6, 10)]
+
+
+def test_single_window_sends_all_pages(document, mocker, monkeypatch):
+    monkeypatch.setenv("VISION_WINDOW_PAGES", "0")
+    completion = mocker.patch.object(
+        vision_table_extraction.litellm,
+        "completion",
+        side_effect=lambda messages, **kwargs: _rows(messages),
+    )
+
+    rows = VisionTableExtractionService.run(
+        "rent_roll.pdf", document, MagicMock(kwargs={}), "Extract units", {}, "tool"
+    )
+
+    assert completion.call_count == 1
+    assert [row["unit"] for row in rows] == [str(page) for page in range(1, 11)]
+
+
+def test_windows_run_concurrently_and_merge(document, mocker):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def completion(messages, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return _rows(messages)
+
+    mocker.patch.object(
+        vision_table_extraction.litellm, "completion", side_effect=completion
+    )
+
+    rows = VisionTableExtractionService.run(
+        "rent_roll.pdf", document, MagicMock(kwargs={}), "Extract units", {}, "tool"
+    )
+
+    assert rows == [{"unit": str(page), "rent": "1250.00 "} for page in range(1, 11)]
+    assert peak == 3
+
+
+def test_merge_only_drops_rows_repeated_on_the_overlap():
+    windows = [(0, 4), (3, 7)]
+    rent = {"unit": "A", "rent": "1250.00"}
+    merged = VisionTableExtractionService._merge_results(
+        [
+            [{**rent, "_page": 1}, {**rent, "_page": 4}],
+            [{**rent, "_page": 4}, {**rent, "_page": 6}, {"unit": "B"}],
+        ],
+        windows,
+    )
+
+    assert merged == [rent, rent, rent, {"unit": "B"}]
+
+
+def test_merge_keeps_rows_repeated_within_a_window():
+    merged = VisionTableExtractionService._merge_results(
+        [
+            {
+                "charges": [{"code": "RENT", "_page": 4}, {"code": "RENT", "_page": 4}],
+                "property": "Elm",
+            },
+            {
+                "charges": [{"code": "RENT", "_page": 4}, {"code": "PARK", "_page": 5}],
+                "property": None,
+            },
+        ],
+        [(0, 4), (3, 7)],
+    )
+
+    assert merged == {
+        "charges": [{"code": "RENT"}, {"code": "RENT"}, {"code": "PARK"}],
+        "property": "Elm",
+    }
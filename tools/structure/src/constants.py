@@ -41,6 +41,8 @@ class SettingsKeys:
     TOOL_ID = "tool_id"
     # PDF_TO_TEXT_CONVERTER = "pdf-to-text-converters"
     REINDEX = "reindex"
+    INCREMENTAL_INDEXING = "INCREMENTAL_INDEXING"
+    INDEX_STREAMING_ENABLED = "INDEX_STREAMING_ENABLED"
     STRUCTURE_OUTPUT = "structure_output"
     TOOL_SETTINGS = "tool_settings"
     ENABLE_SINGLE_PASS_EXTRACTION = "enable_single_pass_extraction"
@@ -95,6 +97,7 @@ class IndexingConstants:
     REINDEX = "reindex"
     FILE_HASH = "file_hash"
     OUTPUT_FILE_PATH = "output_file_path"
+    INPUT_FILE_PATH = "input_file_path"
     ENABLE_HIGHLIGHT = "enable_highlight"
     USAGE_KWARGS = "usage_kwargs"
     PROCESS_TEXT = "process_text"
@@ -63,7 +63,13 @@ class StructureToolHelper:
         file_hash: str | None = None,
         tool_id: str = None,
         extracted_text: str = None,
+        input_file_path: str | None = None,
     ) -> str:
+        """Indexes a document through prompt-service, returning its doc_id.
+
+        Without `extracted_text`, prompt-service extracts the document at
+        `input_file_path` into `file_path` while it's indexed.
+        """
         x2text = tool_settings[SettingsKeys.X2TEXT_ADAPTER]
 
         payload = {
@@ -85,6 +91,9 @@ class StructureToolHelper:
             IKeys.EXECUTION_DATA_DIR: str(execution_run_data_folder),
             IKeys.EXTRACTED_TEXT: extracted_text,
         }
+        if not extracted_text and input_file_path:
+            payload[IKeys.INPUT_FILE_PATH] = str(input_file_path)
+            payload[IKeys.OUTPUT_FILE_PATH] = str(file_path)
 
         sensitive_keys = [IKeys.EXTRACTED_TEXT]
         payload_to_log = {k: v for k, v in payload.items() if k not in sensitive_keys}
@@ -15,6 +15,7 @@ from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.prompt import PromptTool
 from unstract.sdk1.tool.base import BaseTool
 from unstract.sdk1.tool.entrypoint import ToolEntrypoint
+from unstract.sdk1.utils.common import Utils
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +169,12 @@ class StructureTool(BaseTool):
         )
         challenge_llm: str = settings.get(SettingsKeys.CHALLENGE_LLM_ADAPTER_ID, "")
         is_highlight_enabled: bool = settings.get(SettingsKeys.ENABLE_HIGHLIGHT, False)
+        is_incremental_indexing: bool = Utils.str_to_bool(
+            os.environ.get(SettingsKeys.INCREMENTAL_INDEXING, "False")
+        )
+        is_index_streaming: bool = Utils.str_to_bool(
+            os.environ.get(SettingsKeys.INDEX_STREAMING_ENABLED, "False")
+        )
         responder: PromptTool = PromptTool(
             tool=self,
             prompt_port=self.get_env_or_die(SettingsKeys.PROMPT_PORT),
@@ -317,18 +324,21 @@ class StructureTool(BaseTool):
             input_file, outputs
         )
 
+        # Documents can be extracted by prompt-service while they're indexed,
+        # unless the complete text or its highlight metadata is needed first
+        is_extracted_while_indexed = (
+            is_index_streaming
+            and not skip_extraction_and_indexing
+            and not is_summarization_enabled
+            and not is_single_pass_enabled
+            and not is_highlight_enabled
+        )
+
         extracted_text = ""
         usage_kwargs: dict[Any, Any] = dict()
-        if skip_extraction_and_indexing:
-            self.stream_log(
-                "Skipping extraction and indexing for Excel table with valid JSON schema"
-            )
-        else:
-            self.stream_log(f"Extracting document '{self.source_file_name}'")
-            usage_kwargs[UsageKwargs.RUN_ID] = self.file_execution_id
-            usage_kwargs[UsageKwargs.FILE_NAME] = self.source_file_name
-            usage_kwargs[UsageKwargs.EXECUTION_ID] = self.execution_id
-            extracted_text = STHelper.dynamic_extraction(
+
+        def extract_text() -> str:
+            return STHelper.dynamic_extraction(
                 file_path=input_file,
                 enable_highlight=is_highlight_enabled,
                 usage_kwargs=usage_kwargs,
@@ -339,6 +349,22 @@ class StructureTool(BaseTool):
                 execution_run_data_folder=str(execution_run_data_folder),
             )
 
+        if skip_extraction_and_indexing:
+            self.stream_log(
+                "Skipping extraction and indexing for Excel table with valid JSON schema"
+            )
+        else:
+            usage_kwargs[UsageKwargs.RUN_ID] = self.file_execution_id
+            usage_kwargs[UsageKwargs.FILE_NAME] = self.source_file_name
+            usage_kwargs[UsageKwargs.EXECUTION_ID] = self.execution_id
+            if is_extracted_while_indexed:
+                self.stream_log(
+                    f"Extracting document '{self.source_file_name}' while indexing it"
+                )
+            else:
+                self.stream_log(f"Extracting document '{self.source_file_name}'")
+                extracted_text = extract_text()
+
         index_metrics = {}
         if is_summarization_enabled:
             summarize_file_path, summarize_file_hash = self._summarize(
@@ -378,6 +404,11 @@ class StructureTool(BaseTool):
                 # Only process if we haven't seen this combination yet and chunk_size is not zero
                 if chunk_size != 0 and param_key not in seen_params:
                     seen_params.add(param_key)
+                    # In incremental mode a complete index for the same doc_id
+                    # is reused unless the profile asks to always re-index
+                    reindex = not is_incremental_indexing or output.get(
+                        SettingsKeys.REINDEX, False
+                    )
 
                     indexing_start_time = datetime.datetime.now()
                     self.stream_log(
@@ -393,14 +424,21 @@ class StructureTool(BaseTool):
                         tool=self,
                         execution_run_data_folder=str(execution_run_data_folder),
                         chunk_overlap=chunk_overlap,
-                        reindex=True,
+                        reindex=reindex,
                         usage_kwargs=usage_kwargs,
                         enable_highlight=is_highlight_enabled,
                         chunk_size=chunk_size,
                         tool_id=tool_metadata[SettingsKeys.TOOL_ID],
                         file_hash=file_hash,
                         extracted_text=extracted_text,
+                        input_file_path=(
+                            input_file if is_extracted_while_indexed else None
+                        ),
                     )
+                    if is_extracted_while_indexed and not extracted_text:
+                        extracted_text = self._read_extracted_text(
+                            tool_data_dir / SettingsKeys.EXTRACT
+                        )
 
                     index_metrics[output[SettingsKeys.NAME]] = {
                         SettingsKeys.INDEXING: {
@@ -410,6 +448,11 @@ class StructureTool(BaseTool):
                         }
                     }
 
+        if is_extracted_while_indexed and not extracted_text:
+            # Nothing was indexed, e.g. as complete indexes were reused
+            self.stream_log(f"Extracting document '{self.source_file_name}'")
+            extracted_text = extract_text()
+
         if is_single_pass_enabled:
             self.stream_log("Fetching response for single pass extraction...")
             structured_output = responder.single_pass_extraction(
@@ -697,6 +740,12 @@ class StructureTool(BaseTool):
         except Exception as e:
             self.stream_error_and_exit(f"Error during agentic extraction: {e}")
 
+    def _read_extracted_text(self, extract_file_path: Path) -> str:
+        """Returns the text prompt-service extracted while indexing, if any."""
+        if not self.workflow_filestorage.exists(extract_file_path):
+            return ""
+        return self.workflow_filestorage.read(path=extract_file_path, mode="r")
+
     def _summarize(
         self,
         tool_settings: dict[str, Any],
@@ -129,3 +129,8 @@ class FilePatternConstants:
                 return patterns
 
         return None
+
+
+# Redis channel on which changes to the platform keys of an organization are
+# published, see `unstract.core.flask.token_resolver`
+PLATFORM_KEY_INVALIDATION_CHANNEL = "platform_key_invalidation"
@@ -1,3 +1,4 @@
 from .exceptions import register_error_handlers  # noqa: F401
 from .middleware import register_request_id_middleware  # noqa: F401
 from .plugin import PluginManager, plugin_loader  # noqa: F401
+from .token_resolver import PlatformKeyInfo, PlatformKeyResolver  # noqa: F401
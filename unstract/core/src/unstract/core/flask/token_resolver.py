@@ -0,0 +1,166 @@
+"""Cached resolution of platform keys for Flask services.
+
+Services authenticate calls from tools with a platform key and look up the
+organization it belongs to. `PlatformKeyResolver` caches that lookup in-process
+so that authenticated calls don't hit Postgres, and drops cached keys when the
+backend publishes a change on `PLATFORM_KEY_INVALIDATION_CHANNEL`.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import redis
+
+from unstract.core.constants import PLATFORM_KEY_INVALIDATION_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PlatformKeyInfo:
+    is_active: bool
+    organization_uid: int | None
+    organization_identifier: str | None
+
+
+class PlatformKeyResolver:
+    """In-process TTL cache of platform key -> `PlatformKeyInfo`.
+
+    Unknown keys are cached as well (negative caching) for a shorter TTL, so
+    that calls with an invalid key don't reach the DB on every request. When a
+    Redis client is provided, a listener thread subscribes to
+    `PLATFORM_KEY_INVALIDATION_CHANNEL` and drops the keys of an organization
+    whose platform keys were toggled, rotated or deleted. Messages are JSON
+    objects like `{"organization_uid": 1}`, a null uid drops all keys. The TTL
+    bounds how long a change can go unnoticed while the listener is
+    disconnected.
+
+    Configurable via environment variables:
+    - PLATFORM_KEY_CACHE_TTL (default: 60s, 0 disables the cache)
+    - PLATFORM_KEY_CACHE_NEGATIVE_TTL (default: 10s)
+    - PLATFORM_KEY_CACHE_MAX_SIZE (default: 1024 keys)
+    """
+
+    DEFAULT_TTL = 60
+    DEFAULT_NEGATIVE_TTL = 10
+    DEFAULT_MAX_SIZE = 1024
+    RECONNECT_DELAY = 5
+
+    def __init__(
+        self,
+        fetch: Callable[[str], PlatformKeyInfo | None],
+        get_redis_client: Callable[[], redis.Redis] | None = None,
+    ) -> None:
+        """Initialise the resolver.
+
+        Args:
+            fetch: Looks up a platform key in the DB, None if it doesn't exist
+            get_redis_client: Returns the Redis client to listen for
+                invalidations on. The subscription holds a connection for as
+                long as the process runs, so the client shouldn't share its
+                pool with requests. Without it, entries only expire by TTL.
+        """
+        self._fetch = fetch
+        self._get_redis_client = get_redis_client
+        self.ttl = int(os.environ.get("PLATFORM_KEY_CACHE_TTL", self.DEFAULT_TTL))
+        self.negative_ttl = int(
+            os.environ.get("PLATFORM_KEY_CACHE_NEGATIVE_TTL", self.DEFAULT_NEGATIVE_TTL)
+        )
+        self.max_size = int(
+            os.environ.get("PLATFORM_KEY_CACHE_MAX_SIZE", self.DEFAULT_MAX_SIZE)
+        )
+        self._entries: OrderedDict[str, tuple[float, PlatformKeyInfo | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        # PID of the process the listener runs in, it's restarted after a fork
+        self._listener_pid: int | None = None
+
+    def resolve(self, token: str) -> PlatformKeyInfo | None:
+        """Returns the details of a platform key, None if it doesn't exist.
+
+        Raises:
+            Exception: Errors of `fetch` are raised and not cached
+        """
+        if self.ttl <= 0:
+            return self._fetch(token)
+        self._ensure_listener()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and now < entry[0]:
+                self._entries.move_to_end(token)
+                return entry[1]
+
+        info = self._fetch(token)
+        ttl = self.ttl if info is not None else self.negative_ttl
+        with self._lock:
+            self._entries[token] = (now + ttl, info)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return info
+
+    def invalidate(self, organization_uid: int | None = None) -> None:
+        """Drops the cached keys of an organization, or all keys.
+
+        Unknown keys are dropped as well, since they may have just been created.
+        """
+        with self._lock:
+            if organization_uid is None:
+                self._entries.clear()
+                return
+            for token in [
+                token
+                for token, (_, info) in self._entries.items()
+                if info is None or info.organization_uid == organization_uid
+            ]:
+                del self._entries[token]
+
+    def _ensure_listener(self) -> None:
+        if self._get_redis_client is None or self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            # Entries copied from the parent process can't be invalidated
+            self._entries.clear()
+        threading.Thread(
+            target=self._listen, name="platform-key-invalidation", daemon=True
+        ).start()
+
+    def _listen(self) -> None:
+        while True:
+            client = None
+            try:
+                client = self._get_redis_client()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(PLATFORM_KEY_INVALIDATION_CHANNEL)
+                # Changes may have been missed while disconnected
+                self.invalidate()
+                for message in pubsub.listen():
+                    self._handle_message(message)
+            except Exception as e:
+                logger.warning(
+                    f"Platform key invalidation listener disconnected: {e}, "
+                    f"reconnecting in {self.RECONNECT_DELAY}s"
+                )
+                if client is not None:
+                    client.close()
+                time.sleep(self.RECONNECT_DELAY)
+
+    def _handle_message(self, message: dict) -> None:
+        try:
+            data = json.loads(message["data"])
+            organization_uid = data.get("organization_uid")
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.warning(f"Invalid platform key invalidation message: {e}")
+            organization_uid = None
+        self.invalidate(organization_uid)
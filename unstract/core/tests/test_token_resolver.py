@@ -0,0 +1,86 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from unstract.core.constants import PLATFORM_KEY_INVALIDATION_CHANNEL
+from unstract.core.flask.token_resolver import PlatformKeyInfo, PlatformKeyResolver
+
+KEY_INFO = PlatformKeyInfo(
+    is_active=True, organization_uid=1, organization_identifier="org_1"
+)
+
+
+class PlatformKeyResolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.fetch = MagicMock(side_effect=lambda token: {"key": KEY_INFO}.get(token))
+        self.resolver = PlatformKeyResolver(fetch=self.fetch)
+
+    def test_resolve_is_cached(self):
+        self.assertEqual(self.resolver.resolve("key"), KEY_INFO)
+        self.assertEqual(self.resolver.resolve("key"), KEY_INFO)
+        self.assertIsNone(self.resolver.resolve("unknown"))
+        self.assertIsNone(self.resolver.resolve("unknown"))
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_invalidation_message_drops_organization_keys(self):
+        self.resolver.resolve("key")
+        self.resolver._handle_message({"data": json.dumps({"organization_uid": 2})})
+        self.resolver.resolve("key")
+        self.assertEqual(self.fetch.call_count, 1)
+
+        self.resolver._handle_message({"data": json.dumps({"organization_uid": 1})})
+        self.resolver.resolve("key")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_invalidation_message_drops_unknown_keys(self):
+        self.resolver.resolve("unknown")
+        self.resolver._handle_message({"data": json.dumps({"organization_uid": 2})})
+        self.resolver.resolve("unknown")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_invalidation_message_without_organization_drops_all_keys(self):
+        for data in (json.dumps({"organization_uid": None}), "not json", None):
+            self.resolver.resolve("key")
+            self.resolver._handle_message({"data": data})
+        self.assertEqual(self.fetch.call_count, 3)
+
+    @patch("unstract.core.flask.token_resolver.time.monotonic")
+    def test_entries_expire_after_ttl(self, monotonic):
+        monotonic.return_value = 100.0
+        self.resolver.resolve("key")
+        self.resolver.resolve("unknown")
+
+        monotonic.return_value += self.resolver.negative_ttl
+        self.resolver.resolve("key")
+        self.resolver.resolve("unknown")
+        self.assertEqual(self.fetch.call_count, 3)
+
+        monotonic.return_value = 100.0 + self.resolver.ttl
+        self.resolver.resolve("key")
+        self.assertEqual(self.fetch.call_count, 4)
+
+    def test_listener_drops_keys_on_subscribe_and_message(self):
+        client = MagicMock()
+        pubsub = client.pubsub.return_value
+        pubsub.listen.return_value = [{"data": json.dumps({"organization_uid": 1})}]
+        resolver = PlatformKeyResolver(
+            fetch=self.fetch,
+            get_redis_client=MagicMock(side_effect=[client, ConnectionError]),
+        )
+        resolver._entries["key"] = (float("inf"), KEY_INFO)
+        resolver._handle_message = MagicMock(wraps=resolver._handle_message)
+
+        # Stops at the delay before reconnecting, once the connection failed
+        with patch(
+            "unstract.core.flask.token_resolver.time.sleep", side_effect=StopIteration
+        ):
+            with self.assertRaises(StopIteration):
+                resolver._listen()
+
+        pubsub.subscribe.assert_called_once_with(PLATFORM_KEY_INVALIDATION_CHANNEL)
+        resolver._handle_message.assert_called_once()
+        self.assertEqual(len(resolver._entries), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
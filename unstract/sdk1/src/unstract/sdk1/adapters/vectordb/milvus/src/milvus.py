@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 from typing import TYPE_CHECKING
 
@@ -19,6 +20,7 @@ class Constants:
     URI = "uri"
     TOKEN = "token"
     DIM_VALUE = 1536
+    DOC_ID = "doc_id"
 
 
 class Milvus(VectorDBAdapter):
@@ -100,3 +102,15 @@ class Milvus(VectorDBAdapter):
     def close(self, **kwargs: object) -> None:
         if self._client:
             self._client.close()
+
+    def count_nodes(self, ref_doc_id: str) -> int | None:
+        if self._client is None:
+            return None
+        if not self._client.has_collection(self._collection_name):
+            return 0
+        result = self._client.query(
+            collection_name=self._collection_name,
+            filter=f"{Constants.DOC_ID} == {json.dumps(ref_doc_id)}",
+            output_fields=["count(*)"],
+        )
+        return int(result[0]["count(*)"]) if result else 0
@@ -148,6 +148,21 @@ class Pinecone(VectorDBAdapter):
             else:
                 super().delete(ref_doc_id=ref_doc_id, **delete_kwargs)
 
+    def count_nodes(self, ref_doc_id: str) -> int | None:
+        # Listing IDs by prefix is only available on serverless indexes.
+        # Node IDs are prefixed with the ref_doc_id in `add()`
+        if self._config.get(Constants.SPECIFICATION) != Constants.SPEC_SERVERLESS:
+            return None
+        index = self._client.Index(self._collection_name)  # type: ignore
+        return sum(len(ids) for ids in index.list(prefix=ref_doc_id))
+
+    def has_document(self, ref_doc_id: str) -> bool | None:
+        if self._config.get(Constants.SPECIFICATION) != Constants.SPEC_SERVERLESS:
+            return None
+        index = self._client.Index(self._collection_name)  # type: ignore
+        page = index.list_paginated(prefix=ref_doc_id, limit=1)
+        return len(page.vectors) > 0
+
     def add(
         self,
         ref_doc_id: str,
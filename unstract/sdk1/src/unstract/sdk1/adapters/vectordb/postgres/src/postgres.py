@@ -6,6 +6,8 @@ from urllib.parse import quote_plus
 
 import psycopg2
 from llama_index.vector_stores.postgres import PGVectorStore
+from psycopg2 import sql
+
 from unstract.sdk1.adapters.exceptions import AdapterError
 from unstract.sdk1.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk1.adapters.vectordb.helper import VectorDBHelper
@@ -121,3 +123,41 @@ class Postgres(VectorDBAdapter):
     def close(self, **kwargs: object) -> None:
         if self._client:
             self._client.close()
+
+    def count_nodes(self, ref_doc_id: str) -> int | None:
+        table = self._get_table_identifier()
+        if table is None:
+            return 0
+        query = sql.SQL("SELECT COUNT(*) FROM {} WHERE metadata_->>'doc_id' = %s").format(
+            table
+        )
+        return self._fetch_one(query, ref_doc_id)
+
+    def has_document(self, ref_doc_id: str) -> bool | None:
+        table = self._get_table_identifier()
+        if table is None:
+            return False
+        query = sql.SQL(
+            "SELECT EXISTS (SELECT 1 FROM {} WHERE metadata_->>'doc_id' = %s)"
+        ).format(table)
+        return bool(self._fetch_one(query, ref_doc_id))
+
+    def _get_table_identifier(self) -> sql.Identifier | None:
+        """Returns the node table, None if nothing was indexed into it yet."""
+        # PGVectorStore lower cases the table name and prefixes it with data_
+        table_name = f"data_{self._collection_name.lower()}"
+        exists = self._fetch_one(
+            "SELECT to_regclass(%s) IS NOT NULL", f'"{self._schema_name}"."{table_name}"'
+        )
+        if not exists:
+            return None
+        return sql.Identifier(self._schema_name, table_name)
+
+    def _fetch_one(self, query: str | sql.Composable, *params: object) -> object:
+        try:
+            with self._client.cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchone()[0]
+        finally:
+            # Ends the implicit transaction so that the connection stays usable
+            self._client.rollback()
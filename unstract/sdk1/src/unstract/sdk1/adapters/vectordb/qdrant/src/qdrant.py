@@ -4,6 +4,7 @@ import os
 from llama_index.core.vector_stores.types import BasePydanticVectorStore
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 from qdrant_client import QdrantClient
+from qdrant_client.http import models as rest
 from qdrant_client.http.exceptions import UnexpectedResponse
 from unstract.sdk1.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk1.adapters.vectordb.helper import VectorDBHelper
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 class Constants:
     URL = "url"
     API_KEY = "api_key"
+    DOC_ID = "doc_id"
 
 
 class Qdrant(VectorDBAdapter):
@@ -92,6 +94,24 @@ class Qdrant(VectorDBAdapter):
         if self._client:
             self._client.close(**kwargs)
 
+    def count_nodes(self, ref_doc_id: str) -> int | None:
+        if self._client is None:
+            return None
+        if not self._client.collection_exists(self._collection_name):
+            return 0
+        result = self._client.count(
+            collection_name=self._collection_name,
+            count_filter=rest.Filter(
+                must=[
+                    rest.FieldCondition(
+                        key=Constants.DOC_ID, match=rest.MatchValue(value=ref_doc_id)
+                    )
+                ]
+            ),
+            exact=True,
+        )
+        return result.count
+
     @staticmethod
     def parse_vector_db_err(e: Exception) -> VectorDBError:
         # Avoid wrapping VectorDBError objects again
@@ -98,3 +98,25 @@ class VectorDBAdapter(Adapter, ABC):
 
     def add(self, ref_doc_id: str, nodes: list[BaseNode]) -> list[str]:
         return self._vector_db_instance.add(nodes=nodes)
+
+    def count_nodes(self, ref_doc_id: str) -> int | None:
+        """Count the nodes stored for a document.
+
+        Overriding implementations use the native count / filter API of the
+        vector DB, which avoids embedding a query just to look up a document.
+
+        Returns:
+            int | None: Number of nodes, None if counting is not supported
+        """
+        return None
+
+    def has_document(self, ref_doc_id: str) -> bool | None:
+        """Check if any nodes are stored for a document.
+
+        Returns:
+            bool | None: Whether the document exists, None if not supported
+        """
+        count = self.count_nodes(ref_doc_id=ref_doc_id)
+        if count is None:
+            return None
+        return count > 0
@@ -9,6 +9,7 @@ from unstract.sdk1.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk1.adapters.vectordb.helper import VectorDBHelper
 from unstract.sdk1.adapters.vectordb.vectordb_adapter import VectorDBAdapter
 from weaviate.classes.init import Auth
+from weaviate.classes.query import Filter
 from weaviate.exceptions import UnexpectedStatusCodeException
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 class Constants:
     URL = "url"
     API_KEY = "api_key"
+    REF_DOC_ID = "ref_doc_id"
 
 
 class Weaviate(VectorDBAdapter):
@@ -103,3 +105,13 @@ class Weaviate(VectorDBAdapter):
     def close(self, **kwargs: object) -> None:
         if self._client:
             self._client.close(**kwargs)
+
+    def count_nodes(self, ref_doc_id: str) -> int | None:
+        if self._client is None:
+            return None
+        collection = self._client.collections.get(self._collection_name)
+        result = collection.aggregate.over_all(
+            filters=Filter.by_property(Constants.REF_DOC_ID).equal(ref_doc_id),
+            total_count=True,
+        )
+        return result.total_count or 0
@@ -12,3 +12,10 @@ class TextExtractionMetadata:
 class TextExtractionResult:
     extracted_text: str
     extraction_metadata: TextExtractionMetadata | None = None
+
+
+@dataclass
+class PageExtractionResult:
+    page_number: int
+    text: str
+    extraction_metadata: TextExtractionMetadata | None = None
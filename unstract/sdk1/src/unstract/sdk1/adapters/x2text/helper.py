@@ -1,7 +1,6 @@
 import logging
 from typing import Any
 
-import requests
 from requests import Response
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 from unstract.sdk1.adapters.exceptions import AdapterError
@@ -9,6 +8,7 @@ from unstract.sdk1.adapters.utils import AdapterUtils
 from unstract.sdk1.adapters.x2text.constants import X2TextConstants
 from unstract.sdk1.constants import MimeType
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk1.utils.http_session import HttpSessionFactory
 
 logger = logging.getLogger(__name__)
 
@@ -130,7 +130,9 @@ class UnstructuredHelper:
         if "files" in kwargs:
             files = kwargs["files"] if kwargs["files"] is not None else None
         try:
-            response = requests.post(x2text_url, headers=headers, data=body, files=files)
+            response = HttpSessionFactory.get_session().post(
+                x2text_url, headers=headers, data=body, files=files
+            )
             response.raise_for_status()
         except ConnectionError as e:
             logger.error(f"Adapter error: {e}")
@@ -28,6 +28,7 @@ from unstract.sdk1.adapters.x2text.llm_whisperer.src.constants import (
 from unstract.sdk1.adapters.x2text.x2text_adapter import X2TextAdapter
 from unstract.sdk1.constants import MimeType
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk1.utils.http_session import HttpSessionFactory
 
 logger = logging.getLogger(__name__)
 
@@ -104,11 +105,11 @@ class LLMWhisperer(X2TextAdapter):
         try:
             response: Response
             if request_method == HTTPMethod.GET:
-                response = requests.get(
+                response = HttpSessionFactory.get_session().get(
                     url=llm_whisperer_svc_url, headers=headers, params=params
                 )
             elif request_method == HTTPMethod.POST:
-                response = requests.post(
+                response = HttpSessionFactory.get_session().post(
                     url=llm_whisperer_svc_url,
                     headers=headers,
                     params=params,
@@ -29,6 +29,7 @@ from unstract.sdk1.adapters.x2text.llm_whisperer_v2.src.dto import (
 )
 from unstract.sdk1.constants import MimeType
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk1.utils.http_session import HttpSessionFactory
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,7 @@ class LLMWhispererHelper:
         try:
             response: Response
             url = f"{llm_whisperer_svc_url}/{request_endpoint}"
-            response = requests.get(url=url, headers=headers)
+            response = HttpSessionFactory.get_session().get(url=url, headers=headers)
             response.raise_for_status()
         except ConnectionError as e:
             logger.error("LLMWhisperer V2 test_connection failed: %s", e)
@@ -6,10 +6,13 @@ from typing import TYPE_CHECKING, Any
 
 from unstract.sdk1.adapters.x2text.constants import X2TextConstants
 from unstract.sdk1.adapters.x2text.dto import (
+    PageExtractionResult,
     TextExtractionMetadata,
     TextExtractionResult,
 )
 from unstract.sdk1.adapters.x2text.llm_whisperer_v2.src.constants import (
+    WhispererConfig,
+    WhispererDefaults,
     WhispererEndpoint,
 )
 from unstract.sdk1.adapters.x2text.llm_whisperer_v2.src.dto import (
@@ -20,6 +23,8 @@ from unstract.sdk1.adapters.x2text.x2text_adapter import X2TextAdapter
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import requests
 
 logger = logging.getLogger(__name__)
@@ -105,3 +110,34 @@ class LLMWhispererV2(X2TextAdapter):
             ),
             extraction_metadata=metadata,
         )
+
+    def process_pages(
+        self,
+        input_file_path: str,
+        output_file_path: str | None = None,
+        fs: FileStorage | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> Iterator[PageExtractionResult]:
+        """Yields the pages of the extracted text.
+
+        LLMWhisperer returns the text of all pages at once, which is split on
+        the configured page separator. The separator is kept at the end of
+        each page, so that joining the pages restores the extracted text.
+        """
+        result = self.process(input_file_path, output_file_path, fs, **kwargs)
+        separator = self.config.get(
+            WhispererConfig.PAGE_SEPARATOR, WhispererDefaults.PAGE_SEPARATOR
+        )
+        pages = (
+            result.extracted_text.split(separator)
+            if separator
+            else [result.extracted_text]
+        )
+        for index, text in enumerate(pages):
+            if index < len(pages) - 1:
+                text += separator
+            yield PageExtractionResult(
+                page_number=index + 1,
+                text=text,
+                extraction_metadata=result.extraction_metadata,
+            )
@@ -1,20 +1,59 @@
 """Native PDF x2text adapter: extracts text from PDFs using pdfplumber (no external service)."""
 
-import io
 import logging
-from typing import Any
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from pathlib import Path
+from typing import Any, TextIO
 
 import pdfplumber
 from unstract.sdk1.adapters.exceptions import AdapterError
-from unstract.sdk1.adapters.x2text.dto import TextExtractionResult
+from unstract.sdk1.adapters.x2text.dto import (
+    PageExtractionResult,
+    TextExtractionResult,
+)
 from unstract.sdk1.adapters.x2text.x2text_adapter import X2TextAdapter
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_page_range(file_path: str, start: int, end: int) -> Iterator[str]:
+    """Yields the text of pages `start` to `end` (exclusive) of a PDF."""
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages[start:end]:
+            yield page.extract_text() or ""
+            # Drops the parsed objects of the page, keeping memory flat
+            page.close()
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> list[str]:
+    """Extracts the text of pages `start` to `end` (exclusive) of a PDF."""
+    return list(_iter_page_range(file_path, start, end))
+
+
 class NativePdfX2Text(X2TextAdapter):
-    """Extract text from PDF files using pdfplumber (built-in, no external API)."""
+    """Extract text from PDF files using pdfplumber (built-in, no external API).
+
+    Remote files are streamed to a local temp file instead of being read into
+    memory. When workers are configured, PDFs with many pages are split into
+    chunks of pages which are extracted in parallel by a process pool, then
+    reassembled in page order.
+    `process_pages` yields pages as soon as they're extracted.
+
+    Configurable via environment variables:
+    - NATIVE_PDF_WORKERS (default: 1, extracting pages without a pool)
+    - NATIVE_PDF_PAGE_CHUNK_SIZE (default: 20 pages per task)
+    - NATIVE_PDF_PARALLEL_MIN_PAGES (default: 40 pages)
+    """
+
+    DEFAULT_PAGE_CHUNK_SIZE = 20
+    DEFAULT_PARALLEL_MIN_PAGES = 40
 
     def __init__(self, settings: dict[str, Any]) -> None:
         super().__init__("Native PDF")
@@ -46,17 +85,12 @@ class NativePdfX2Text(X2TextAdapter):
         if fs is None:
             fs = FileStorage(provider=FileStorageProvider.LOCAL)
         try:
-            content = fs.read(path=input_file_path, mode="rb")
+            with self._local_copy(input_file_path, fs) as local_path:
+                extracted_text = "\n".join(
+                    text for text in self._iter_pages(local_path) if text
+                )
         except OSError as e:
             raise AdapterError(f"Failed to read file {input_file_path}: {e}") from e
-        try:
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                parts = []
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        parts.append(text)
-                extracted_text = "\n".join(parts) if parts else ""
         except Exception as e:
             logger.exception("Native PDF extraction failed for %s", input_file_path)
             raise AdapterError(f"PDF extraction failed: {e}") from e
@@ -72,5 +106,104 @@ class NativePdfX2Text(X2TextAdapter):
                 logger.warning("Could not write output file %s: %s", output_file_path, e)
         return TextExtractionResult(extracted_text=extracted_text)
 
+    def process_pages(
+        self,
+        input_file_path: str,
+        output_file_path: str | None = None,
+        fs: FileStorage | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> Iterator[PageExtractionResult]:
+        if fs is None:
+            fs = FileStorage(provider=FileStorageProvider.LOCAL)
+        try:
+            with (
+                self._local_copy(input_file_path, fs) as local_path,
+                self._output_writer(output_file_path, fs) as output,
+            ):
+                written = False
+                for page_number, text in enumerate(self._iter_pages(local_path), start=1):
+                    if output and text:
+                        output.write(f"\n{text}" if written else text)
+                        written = True
+                    yield PageExtractionResult(page_number=page_number, text=text)
+        except OSError as e:
+            raise AdapterError(f"Failed to read file {input_file_path}: {e}") from e
+        except Exception as e:
+            logger.exception("Native PDF extraction failed for %s", input_file_path)
+            raise AdapterError(f"PDF extraction failed: {e}") from e
+
     def test_connection(self) -> bool:
         return True
+
+    @staticmethod
+    @contextmanager
+    def _local_copy(input_file_path: str, fs: FileStorage) -> Iterator[str]:
+        """Yields a local path of the file, downloading remote files."""
+        if fs.provider == FileStorageProvider.LOCAL:
+            yield input_file_path
+            return
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = str(Path(temp_dir) / Path(input_file_path).name)
+            fs.download(from_path=input_file_path, to_path=local_path)
+            yield local_path
+
+    @staticmethod
+    @contextmanager
+    def _output_writer(
+        output_file_path: str | None, fs: FileStorage
+    ) -> Iterator[TextIO | None]:
+        """Yields a handle writing the output file, uploaded once complete."""
+        if not output_file_path:
+            yield None
+            return
+        if fs.provider == FileStorageProvider.LOCAL:
+            Path(output_file_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file_path, "w", encoding="utf-8") as output:
+                yield output
+            return
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = str(Path(temp_dir) / Path(output_file_path).name)
+            with open(local_path, "w", encoding="utf-8") as output:
+                yield output
+            fs.upload(from_path=local_path, to_path=output_file_path)
+
+    def _iter_pages(self, file_path: str) -> Iterator[str]:
+        """Yields the text of every page of a PDF, in page order."""
+        with pdfplumber.open(file_path) as pdf:
+            page_count = len(pdf.pages)
+        workers = int(os.environ.get("NATIVE_PDF_WORKERS", 1))
+        chunk_size = max(
+            int(
+                os.environ.get("NATIVE_PDF_PAGE_CHUNK_SIZE", self.DEFAULT_PAGE_CHUNK_SIZE)
+            ),
+            1,
+        )
+        min_pages = int(
+            os.environ.get(
+                "NATIVE_PDF_PARALLEL_MIN_PAGES", self.DEFAULT_PARALLEL_MIN_PAGES
+            )
+        )
+        # Daemonic processes, e.g. pool workers, can't have child processes
+        if (
+            workers <= 1
+            or page_count < min_pages
+            or page_count <= chunk_size
+            or multiprocessing.current_process().daemon
+        ):
+            yield from _iter_page_range(file_path, 0, page_count)
+            return
+
+        starts = list(range(0, page_count, chunk_size))
+        ends = [min(start + chunk_size, page_count) for start in starts]
+        logger.info(
+            f"Extracting {page_count} pages of {file_path} in {len(starts)} "
+            f"chunks with {min(workers, len(starts))} processes"
+        )
+        # Forking a process with running threads isn't safe, hence spawn
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(starts)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            chunks = executor.map(_extract_page_range, repeat(file_path), starts, ends)
+            for chunk in chunks:
+                yield from chunk
@@ -1,9 +1,13 @@
 from abc import ABC
+from collections.abc import Iterator
 from typing import Any
 
 from unstract.sdk1.adapters.base import Adapter
 from unstract.sdk1.adapters.enums import AdapterTypes
-from unstract.sdk1.adapters.x2text.dto import TextExtractionResult
+from unstract.sdk1.adapters.x2text.dto import (
+    PageExtractionResult,
+    TextExtractionResult,
+)
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
 
 
@@ -52,3 +56,31 @@ class X2TextAdapter(Adapter, ABC):
         return TextExtractionResult(
             extracted_text="extracted text", extraction_metadata=None
         )
+
+    def process_pages(
+        self,
+        input_file_path: str,
+        output_file_path: str | None = None,
+        fs: FileStorage | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> Iterator[PageExtractionResult]:
+        """Extracts text page by page, yielding each page once it's extracted.
+
+        Writes `output_file_path` like `process`. Adapters which can't extract
+        incrementally yield the whole document as a single page.
+
+        Args:
+            input_file_path (str): Path to file that needs to be extracted
+            output_file_path (Optional[str], optional): File path to write
+                extracted text into, if None doesn't write to a file.
+                Defaults to None.
+
+        Yields:
+            PageExtractionResult: Text and metadata of a page, in page order
+        """
+        result = self.process(input_file_path, output_file_path, fs, **kwargs)
+        yield PageExtractionResult(
+            page_number=1,
+            text=result.extracted_text,
+            extraction_metadata=result.extraction_metadata,
+        )
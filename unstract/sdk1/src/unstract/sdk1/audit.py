@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Self
 
 import requests
 from llama_index.core.callbacks import CBEventType, TokenCountingHandler
@@ -6,11 +6,17 @@ from unstract.sdk1.constants import LogLevel, ToolEnv
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.stream import StreamMixin
 from unstract.sdk1.utils.common import TokenCounterCompat
+from unstract.sdk1.utils.http_session import HttpSessionFactory
+from unstract.sdk1.utils.usage_emitter import UsageEmitter
 
 
 class Audit(StreamMixin):
     """The 'Audit' class is responsible for pushing usage data to the platform service.
 
+    Usage is queued on the `UsageEmitter` and sent in batches by a background
+    thread, unless USAGE_EMITTER_ENABLED is False. Use the class as a context
+    manager to flush queued usage on exit.
+
     Methods:
         - push_usage_data: Pushes the usage data to the platform service.
 
@@ -26,6 +32,14 @@ class Audit(StreamMixin):
         """
         super().__init__(log_level)
 
+    def __enter__(self) -> Self:
+        """Returns the Audit instance."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Flushes usage queued on the `UsageEmitter`."""
+        UsageEmitter.flush()
+
     def push_usage_data(
         self,
         platform_api_key: str,
@@ -101,7 +115,13 @@ class Audit(StreamMixin):
         headers = {"Authorization": f"Bearer {bearer_token}"}
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            if UsageEmitter.is_enabled():
+                UsageEmitter.emit(base_url, bearer_token, UsageEmitter.TOKEN_USAGE, data)
+                self.stream_log(f"Queued usage details, {data}", level=LogLevel.DEBUG)
+                return
+            response = HttpSessionFactory.get_session().post(
+                url, headers=headers, json=data, timeout=30
+            )
             if response.status_code != 200:
                 self.stream_log(
                     log=(
@@ -154,8 +174,15 @@ class Audit(StreamMixin):
             "run_id": run_id,
         }
 
+        if UsageEmitter.is_enabled():
+            UsageEmitter.emit(base_url, bearer_token, UsageEmitter.PAGE_USAGE, data)
+            self.stream_log("Queued page usage details", level=LogLevel.DEBUG)
+            return
+
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = HttpSessionFactory.get_session().post(
+                url, headers=headers, json=data, timeout=30
+            )
             if response.status_code != 200:
                 self.stream_log(
                     log=(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import threading
 from typing import TYPE_CHECKING
 
 import litellm
+from llama_index.core.callbacks import CBEventType, EventPayload
 from llama_index.core.embeddings import BaseEmbedding
 from pydantic import ValidationError
 from unstract.sdk1.adapters.constants import Common
@@ -12,6 +14,8 @@ from unstract.sdk1.constants import ToolEnv
 from unstract.sdk1.exceptions import SdkError, parse_litellm_err
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.utils.callback_manager import CallbackManager
+from unstract.sdk1.utils.embedding_cache import EmbeddingCache
+from unstract.sdk1.utils.embedding_dimensions import EmbeddingDimensionRegistry
 
 if TYPE_CHECKING:
     from unstract.sdk1.tool.base import BaseTool
@@ -84,18 +88,53 @@ class Embedding:
                 "Embedding adapter not supported: " + adapter_id or adapter_instance_id
             ) from e
 
+        # Model names as entered by the user, before validation rewrites them
+        model_names = [
+            str(self._adapter_metadata.get(key) or "") for key in ("model", "model_name")
+        ]
         try:
             self.platform_kwargs: dict[str, object] = kwargs
             self.kwargs: dict[str, object] = self.adapter.validate(self._adapter_metadata)
         except ValidationError as e:
             raise SdkError("Invalid embedding adapter metadata: " + str(e)) from e
 
-        # Test connection - wrap in error handling
-        try:
-            self._length = len(self.get_embedding(self._TEST_SNIPPET))
-        except Exception as e:
-            provider_name = f"{self.adapter.get_name()}"
-            raise parse_litellm_err(e, provider_name) from e
+        self._config_hash = EmbeddingDimensionRegistry.get_config_hash(
+            self._adapter_id, self.kwargs
+        )
+        # Models with a configurable length, e.g. text-embedding-3-*, return
+        # vectors of the requested length instead of their default one
+        dimensions = self.kwargs.get("dimensions")
+        if dimensions:
+            self._dimension: int | None = int(dimensions)
+        else:
+            self._dimension = EmbeddingDimensionRegistry.get_known_dimension(
+                self.adapter.get_provider(),
+                [str(self.kwargs.get("model", ""))] + model_names,
+            )
+
+    @property
+    def _length(self) -> int:
+        """Length of the vectors returned by the embedding model.
+
+        Resolved from the dimension registry, so that no embedding request is
+        made for known models or configs. Unknown configs are probed once and
+        the discovered dimension is persisted for other processes.
+        """
+        if self._dimension is None:
+            self._dimension = EmbeddingDimensionRegistry.get(self._config_hash)
+        if self._dimension is None:
+            self._dimension = self.probe_dimension()
+        return self._dimension
+
+    def probe_dimension(self) -> int:
+        """Embed a test snippet to discover the vector length.
+
+        Makes a live call to the provider and records the result in the
+        dimension registry.
+        """
+        dimension = len(self.get_embedding(self._TEST_SNIPPET))
+        EmbeddingDimensionRegistry.set(self._config_hash, dimension)
+        return dimension
 
     def get_embedding(self, text: str) -> list[float]:
         """Return embedding vector for query string."""
@@ -152,8 +191,12 @@ class Embedding:
             raise parse_litellm_err(e, provider_name) from e
 
     def test_connection(self) -> bool:
-        """Test connection to the embedding provider."""
-        return self._length > 0
+        """Test connection to the embedding provider.
+
+        Unlike `_length`, this always makes a live embedding request.
+        """
+        self._dimension = self.probe_dimension()
+        return self._dimension > 0
 
 
 class EmbeddingCompat(BaseEmbedding):
@@ -188,8 +231,13 @@ class EmbeddingCompat(BaseEmbedding):
             tool=tool,
             kwargs=kwargs,
         )
-        self._length = self._embedding_instance._length
         self._tool = tool
+        self._usage_lock = threading.Lock()
+        # Batch size configured on the adapter, used when embedding many texts
+        self.embed_batch_size = (
+            self._embedding_instance.kwargs.get("embed_batch_size")
+            or self.embed_batch_size
+        )
 
         # For compatibility with SDK Callback Manager.
         self.model_name = self._embedding_instance.kwargs.get("model", "")
@@ -214,6 +262,38 @@ class EmbeddingCompat(BaseEmbedding):
                 },
             )
 
+    @property
+    def _length(self) -> int:
+        return self._embedding_instance._length
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embeds texts in a single request to the provider.
+
+        Safe to call from several threads. Usage is reported once per request
+        through the callback manager.
+        """
+        embeddings = self._embedding_instance.get_embeddings(texts)
+        if self.callback_manager:
+            # Usage handlers share a token counter which is reset on every push
+            with self._usage_lock:
+                with self.callback_manager.event(
+                    CBEventType.EMBEDDING,
+                    payload={EventPayload.SERIALIZED: self.to_dict()},
+                ) as event:
+                    event.on_end(
+                        payload={
+                            EventPayload.CHUNKS: texts,
+                            EventPayload.EMBEDDINGS: embeddings,
+                        }
+                    )
+        return embeddings
+
+    def get_config_hash(self) -> str:
+        """Hash of the config that determines the vectors, for caching them."""
+        return EmbeddingCache.get_config_hash(
+            self._embedding_instance._adapter_id, self._embedding_instance.kwargs
+        )
+
     def _get_query_embedding(self, query: str) -> list[float]:
         return self._embedding_instance.get_embedding(query)
 
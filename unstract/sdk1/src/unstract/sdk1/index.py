@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from itertools import batched
 from typing import TYPE_CHECKING, Any
 
 from llama_index.core import Document
@@ -19,19 +21,24 @@ from unstract.sdk1.adapters.vectordb.no_op.src.no_op_custom_vectordb import (
 )
 from unstract.sdk1.adapters.x2text.constants import X2TextConstants
 from unstract.sdk1.adapters.x2text.llm_whisperer_v2.src import LLMWhispererV2
-from unstract.sdk1.constants import LogLevel
+from unstract.sdk1.constants import LogLevel, ToolEnv
 from unstract.sdk1.embedding import EmbeddingCompat
 from unstract.sdk1.exceptions import IndexingError, SdkError, VectorDBError, X2TextError
 from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
 from unstract.sdk1.platform import PlatformHelper
-from unstract.sdk1.utils.common import capture_metrics, log_elapsed
+from unstract.sdk1.utils.common import Utils, capture_metrics, log_elapsed
+from unstract.sdk1.utils.extraction_cache import ExtractionCache
 from unstract.sdk1.utils.tool import ToolUtils
 from unstract.sdk1.vector_db import VectorDB
 from unstract.sdk1.x2txt import X2Text
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
+    from unstract.sdk1.adapters.x2text.dto import (
+        TextExtractionMetadata,
+        TextExtractionResult,
+    )
     from unstract.sdk1.tool.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -42,6 +49,9 @@ class Constants:
 
 
 class Index:
+    # Pages chunked and embedded together while a document is extracted
+    DEFAULT_STREAMING_BATCH_PAGES = 10
+
     def __init__(
         self,
         tool: BaseTool,
@@ -87,6 +97,18 @@ class Index:
             self.tool.stream_log(
                 f">>> Querying '{vector_db_instance_id}' for {doc_id}..."
             )
+            try:
+                # Avoids embedding a query for documents that aren't indexed
+                if vector_db.has_document(doc_id) is False:
+                    self.tool.stream_log(f"No nodes found for {doc_id}")
+                    return None
+            except Exception as e:
+                self.tool.stream_log(
+                    f"Error while looking up {doc_id}: {e}", level=LogLevel.ERROR
+                )
+                raise VectorDBError(
+                    f"Failed to look up {doc_id} on {vector_db}: {e}", actual_err=e
+                ) from e
             try:
                 doc_id_eq_filter = MetadataFilter.from_dict(
                     {
@@ -149,6 +171,9 @@ class Index:
         - Unstructured IO Community / Enterprise
         - Llama Parse
 
+        Text extracted earlier from the same file with the same adapter config
+        is reused from the `ExtractionCache` when it's enabled.
+
         Args:
             x2text_instance_id (str): UUID of the text extractor
             file_path (str): Path to the file
@@ -177,25 +202,20 @@ class Index:
             usage_kwargs=usage_kwargs,
         )
         try:
-            if enable_highlight and isinstance(x2text.x2text_instance, LLMWhispererV2):
-                process_response = x2text.process(
-                    input_file_path=file_path,
-                    output_file_path=output_file_path,
-                    enable_highlight=enable_highlight,
-                    tags=tags,
-                    fs=fs,
-                )
-                whisper_hash_value = process_response.extraction_metadata.whisper_hash
-                metadata = {X2TextConstants.WHISPER_HASH: whisper_hash_value}
-                if hasattr(self.tool, "update_exec_metadata"):
-                    self.tool.update_exec_metadata(metadata)
-            else:
-                process_response = x2text.process(
-                    input_file_path=file_path,
-                    output_file_path=output_file_path,
-                    tags=tags,
-                    fs=fs,
-                )
+            # Highlighting is only supported by LLMWhisperer V2
+            enable_highlight = enable_highlight and isinstance(
+                x2text.x2text_instance, LLMWhispererV2
+            )
+            process_response = self._process_with_cache(
+                x2text=x2text,
+                file_path=file_path,
+                output_file_path=output_file_path,
+                enable_highlight=enable_highlight,
+                fs=fs,
+                tags=tags,
+            )
+            if enable_highlight:
+                self._record_whisper_hash(process_response.extraction_metadata)
             extracted_text = process_response.extracted_text
         # TODO: Handle prepend of context where error is raised and remove this
         except AdapterError as e:
@@ -216,11 +236,103 @@ class Index:
                 )
         return extracted_text
 
+    def extract_text_pages(
+        self,
+        x2text_instance_id: str,
+        file_path: str,
+        output_file_path: str | None = None,
+        enable_highlight: bool = False,
+        usage_kwargs: dict[Any, Any] | None = None,
+        fs: FileStorage | None = None,
+        tags: list[str] | None = None,
+    ) -> Iterator[str]:
+        """Extracts text from a document, yielding it page by page.
+
+        Like `extract_text`, but pages are yielded as soon as the adapter
+        extracts them (see `X2TextAdapter.process_pages`), so that they can be
+        indexed before the extraction finishes. Text found in the
+        `ExtractionCache` is yielded as a single page.
+
+        Raises:
+            X2TextError: Errors during text extraction
+        """
+        if usage_kwargs is None:
+            usage_kwargs = {}
+        if fs is None:
+            fs = FileStorage(FileStorageProvider.LOCAL)
+        self.tool.stream_log("Extracting text from input file page by page")
+        x2text = X2Text(
+            tool=self.tool,
+            adapter_instance_id=x2text_instance_id,
+            usage_kwargs=usage_kwargs,
+        )
+        enable_highlight = enable_highlight and isinstance(
+            x2text.x2text_instance, LLMWhispererV2
+        )
+        extraction_metadata = None
+        try:
+            for page in ExtractionCache.process_pages(
+                x2text=x2text,
+                file_path=file_path,
+                output_file_path=output_file_path,
+                enable_highlight=enable_highlight,
+                fs=fs,
+                scope=self._get_extraction_cache_scope(),
+                tags=tags,
+            ):
+                extraction_metadata = extraction_metadata or page.extraction_metadata
+                yield page.text
+        except AdapterError as e:
+            msg = f"Error from text extractor '{x2text.x2text_instance.get_name()}'. "
+            msg += str(e)
+            raise X2TextError(msg) from e
+        if enable_highlight:
+            self._record_whisper_hash(extraction_metadata)
+
+    @classmethod
+    def is_streaming_enabled(cls) -> bool:
+        """Whether documents are indexed page by page while they're extracted."""
+        return Utils.str_to_bool(os.environ.get("INDEX_STREAMING_ENABLED", "False"))
+
+    def _record_whisper_hash(
+        self, extraction_metadata: TextExtractionMetadata | None
+    ) -> None:
+        if not extraction_metadata:
+            return
+        whisper_hash_value = extraction_metadata.whisper_hash
+        metadata = {X2TextConstants.WHISPER_HASH: whisper_hash_value}
+        if hasattr(self.tool, "update_exec_metadata"):
+            self.tool.update_exec_metadata(metadata)
+
+    def _get_extraction_cache_scope(self) -> str:
+        """Platform key of the organisation, scoping its cached extractions."""
+        return self.tool.get_env_or_die(ToolEnv.PLATFORM_API_KEY)
+
+    def _process_with_cache(
+        self,
+        x2text: X2Text,
+        file_path: str,
+        output_file_path: str | None,
+        enable_highlight: bool,
+        fs: FileStorage,
+        tags: list[str] | None,
+    ) -> TextExtractionResult:
+        """Extracts text with the adapter unless it's found in the cache."""
+        return ExtractionCache.process(
+            x2text=x2text,
+            file_path=file_path,
+            output_file_path=output_file_path,
+            enable_highlight=enable_highlight,
+            fs=fs,
+            scope=self._get_extraction_cache_scope(),
+            tags=tags,
+        )
+
     # TODO: Reduce the number of params by some dataclass
     # TODO: Deprecate and remove `process_text` argument
     @log_elapsed(operation="CHECK_AND_INDEX(overall)")
     @capture_metrics
-    def index(
+    def index(  # noqa: C901
         self,
         tool_id: str,
         embedding_instance_id: str,
@@ -292,22 +404,19 @@ class Index:
 
         try:
             # Checking if document is already indexed against doc_id
-            doc_id_eq_filter = MetadataFilter.from_dict(
-                {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
-            )
-            filters = MetadataFilters(filters=[doc_id_eq_filter])
-            q = VectorStoreQuery(
-                query_embedding=embedding.get_query_embedding(" "),
-                doc_ids=[doc_id],
-                filters=filters,
-            )
-
             doc_id_found = False
             try:
-                n: VectorStoreQueryResult = vector_db.query(query=q)
-                if len(n.nodes) > 0:
-                    doc_id_found = True
-                    self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
+                doc_id_found = self._is_document_indexed(
+                    vector_db=vector_db, embedding=embedding, doc_id=doc_id
+                )
+                if doc_id_found:
+                    self.tool.stream_log(f"Found nodes for {doc_id}")
+                    if not reindex and vector_db.is_document_complete(doc_id) is False:
+                        # Nodes of an interrupted indexing run are replaced
+                        self.tool.stream_log(
+                            f"Indexing of {doc_id} is incomplete, re-indexing"
+                        )
+                        reindex = True
                 else:
                     self.tool.stream_log(f"No nodes found for {doc_id}")
             except Exception as e:
@@ -334,6 +443,41 @@ class Index:
                     )
                 return doc_id
 
+            # For No-op adapters, addition of nodes to vectorDB should not happen
+            # and this has to be handled in the adapter level. But there are a
+            # few challenges considering callback manager and upstream Llama index
+            # method invocations. Hence, making this check here and returning
+            # the doc id to maintain the legacy flow of adapters.
+            is_no_op = isinstance(
+                vector_db.get_vector_db(
+                    adapter_instance_id=vector_db_instance_id, embedding_dimension=1
+                ),
+                (NoOpCustomVectorDB),
+            )
+
+            # `process_text` needs the complete text, hence isn't streamed
+            streaming = self.is_streaming_enabled() and process_text is None
+            if streaming and not is_no_op and chunk_size != 0:
+                pages = self.extract_text_pages(
+                    x2text_instance_id=x2text_instance_id,
+                    file_path=file_path,
+                    output_file_path=output_file_path,
+                    enable_highlight=enable_highlight,
+                    usage_kwargs=usage_kwargs,
+                    tags=tags,
+                    fs=fs,
+                )
+                self.index_to_vector_db(
+                    vector_db=vector_db,
+                    embedding=embedding,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    doc_id=doc_id,
+                    text_to_idx=pages,
+                    doc_id_found=doc_id_found,
+                )
+                return doc_id
+
             extracted_text = self.extract_text(
                 x2text_instance_id=x2text_instance_id,
                 file_path=file_path,
@@ -347,18 +491,7 @@ class Index:
             if not extracted_text:
                 raise IndexingError("No text available to index")
 
-            # For No-op adapters, addition of nodes to vectorDB should not happen
-            # and this has to be handled in the adapter level. But there are a
-            # few challenges considering callback manager and upstream Llama index
-            # method invocations. Hence, making this check here and returning
-            # the doc id to maintain the legacy flow of adapters.
-
-            if isinstance(
-                vector_db.get_vector_db(
-                    adapter_instance_id=vector_db_instance_id, embedding_dimension=1
-                ),
-                (NoOpCustomVectorDB),
-            ):
+            if is_no_op:
                 return doc_id
 
             self.index_to_vector_db(
@@ -374,6 +507,31 @@ class Index:
         finally:
             vector_db.close()
 
+    def _is_document_indexed(
+        self, vector_db: VectorDB, embedding: EmbeddingCompat, doc_id: str
+    ) -> bool:
+        """Checks if nodes are stored for the doc_id.
+
+        Uses the vector DB's native lookup where available. Otherwise falls
+        back to a similarity query filtered by the doc_id, which needs a query
+        embedding.
+        """
+        doc_id_found = vector_db.has_document(doc_id)
+        if doc_id_found is not None:
+            return doc_id_found
+
+        doc_id_eq_filter = MetadataFilter.from_dict(
+            {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
+        )
+        filters = MetadataFilters(filters=[doc_id_eq_filter])
+        q = VectorStoreQuery(
+            query_embedding=embedding.get_query_embedding(" "),
+            doc_ids=[doc_id],
+            filters=filters,
+        )
+        n: VectorStoreQueryResult = vector_db.query(query=q)
+        return len(n.nodes) > 0
+
     @log_elapsed(operation="INDEXING")
     def index_to_vector_db(
         self,
@@ -381,10 +539,26 @@ class Index:
         embedding: EmbeddingCompat,
         chunk_size: int,
         chunk_overlap: int,
-        text_to_idx: str,
+        text_to_idx: str | Iterable[str],
         doc_id: str,
         doc_id_found: bool,
     ) -> None:
+        """Chunks, embeds and stores the text of a document.
+
+        `text_to_idx` is either the complete text or an iterable of page texts,
+        e.g. from `extract_text_pages`. Pages are indexed in batches while
+        they're produced, see `VectorDB.index_document_batches`.
+        """
+        if not isinstance(text_to_idx, str):
+            self._index_pages_to_vector_db(
+                vector_db=vector_db,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                pages=text_to_idx,
+                doc_id=doc_id,
+                doc_id_found=doc_id_found,
+            )
+            return
         self.tool.stream_log("Indexing file...")
         full_text = [
             {
@@ -407,15 +581,7 @@ class Index:
 
         if doc_id_found:
             # Delete the nodes for the doc_id
-            try:
-                vector_db.delete(ref_doc_id=doc_id)
-                self.tool.stream_log(f"Deleted nodes for {doc_id}")
-            except Exception as e:
-                self.tool.stream_log(
-                    f"Error deleting nodes for {doc_id}: {e}",
-                    level=LogLevel.ERROR,
-                )
-                raise SdkError(f"Error deleting nodes for {doc_id}: {e}") from e
+            self._delete_nodes(vector_db, doc_id)
 
         try:
             if chunk_size == 0:
@@ -457,6 +623,76 @@ class Index:
         self.tool.stream_log("File has been indexed successfully")
         return
 
+    def _index_pages_to_vector_db(
+        self,
+        vector_db: VectorDB,
+        chunk_size: int,
+        chunk_overlap: int,
+        pages: Iterable[str],
+        doc_id: str,
+        doc_id_found: bool,
+    ) -> None:
+        self.tool.stream_log("Indexing file while it's extracted...")
+        batch_pages = max(
+            int(
+                os.environ.get(
+                    "INDEX_STREAMING_BATCH_PAGES", self.DEFAULT_STREAMING_BATCH_PAGES
+                )
+            ),
+            1,
+        )
+
+        def document_batches() -> Iterator[list[Document]]:
+            batch_count = 0
+            for page_batch in batched(pages, batch_pages):
+                text = "\n".join(page_text for page_text in page_batch if page_text)
+                if not text:
+                    continue
+                # Nodes of the doc_id are replaced once there's text to index
+                if batch_count == 0 and doc_id_found:
+                    self._delete_nodes(vector_db, doc_id)
+                batch_count += 1
+                self.tool.stream_log(f"Indexing batch {batch_count} of pages")
+                yield [self._create_document(text, doc_id)]
+            if not batch_count:
+                raise IndexingError("No text available to index")
+
+        try:
+            vector_db.index_document_batches(
+                document_batches(),
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                show_progress=True,
+            )
+        except Exception as e:
+            # Errors of the extraction and of deleting earlier nodes are raised as is
+            if isinstance(e, SdkError) and not isinstance(e, VectorDBError):
+                raise
+            self.tool.stream_log(
+                f"Error adding nodes to vector db: {e}",
+                level=LogLevel.ERROR,
+            )
+            raise IndexingError(str(e)) from e
+
+        self.tool.stream_log("File has been indexed successfully")
+
+    @staticmethod
+    def _create_document(text: str, doc_id: str) -> Document:
+        document = Document(text=text, doc_id=doc_id, metadata={"section": "full"})
+        document.id_ = doc_id
+        return document
+
+    def _delete_nodes(self, vector_db: VectorDB, doc_id: str) -> None:
+        try:
+            vector_db.delete(ref_doc_id=doc_id)
+            self.tool.stream_log(f"Deleted nodes for {doc_id}")
+        except Exception as e:
+            self.tool.stream_log(
+                f"Error deleting nodes for {doc_id}: {e}",
+                level=LogLevel.ERROR,
+            )
+            raise SdkError(f"Error deleting nodes for {doc_id}: {e}") from e
+
     def generate_index_key(
         self,
         vector_db: str,
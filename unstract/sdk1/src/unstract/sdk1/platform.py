@@ -2,7 +2,6 @@ import json
 import logging
 from typing import Any, Self
 
-import requests
 from requests import RequestException, Response
 from requests.exceptions import ConnectionError, HTTPError
 from unstract.sdk1.constants import (
@@ -16,7 +15,9 @@ from unstract.sdk1.constants import (
 )
 from unstract.sdk1.exceptions import SdkError
 from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.utils.adapter_config_cache import AdapterConfigCache
 from unstract.sdk1.utils.common import Utils
+from unstract.sdk1.utils.http_session import HttpSessionFactory
 from unstract.sdk1.utils.retry_utils import retry_platform_service_call
 
 logger = logging.getLogger(__name__)
@@ -131,7 +132,9 @@ class PlatformHelper:
         query_params = {AdapterKeys.ADAPTER_INSTANCE_ID: adapter_instance_id}
         headers = {"Authorization": f"Bearer {bearer_token}"}
         try:
-            response = requests.get(url, headers=headers, params=query_params)
+            response = HttpSessionFactory.get_session().get(
+                url, headers=headers, params=query_params
+            )
             response.raise_for_status()
             adapter_data: dict[str, Any] = response.json()
 
@@ -170,8 +173,9 @@ class PlatformHelper:
 
         This method first checks if the adapter_instance_id matches
         any of the public adapter keys. If it matches, the configuration
-        is fetched from environment variables. Otherwise, it connects to the
-        platform service to retrieve the configuration.
+        is fetched from environment variables. Otherwise, it is served from
+        the in-process `AdapterConfigCache` or retrieved from the platform
+        service and cached.
 
         Args:
             tool (AbstractTool): Instance of AbstractTool
@@ -188,17 +192,39 @@ class PlatformHelper:
             adapter_metadata = json.loads(adapter_metadata_config)
             return adapter_metadata
 
+        platform_key = tool.get_env_or_die(ToolEnv.PLATFORM_API_KEY)
+        adapter_config = AdapterConfigCache.get(platform_key, adapter_instance_id)
+        if adapter_config is not None:
+            return adapter_config
+
         tool.stream_log(
             f"Retrieving config from DB for '{adapter_instance_id}'",
             level=LogLevel.DEBUG,
         )
 
+        version = AdapterConfigCache.get_version(adapter_instance_id)
         try:
-            return cls._get_adapter_configuration(tool, adapter_instance_id)
+            adapter_config = cls._get_adapter_configuration(tool, adapter_instance_id)
         except ConnectionError as e:
             raise SdkError(
                 "Unable to connect to platform service, please contact the admin."
             ) from e
+        AdapterConfigCache.set(
+            platform_key, adapter_instance_id, adapter_config, version=version
+        )
+        return adapter_config
+
+    @classmethod
+    def invalidate_adapter_config(
+        cls: type[Self], adapter_instance_id: str | None = None
+    ) -> None:
+        """Drops cached adapter configs so that they are fetched again.
+
+        Args:
+            adapter_instance_id (str | None): Adapter whose config changed.
+                Invalidates all cached configs if not provided.
+        """
+        AdapterConfigCache.invalidate(adapter_instance_id)
 
     def _get_headers(self: Self, headers: dict[str, str] | None = None) -> dict[str, str]:
         """Get default headers for requests.
@@ -257,11 +283,13 @@ class PlatformHelper:
         response: Response = Response()
         try:
             if method.upper() == "POST":
-                response = requests.post(
+                response = HttpSessionFactory.get_session().post(
                     url=url, json=payload, params=params, headers=req_headers
                 )
             elif method.upper() == "GET":
-                response = requests.get(url=url, params=params, headers=req_headers)
+                response = HttpSessionFactory.get_session().get(
+                    url=url, params=params, headers=req_headers
+                )
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -3,12 +3,12 @@ import logging
 from collections.abc import Callable
 from typing import Any, ParamSpec, TypeVar
 
-import requests
 from requests import ConnectionError, RequestException, Response
 from unstract.sdk1.constants import MimeType, RequestHeader, ToolEnv
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.base import BaseTool
 from unstract.sdk1.utils.common import log_elapsed
+from unstract.sdk1.utils.http_session import HttpSessionFactory
 from unstract.sdk1.utils.retry_utils import retry_prompt_service_call
 
 logger = logging.getLogger(__name__)
@@ -250,11 +250,13 @@ class PromptTool:
         req_headers = self._get_headers(headers)
         response: Response = Response()
         if method.upper() == "POST":
-            response = requests.post(
+            response = HttpSessionFactory.get_session().post(
                 url=url, json=payload, params=params, headers=req_headers
             )
         elif method.upper() == "GET":
-            response = requests.get(url=url, params=params, headers=req_headers)
+            response = HttpSessionFactory.get_session().get(
+                url=url, params=params, headers=req_headers
+            )
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
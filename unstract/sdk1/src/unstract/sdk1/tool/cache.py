@@ -1,16 +1,43 @@
-import requests
+import base64
+import gzip
+import os
+from itertools import batched
+from typing import Any
+
 from unstract.sdk1.constants import LogLevel
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.utils.common import Utils
+from unstract.sdk1.utils.http_session import HttpSessionFactory
 
 
 class ToolCache(PlatformHelper):
     """Class to handle caching for Unstract Tools.
 
+    Requests to the platform service go over the keep-alive session shared by
+    the process, see `HttpSessionFactory`.
+    When compression is enabled, values larger than a threshold are gzipped
+    before being cached. Compressed values are always decoded when read, so
+    enable it once every reader of the cache is on a version decoding them.
+    `mget` / `mset` read or write several keys in a single request, per batch
+    of up to `MAX_BATCH_SIZE` keys accepted by the platform service.
+    Values written with a `ttl` expire after as many seconds, else after the
+    platform service's `CACHE_TTL`.
+
+    Configurable via environment variables:
+    - TOOL_CACHE_COMPRESS (default: False)
+    - TOOL_CACHE_COMPRESS_MIN_SIZE (default: 65536 characters)
+
     Notes:
         - PLATFORM_SERVICE_API_KEY environment variable is required.
     """
 
+    # Marks values which are stored gzipped and base64 encoded
+    COMPRESSED_PREFIX = "gzip+base64:"
+    DEFAULT_COMPRESS_MIN_SIZE = 65536
+    # Maximum number of keys of a batch request to the platform service
+    MAX_BATCH_SIZE = 1000
+
     def __init__(self, tool: BaseTool, platform_host: str, platform_port: int) -> None:
         """Initialize the ToolCache for tool-specific caching operations.
 
@@ -28,20 +55,46 @@ class ToolCache(PlatformHelper):
             tool=tool, platform_host=platform_host, platform_port=platform_port
         )
 
-    def set(self, key: str, value: str) -> bool:
+    @classmethod
+    def encode_value(cls, value: str) -> str:
+        """Gzips values above the configured size, if compression is enabled."""
+        if not Utils.str_to_bool(os.environ.get("TOOL_CACHE_COMPRESS", "False")):
+            return value
+        min_size = int(
+            os.environ.get("TOOL_CACHE_COMPRESS_MIN_SIZE", cls.DEFAULT_COMPRESS_MIN_SIZE)
+        )
+        if len(value) < min_size:
+            return value
+        compressed = base64.b64encode(gzip.compress(value.encode("utf-8")))
+        return cls.COMPRESSED_PREFIX + compressed.decode("ascii")
+
+    @classmethod
+    def decode_value(cls, value: str) -> str:
+        """Reverses `encode_value`, returning other values as is."""
+        if not value.startswith(cls.COMPRESSED_PREFIX):
+            return value
+        compressed = base64.b64decode(value[len(cls.COMPRESSED_PREFIX) :])
+        return gzip.decompress(compressed).decode("utf-8")
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> bool:
         """Sets the value for a key in the cache.
 
         Args:
             key (str): The key.
             value (str): The value.
+            ttl (int | None): Expiry in seconds, 0 to never expire. Defaults
+                to the platform service's `CACHE_TTL`.
 
         Returns:
             bool: Whether the operation was successful.
         """
         url = f"{self.base_url}/cache"
-        json = {"key": key, "value": value}
-        headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.post(url, json=json, headers=headers)
+        json: dict[str, Any] = {"key": key, "value": self.encode_value(value)}
+        if ttl is not None:
+            json["ttl"] = ttl
+        response = HttpSessionFactory.get_session().post(
+            url, json=json, headers=self._get_headers()
+        )
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully cached data for key: {key}")
@@ -62,13 +115,14 @@ class ToolCache(PlatformHelper):
         Returns:
             str: The value.
         """
-        url = f"{self.base_url}/cache?key={key}"
-        headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.get(url, headers=headers)
+        url = f"{self.base_url}/cache"
+        response = HttpSessionFactory.get_session().get(
+            url, params={"key": key}, headers=self._get_headers()
+        )
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully retrieved cached data for key: {key}")
-            return response.text
+            return self.decode_value(response.text)
         elif response.status_code == 404:
             self.tool.stream_log(f"Data not found for key: {key}", level=LogLevel.WARN)
             return None
@@ -79,6 +133,89 @@ class ToolCache(PlatformHelper):
             )
             return None
 
+    def mset(self, items: dict[str, str], ttl: int | None = None) -> bool:
+        """Sets the values of several keys in a request per `MAX_BATCH_SIZE` keys.
+
+        Falls back to one request per key on platforms without the batch
+        endpoint.
+
+        Args:
+            items (dict[str, str]): Values keyed by their key.
+            ttl (int | None): Expiry in seconds, 0 to never expire. Defaults
+                to the platform service's `CACHE_TTL`.
+
+        Returns:
+            bool: Whether the operation was successful.
+        """
+        return all(
+            [
+                self._mset_batch({key: items[key] for key in keys}, ttl=ttl)
+                for keys in batched(items, self.MAX_BATCH_SIZE)
+            ]
+        )
+
+    def _mset_batch(self, items: dict[str, str], ttl: int | None) -> bool:
+        url = f"{self.base_url}/cache/mset"
+        json: dict[str, Any] = {
+            "items": {key: self.encode_value(value) for key, value in items.items()}
+        }
+        if ttl is not None:
+            json["ttl"] = ttl
+        response = HttpSessionFactory.get_session().post(
+            url, json=json, headers=self._get_headers()
+        )
+
+        if response.status_code == 404:
+            return all([self.set(key, value, ttl=ttl) for key, value in items.items()])
+        if response.status_code == 200:
+            self.tool.stream_log(f"Successfully cached data for {len(items)} keys")
+            return True
+        self.tool.stream_log(
+            f"Error while caching data for {len(items)} keys / {response.reason}",
+            level=LogLevel.ERROR,
+        )
+        return False
+
+    def mget(self, keys: list[str]) -> dict[str, str | None]:
+        """Gets the values of several keys in a request per `MAX_BATCH_SIZE` keys.
+
+        Falls back to one request per key on platforms without the batch
+        endpoint.
+
+        Args:
+            keys (list[str]): The keys.
+
+        Returns:
+            dict[str, str | None]: Values keyed by their key, None for keys
+                which aren't cached or couldn't be retrieved.
+        """
+        values: dict[str, str | None] = {}
+        for batch in batched(keys, self.MAX_BATCH_SIZE):
+            values.update(self._mget_batch(list(batch)))
+        return values
+
+    def _mget_batch(self, keys: list[str]) -> dict[str, str | None]:
+        url = f"{self.base_url}/cache/mget"
+        response = HttpSessionFactory.get_session().post(
+            url, json={"keys": keys}, headers=self._get_headers()
+        )
+
+        if response.status_code == 404:
+            return {key: self.get(key) for key in keys}
+        if response.status_code != 200:
+            self.tool.stream_log(
+                f"Error while retrieving cached data for {len(keys)} keys "
+                f"/ {response.reason}",
+                level=LogLevel.ERROR,
+            )
+            return dict.fromkeys(keys)
+        values = response.json().get("values", {})
+        self.tool.stream_log(f"Retrieved cached data for {len(keys)} keys")
+        return {
+            key: None if values.get(key) is None else self.decode_value(values[key])
+            for key in keys
+        }
+
     def delete(self, key: str) -> bool:
         """Deletes the value for a key in the cache.
 
@@ -88,9 +225,10 @@ class ToolCache(PlatformHelper):
         Returns:
             bool: Whether the operation was successful.
         """
-        url = f"{self.base_url}/cache?key={key}"
-        headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.delete(url, headers=headers)
+        url = f"{self.base_url}/cache"
+        response = HttpSessionFactory.get_session().delete(
+            url, params={"key": key}, headers=self._get_headers()
+        )
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully deleted cached data for key: {key}")
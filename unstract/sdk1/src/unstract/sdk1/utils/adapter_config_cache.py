@@ -0,0 +1,144 @@
+"""In-process cache of adapter configs fetched from platform service."""
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from redis import StrictRedis
+
+from unstract.sdk1.utils.redis_client import RedisClientFactory
+
+logger = logging.getLogger(__name__)
+
+
+class AdapterConfigCache:
+    """Process-wide LRU cache of adapter configs with TTL based expiry.
+
+    Entries are keyed by the platform key and the adapter instance ID so that
+    configs are never shared across organizations. When Redis is configured, the
+    version of each adapter is read from ``adapter_config_version:<id>``. The
+    backend bumps that key whenever an adapter is edited or deleted, which
+    invalidates cached entries in every process before their TTL expires.
+
+    Configurable via environment variables:
+    - ADAPTER_CONFIG_CACHE_TTL (default: 300s, 0 disables the cache)
+    - ADAPTER_CONFIG_CACHE_MAX_SIZE (default: 256 entries)
+    """
+
+    VERSION_KEY_PREFIX = "adapter_config_version"
+    DEFAULT_TTL = 300
+    DEFAULT_MAX_SIZE = 256
+
+    _entries: OrderedDict[tuple[str, str], tuple[float, str | None, dict[str, Any]]] = (
+        OrderedDict()
+    )
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_version_key(cls, adapter_instance_id: str) -> str:
+        """Returns the Redis key holding the version of an adapter's config."""
+        return f"{cls.VERSION_KEY_PREFIX}:{adapter_instance_id}"
+
+    @classmethod
+    def get_ttl(cls) -> int:
+        return int(os.environ.get("ADAPTER_CONFIG_CACHE_TTL", cls.DEFAULT_TTL))
+
+    @classmethod
+    def get_max_size(cls) -> int:
+        return int(os.environ.get("ADAPTER_CONFIG_CACHE_MAX_SIZE", cls.DEFAULT_MAX_SIZE))
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.get_ttl() > 0 and cls.get_max_size() > 0
+
+    @classmethod
+    def get(cls, platform_key: str, adapter_instance_id: str) -> dict[str, Any] | None:
+        """Returns a copy of the cached config, or None on a miss.
+
+        Args:
+            platform_key (str): Platform key used to fetch the config
+            adapter_instance_id (str): ID of the adapter instance
+
+        Returns:
+            dict[str, Any] | None: Cached config if present and still valid
+        """
+        if not cls.is_enabled():
+            return None
+        key = (platform_key, adapter_instance_id)
+        with cls._lock:
+            entry = cls._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, version, config = entry
+        if time.monotonic() >= expires_at or version != cls.get_version(
+            adapter_instance_id
+        ):
+            cls.invalidate(adapter_instance_id)
+            return None
+        with cls._lock:
+            if key in cls._entries:
+                cls._entries.move_to_end(key)
+        return copy.deepcopy(config)
+
+    @classmethod
+    def set(
+        cls,
+        platform_key: str,
+        adapter_instance_id: str,
+        config: dict[str, Any],
+        version: str | None = None,
+    ) -> None:
+        """Caches a copy of the config fetched from platform service.
+
+        Args:
+            platform_key (str): Platform key used to fetch the config
+            adapter_instance_id (str): ID of the adapter instance
+            config (dict[str, Any]): Config returned by platform service
+            version (str | None): Version read with `get_version` before the
+                config was fetched, so that a concurrent edit is not missed
+        """
+        if not cls.is_enabled():
+            return
+        entry = (time.monotonic() + cls.get_ttl(), version, copy.deepcopy(config))
+        max_size = cls.get_max_size()
+        with cls._lock:
+            cls._entries[(platform_key, adapter_instance_id)] = entry
+            cls._entries.move_to_end((platform_key, adapter_instance_id))
+            while len(cls._entries) > max_size:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, adapter_instance_id: str | None = None) -> None:
+        """Drops the cached config of an adapter, or of all adapters.
+
+        Args:
+            adapter_instance_id (str | None): Adapter to invalidate. Clears the
+                whole cache if not provided.
+        """
+        with cls._lock:
+            if adapter_instance_id is None:
+                cls._entries.clear()
+                return
+            for key in [key for key in cls._entries if key[1] == adapter_instance_id]:
+                del cls._entries[key]
+
+    @classmethod
+    def get_version(cls, adapter_instance_id: str) -> str | None:
+        """Returns the current version of an adapter's config, if tracked."""
+        client = cls._get_redis_client() if cls.is_enabled() else None
+        if client is None:
+            return None
+        try:
+            return client.get(cls.get_version_key(adapter_instance_id))
+        except Exception as e:
+            logger.warning(f"Unable to read adapter config version: {e}")
+            return None
+
+    @classmethod
+    def _get_redis_client(cls) -> StrictRedis | None:
+        return RedisClientFactory.get_client()
@@ -0,0 +1,130 @@
+"""Batched, concurrent embedding of many texts."""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from unstract.sdk1.utils.retry_utils import calculate_delay
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Embeds texts in provider sized batches, several batches at a time.
+
+    Texts are grouped into requests holding at most `max_items` texts and
+    about `max_tokens` tokens. Up to `concurrency` requests are in flight at
+    once and rate limited (HTTP 429) requests are retried with exponential
+    backoff.
+
+    Configurable via environment variables:
+    - EMBEDDING_BATCH_MAX_ITEMS (default: batch size of the embedding adapter)
+    - EMBEDDING_BATCH_MAX_TOKENS (default: 32000)
+    - EMBEDDING_BATCH_CONCURRENCY (default: 4)
+    - EMBEDDING_BATCH_MAX_RETRIES (default: 5)
+    - EMBEDDING_BATCH_BASE_DELAY (default: 1.0s)
+    """
+
+    DEFAULT_MAX_TOKENS = 32000
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_MAX_RETRIES = 5
+    DEFAULT_BASE_DELAY = 1.0
+    MAX_DELAY = 60.0
+    # Rough token estimate, avoids running a tokenizer over every chunk
+    CHARS_PER_TOKEN = 4
+
+    def __init__(
+        self,
+        embed_batch: Callable[[list[str]], list[list[float]]],
+        default_max_items: int = 10,
+    ) -> None:
+        """Initialise the batcher.
+
+        Args:
+            embed_batch: Embeds a list of texts in a single provider request
+            default_max_items: Texts per request if not set through the env
+        """
+        self._embed_batch = embed_batch
+        self.max_items = max(
+            int(os.environ.get("EMBEDDING_BATCH_MAX_ITEMS", default_max_items)), 1
+        )
+        self.max_tokens = int(
+            os.environ.get("EMBEDDING_BATCH_MAX_TOKENS", self.DEFAULT_MAX_TOKENS)
+        )
+        self.concurrency = max(
+            int(os.environ.get("EMBEDDING_BATCH_CONCURRENCY", self.DEFAULT_CONCURRENCY)),
+            1,
+        )
+        self.max_retries = int(
+            os.environ.get("EMBEDDING_BATCH_MAX_RETRIES", self.DEFAULT_MAX_RETRIES)
+        )
+        self.base_delay = float(
+            os.environ.get("EMBEDDING_BATCH_BASE_DELAY", self.DEFAULT_BASE_DELAY)
+        )
+
+    @classmethod
+    def estimate_tokens(cls, text: str) -> int:
+        return len(text) // cls.CHARS_PER_TOKEN + 1
+
+    def make_batches(self, texts: list[str]) -> list[list[str]]:
+        """Groups texts into requests within the item and token limits.
+
+        A text larger than the token limit is sent in a request of its own.
+        """
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = self.estimate_tokens(text)
+            if batch and (
+                len(batch) >= self.max_items or batch_tokens + tokens > self.max_tokens
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Returns the embedding of each text, in the order of the texts."""
+        batches = self.make_batches(texts)
+        if not batches:
+            return []
+        if len(batches) == 1 or self.concurrency == 1:
+            results = [self._embed_with_backoff(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.concurrency, len(batches)),
+                thread_name_prefix="embedding",
+            ) as executor:
+                results = list(executor.map(self._embed_with_backoff, batches))
+        return [embedding for result in results for embedding in result]
+
+    def _embed_with_backoff(self, texts: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
+            try:
+                return self._embed_batch(texts)
+            except Exception as e:
+                if not self.is_rate_limited(e) or attempt >= self.max_retries:
+                    raise
+                delay = calculate_delay(
+                    attempt, self.base_delay, 2.0, self.MAX_DELAY, jitter=True
+                )
+                attempt += 1
+                logger.warning(
+                    f"Embedding request rate limited, retry {attempt}/"
+                    f"{self.max_retries} in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+
+    @staticmethod
+    def is_rate_limited(e: Exception) -> bool:
+        for err in (e, getattr(e, "actual_err", None)):
+            if err is not None and getattr(err, "status_code", None) == 429:
+                return True
+        return False
@@ -0,0 +1,282 @@
+"""Content-addressed cache of chunk embeddings."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any
+
+from redis import StrictRedis
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCacheBackend(ABC):
+    """Storage for embeddings, keyed by an opaque string."""
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        """Returns the stored vectors of the keys that are present."""
+        pass
+
+    @abstractmethod
+    def set_many(self, items: dict[str, bytes]) -> None:
+        pass
+
+
+class SQLiteEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Local cache in a SQLite file, for a single worker or host."""
+
+    def __init__(self, path: str) -> None:
+        """Opens the cache, creating the SQLite file if needed.
+
+        Args:
+            path (str): Path of the SQLite file
+        """
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        # Stays below SQLite's limit on the number of bound parameters
+        for start in range(0, len(keys), 500):
+            batch = keys[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM embedding_cache "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            found.update(rows)
+        return found
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, vector) VALUES (?, ?)",
+                list(items.items()),
+            )
+
+
+class RedisEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Shared cache in Redis, entries expire after `ttl` seconds."""
+
+    KEY_PREFIX = "embedding_cache"
+
+    def __init__(self, client: StrictRedis, ttl: int) -> None:
+        """Initialise the Redis backend.
+
+        Args:
+            client (StrictRedis): Client of the Redis instance to use
+            ttl (int): Expiry of entries in seconds, 0 to never expire
+        """
+        self._client = client
+        self._ttl = ttl
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        values = self._client.mget([f"{self.KEY_PREFIX}:{key}" for key in keys])
+        return {
+            key: value
+            for key, value in zip(keys, values, strict=True)
+            if value is not None
+        }
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        pipeline = self._client.pipeline(transaction=False)
+        for key, vector in items.items():
+            pipeline.set(f"{self.KEY_PREFIX}:{key}", vector, ex=self._ttl or None)
+        pipeline.execute()
+
+
+class PostgresEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Shared cache in a Postgres table."""
+
+    def __init__(self, dsn: str) -> None:
+        """Connects to Postgres, creating the cache table if needed.
+
+        Args:
+            dsn (str): Connection string of the Postgres DB
+        """
+        import psycopg2
+
+        self._conn = psycopg2.connect(dsn)
+        self._conn.autocommit = True
+        self._lock = threading.Lock()
+        with self._lock, self._conn.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache "
+                "(key TEXT PRIMARY KEY, vector BYTEA NOT NULL, "
+                "created_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+            )
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        with self._lock, self._conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT key, vector FROM embedding_cache WHERE key = ANY(%s)", (keys,)
+            )
+            return {key: bytes(vector) for key, vector in cursor.fetchall()}
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        from psycopg2.extras import execute_values
+
+        with self._lock, self._conn.cursor() as cursor:
+            execute_values(
+                cursor,
+                "INSERT INTO embedding_cache (key, vector) VALUES %s "
+                "ON CONFLICT (key) DO NOTHING",
+                list(items.items()),
+            )
+
+
+class EmbeddingCache:
+    """Cache of chunk embeddings keyed by embedding config and chunk content.
+
+    The key of a chunk is ``<config hash>:<sha256 of the chunk text>``, so
+    re-indexing an unchanged (or partly changed) document only embeds the
+    chunks that weren't seen before with the same embedding config.
+
+    Configurable via environment variables:
+    - EMBEDDING_CACHE_BACKEND: ``sqlite``, ``redis`` or ``postgres``
+      (default: unset, which disables the cache)
+    - EMBEDDING_CACHE_SQLITE_PATH (default: unstract_embedding_cache.sqlite3
+      in the temp directory)
+    - EMBEDDING_CACHE_TTL: expiry of Redis entries (default: 604800s)
+    - EMBEDDING_CACHE_POSTGRES_DSN: connection string of the Postgres DB
+    """
+
+    SQLITE = "sqlite"
+    REDIS = "redis"
+    POSTGRES = "postgres"
+    DEFAULT_TTL = 7 * 24 * 60 * 60
+    # Parameters which don't change the vectors returned for a text
+    IGNORED_FIELDS = (
+        "api_key",
+        "aws_access_key_id",
+        "aws_secret_access_key",
+        "vertex_credentials",
+        "timeout",
+        "max_retries",
+        "num_retries",
+        "embed_batch_size",
+    )
+
+    _backend: EmbeddingCacheBackend | None = None
+    _backend_initialised = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_backend_name(cls) -> str:
+        return os.environ.get("EMBEDDING_CACHE_BACKEND", "").lower()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._get_backend() is not None
+
+    @classmethod
+    def get_config_hash(cls, adapter_id: str, kwargs: dict[str, Any]) -> str:
+        """Returns a hash of the embedding config that determines the vectors.
+
+        Args:
+            adapter_id (str): ID of the embedding adapter
+            kwargs (dict[str, Any]): Validated adapter parameters
+        """
+        config = {
+            key: value for key, value in kwargs.items() if key not in cls.IGNORED_FIELDS
+        }
+        config["adapter_id"] = adapter_id
+        return hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @classmethod
+    def get_many(cls, config_hash: str, texts: list[str]) -> list[list[float] | None]:
+        """Returns the cached embedding of each text, None for misses."""
+        backend = cls._get_backend()
+        if backend is None or not texts:
+            return [None] * len(texts)
+        keys = [cls._get_key(config_hash, text) for text in texts]
+        try:
+            found = backend.get_many(list(set(keys)))
+        except Exception as e:
+            logger.warning(f"Unable to read embedding cache: {e}")
+            return [None] * len(texts)
+        return [array("f", found[key]).tolist() if key in found else None for key in keys]
+
+    @classmethod
+    def set_many(
+        cls, config_hash: str, texts: list[str], embeddings: list[list[float]]
+    ) -> None:
+        """Caches the embeddings of the texts."""
+        backend = cls._get_backend()
+        if backend is None or not texts:
+            return
+        items = {
+            cls._get_key(config_hash, text): array("f", embedding).tobytes()
+            for text, embedding in zip(texts, embeddings, strict=True)
+        }
+        try:
+            backend.set_many(items)
+        except Exception as e:
+            logger.warning(f"Unable to write embedding cache: {e}")
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops the backend, so that it is created again from the environment."""
+        with cls._lock:
+            cls._backend = None
+            cls._backend_initialised = False
+
+    @classmethod
+    def _get_key(cls, config_hash: str, text: str) -> str:
+        return f"{config_hash}:{hashlib.sha256(text.encode()).hexdigest()}"
+
+    @classmethod
+    def _get_backend(cls) -> EmbeddingCacheBackend | None:
+        if cls._backend_initialised:
+            return cls._backend
+        with cls._lock:
+            if cls._backend_initialised:
+                return cls._backend
+            try:
+                cls._backend = cls._create_backend(cls.get_backend_name())
+            except Exception as e:
+                logger.warning(f"Embedding cache disabled: {e}")
+            cls._backend_initialised = True
+        return cls._backend
+
+    @classmethod
+    def _create_backend(cls, name: str) -> EmbeddingCacheBackend | None:
+        if not name:
+            return None
+        if name == cls.SQLITE:
+            path = os.environ.get(
+                "EMBEDDING_CACHE_SQLITE_PATH",
+                os.path.join(tempfile.gettempdir(), "unstract_embedding_cache.sqlite3"),
+            )
+            return SQLiteEmbeddingCacheBackend(path)
+        if name == cls.REDIS:
+            client = StrictRedis(
+                host=os.environ.get("REDIS_HOST", "unstract-redis"),
+                port=int(os.getenv("REDIS_PORT", 6379)),
+                username=os.getenv("REDIS_USER", "default"),
+                password=os.getenv("REDIS_PASSWORD", ""),
+                db=int(os.getenv("REDIS_DB") or 0),
+            )
+            ttl = int(os.environ.get("EMBEDDING_CACHE_TTL", cls.DEFAULT_TTL))
+            return RedisEmbeddingCacheBackend(client, ttl)
+        if name == cls.POSTGRES:
+            return PostgresEmbeddingCacheBackend(
+                os.environ["EMBEDDING_CACHE_POSTGRES_DSN"]
+            )
+        raise ValueError(f"Unknown embedding cache backend '{name}'")
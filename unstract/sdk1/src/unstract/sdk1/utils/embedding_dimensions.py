@@ -0,0 +1,137 @@
+"""Registry of embedding dimensions, resolved without calling the provider."""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+from redis import StrictRedis
+
+from unstract.sdk1.utils.redis_client import RedisClientFactory
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingDimensionRegistry:
+    """Resolves the vector length of an embedding adapter config.
+
+    Lookups are tried in order:
+    1. Static dimensions of well known models, from
+       ``adapters/embedding1/static/dimensions.json``
+    2. Dimensions discovered earlier in this process
+    3. Dimensions discovered by any process, persisted in Redis under
+       ``embedding_dimension:<config hash>``
+
+    Discovered dimensions are keyed by a hash of the config fields that can
+    change the vector length, so credentials can be rotated without losing them.
+    """
+
+    KEY_PREFIX = "embedding_dimension"
+    STATIC_DIMENSIONS_PATH = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "adapters",
+        "embedding1",
+        "static",
+        "dimensions.json",
+    )
+    # Provider prefixes added to model names by the parameter classes
+    MODEL_PREFIXES = ("azure/", "bedrock/", "ollama/", "vertex_ai/")
+    HASHED_FIELDS = ("model", "api_base", "api_version", "dimensions")
+
+    _discovered: dict[str, int] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_config_hash(cls, adapter_id: str, kwargs: dict[str, Any]) -> str:
+        """Returns a hash of the config fields that determine the dimension.
+
+        Args:
+            adapter_id (str): ID of the embedding adapter
+            kwargs (dict[str, Any]): Validated adapter parameters
+
+        Returns:
+            str: SHA-256 hex digest of the relevant config
+        """
+        config = {field: kwargs.get(field) for field in cls.HASHED_FIELDS}
+        config["adapter_id"] = adapter_id
+        return hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @classmethod
+    def get_known_dimension(cls, provider: str, models: list[str]) -> int | None:
+        """Returns the static dimension of the first known model, if any.
+
+        Args:
+            provider (str): Provider of the embedding adapter, e.g. ``openai``
+            models (list[str]): Candidate model names, most specific first
+        """
+        known = cls._load_static_dimensions().get(provider, {})
+        for model in models:
+            if not model:
+                continue
+            for prefix in cls.MODEL_PREFIXES:
+                model = model.removeprefix(prefix)
+            for name in (model, model.removesuffix(":latest")):
+                if name in known:
+                    return known[name]
+        return None
+
+    @classmethod
+    def get(cls, config_hash: str) -> int | None:
+        """Returns a previously discovered dimension for the config hash."""
+        with cls._lock:
+            dimension = cls._discovered.get(config_hash)
+        if dimension is not None:
+            return dimension
+
+        client = cls._get_redis_client()
+        if client is None:
+            return None
+        try:
+            value = client.get(cls._get_key(config_hash))
+        except Exception as e:
+            logger.warning(f"Unable to read embedding dimension: {e}")
+            return None
+        if value is None:
+            return None
+        dimension = int(value)
+        with cls._lock:
+            cls._discovered[config_hash] = dimension
+        return dimension
+
+    @classmethod
+    def set(cls, config_hash: str, dimension: int) -> None:
+        """Records a dimension discovered by calling the provider."""
+        with cls._lock:
+            cls._discovered[config_hash] = dimension
+        client = cls._get_redis_client()
+        if client is None:
+            return
+        try:
+            client.set(cls._get_key(config_hash), dimension)
+        except Exception as e:
+            logger.warning(f"Unable to persist embedding dimension: {e}")
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forgets the dimensions discovered in this process."""
+        with cls._lock:
+            cls._discovered.clear()
+
+    @classmethod
+    def _get_key(cls, config_hash: str) -> str:
+        return f"{cls.KEY_PREFIX}:{config_hash}"
+
+    @classmethod
+    @functools.cache
+    def _load_static_dimensions(cls) -> dict[str, dict[str, int]]:
+        with open(cls.STATIC_DIMENSIONS_PATH) as f:
+            return json.load(f)
+
+    @classmethod
+    def _get_redis_client(cls) -> StrictRedis | None:
+        return RedisClientFactory.get_client()
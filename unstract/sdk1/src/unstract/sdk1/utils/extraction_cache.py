@@ -0,0 +1,354 @@
+"""Content-addressed cache of text extracted by x2text adapters."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from unstract.sdk1.adapters.x2text.constants import X2TextConstants
+from unstract.sdk1.adapters.x2text.dto import (
+    PageExtractionResult,
+    TextExtractionMetadata,
+    TextExtractionResult,
+)
+from unstract.sdk1.file_storage import EnvHelper, FileStorage, StorageType
+from unstract.sdk1.utils.common import Utils
+
+if TYPE_CHECKING:
+    from unstract.sdk1.x2txt import X2Text
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """Cache of extracted text keyed by file content and x2text config.
+
+    An entry is stored under ``<EXTRACTION_CACHE_DIR>/<key>/`` in permanent
+    file storage, where the key is a hash of the file's SHA-256, the x2text
+    adapter config including its credentials, the organisation the text is
+    extracted for and whether highlighting was requested, so that entries,
+    e.g. LLMWhisperer whisper hashes, are never shared across accounts or
+    organisations. It holds the
+    extracted text and the extraction metadata, including the highlight
+    metadata LLMWhisperer writes next to the output file. On a hit both are
+    written to the output file paths the adapter would have written to, so
+    identical files aren't sent to the text extractor again.
+
+    Configurable via environment variables:
+    - EXTRACTION_CACHE_ENABLED (default: True)
+    - EXTRACTION_CACHE_STORAGE: name of the env holding the file storage
+      config (default: PERMANENT_REMOTE_STORAGE; the cache is disabled if
+      it isn't set)
+    - EXTRACTION_CACHE_DIR (default: unstract/extraction-cache)
+    """
+
+    DEFAULT_STORAGE_ENV = "PERMANENT_REMOTE_STORAGE"
+    DEFAULT_DIR = "unstract/extraction-cache"
+    TEXT_FILE = "extract.txt"
+    METADATA_FILE = "metadata.json"
+    # Parameters which don't change the text extracted from a file
+    IGNORED_FIELDS = (
+        X2TextConstants.X2TEXT_HOST,
+        X2TextConstants.X2TEXT_PORT,
+        X2TextConstants.PLATFORM_SERVICE_API_KEY,
+        "adapter_name",
+        "timeout",
+    )
+
+    _storage: FileStorage | None = None
+    _storage_initialised = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._get_storage() is not None
+
+    @classmethod
+    def get_key(
+        cls,
+        fs: FileStorage,
+        file_path: str,
+        adapter_id: str,
+        adapter_metadata: dict[str, Any],
+        enable_highlight: bool,
+        scope: str = "",
+    ) -> str | None:
+        """Returns the cache key of a file, None if the cache is disabled.
+
+        Args:
+            fs (FileStorage): File storage holding the file
+            file_path (str): Path of the file to extract
+            adapter_id (str): ID of the x2text adapter
+            adapter_metadata (dict[str, Any]): Config of the x2text adapter
+            enable_highlight (bool): Whether highlight metadata is requested
+            scope (str): Identifies the organisation the text is extracted
+                for, e.g. its platform key. Only its hash is part of the key
+        """
+        if not cls.is_enabled():
+            return None
+        try:
+            file_hash = fs.get_hash_from_file(path=file_path)
+        except Exception as e:
+            logger.warning(f"Unable to hash {file_path} for the extraction cache: {e}")
+            return None
+        config = {
+            key: value
+            for key, value in adapter_metadata.items()
+            if key not in cls.IGNORED_FIELDS
+        }
+        config["adapter_id"] = adapter_id
+        config["enable_highlight"] = enable_highlight
+        config["scope"] = scope
+        config_hash = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{file_hash}_{config_hash}"
+
+    @classmethod
+    def process(
+        cls,
+        x2text: "X2Text",
+        file_path: str,
+        output_file_path: str | None,
+        enable_highlight: bool,
+        fs: FileStorage,
+        scope: str,
+        tags: list[str] | None = None,
+    ) -> TextExtractionResult:
+        """Extracts text with an x2text adapter unless it's found in the cache.
+
+        Args:
+            x2text (X2Text): Text extractor
+            file_path (str): Path of the file to extract
+            output_file_path (str | None): File to write the text into
+            enable_highlight (bool): Whether highlight metadata is requested
+            fs (FileStorage): File storage holding the file and output file
+            scope (str): See `get_key`
+            tags (list[str] | None): Tags of the extraction
+        """
+        key = cls.get_key(
+            fs=fs,
+            file_path=file_path,
+            adapter_id=x2text.x2text_adapter_id,
+            adapter_metadata=x2text.x2text_metadata,
+            enable_highlight=enable_highlight,
+            scope=scope,
+        )
+        result = cls.get(key, output_file_path=output_file_path, fs=fs)
+        if result:
+            return result
+        if enable_highlight:
+            result = x2text.process(
+                input_file_path=file_path,
+                output_file_path=output_file_path,
+                enable_highlight=enable_highlight,
+                tags=tags,
+                fs=fs,
+            )
+        else:
+            result = x2text.process(
+                input_file_path=file_path,
+                output_file_path=output_file_path,
+                tags=tags,
+                fs=fs,
+            )
+        cls.set(key, result, output_file_path=output_file_path, fs=fs)
+        return result
+
+    @classmethod
+    def process_pages(
+        cls,
+        x2text: "X2Text",
+        file_path: str,
+        output_file_path: str | None,
+        enable_highlight: bool,
+        fs: FileStorage,
+        scope: str,
+        tags: list[str] | None = None,
+    ) -> Iterator[PageExtractionResult]:
+        """Like `process`, but yields the text page by page while it's extracted.
+
+        A cached extraction is yielded as a single page. The complete text is
+        cached from the output file, hence only when one is written.
+        """
+        key = cls.get_key(
+            fs=fs,
+            file_path=file_path,
+            adapter_id=x2text.x2text_adapter_id,
+            adapter_metadata=x2text.x2text_metadata,
+            enable_highlight=enable_highlight,
+            scope=scope,
+        )
+        result = cls.get(key, output_file_path=output_file_path, fs=fs)
+        if result:
+            yield PageExtractionResult(
+                page_number=1,
+                text=result.extracted_text,
+                extraction_metadata=result.extraction_metadata,
+            )
+            return
+        process_kwargs = (
+            {X2TextConstants.ENABLE_HIGHLIGHT: True} if enable_highlight else {}
+        )
+        extraction_metadata = None
+        for page in x2text.process_pages(
+            input_file_path=file_path,
+            output_file_path=output_file_path,
+            tags=tags,
+            fs=fs,
+            **process_kwargs,
+        ):
+            extraction_metadata = extraction_metadata or page.extraction_metadata
+            yield page
+        if key and output_file_path and fs.exists(output_file_path):
+            extracted_text = fs.read(path=output_file_path, mode="r", encoding="utf-8")
+            cls.set(
+                key,
+                TextExtractionResult(
+                    extracted_text=extracted_text,
+                    extraction_metadata=extraction_metadata,
+                ),
+                output_file_path=output_file_path,
+                fs=fs,
+            )
+
+    @classmethod
+    def get(
+        cls,
+        key: str | None,
+        output_file_path: str | None = None,
+        fs: FileStorage | None = None,
+    ) -> TextExtractionResult | None:
+        """Returns the cached extraction of a key, None on a miss.
+
+        Args:
+            key (str | None): Key returned by `get_key`
+            output_file_path (str | None): File to write the cached text into,
+                along with its highlight metadata
+            fs (FileStorage | None): File storage holding the output file
+        """
+        storage = cls._get_storage()
+        if not key or storage is None:
+            return None
+        entry_dir = cls._get_entry_dir(key)
+        try:
+            metadata_path = f"{entry_dir}/{cls.METADATA_FILE}"
+            if not storage.exists(metadata_path):
+                return None
+            metadata = storage.json_load(metadata_path)
+            extracted_text = storage.read(
+                path=f"{entry_dir}/{cls.TEXT_FILE}", mode="r", encoding="utf-8"
+            )
+        except Exception as e:
+            logger.warning(f"Unable to read extraction cache entry {key}: {e}")
+            return None
+
+        if output_file_path and fs is not None:
+            fs.write(path=output_file_path, mode="w", data=extracted_text)
+            highlight_metadata = metadata.get("highlight_metadata")
+            if highlight_metadata is not None:
+                highlight_path = cls._get_highlight_metadata_path(output_file_path)
+                fs.mkdir(create_parents=True, path=str(highlight_path.parent))
+                fs.write(
+                    path=str(highlight_path),
+                    mode="w",
+                    data=json.dumps(highlight_metadata, ensure_ascii=False, indent=4),
+                )
+        logger.info(f"Extraction cache hit for {key}")
+        extraction_metadata = None
+        if metadata.get("whisper_hash") is not None:
+            extraction_metadata = TextExtractionMetadata(
+                whisper_hash=metadata["whisper_hash"],
+                line_metadata=metadata.get("line_metadata"),
+            )
+        return TextExtractionResult(
+            extracted_text=extracted_text, extraction_metadata=extraction_metadata
+        )
+
+    @classmethod
+    def set(
+        cls,
+        key: str | None,
+        result: TextExtractionResult,
+        output_file_path: str | None = None,
+        fs: FileStorage | None = None,
+    ) -> None:
+        """Stores an extraction, logging instead of raising on failures.
+
+        Args:
+            key (str | None): Key returned by `get_key`
+            result (TextExtractionResult): Result returned by the adapter
+            output_file_path (str | None): File the adapter wrote the text
+                into, whose highlight metadata is cached along with it
+            fs (FileStorage | None): File storage holding the output file
+        """
+        storage = cls._get_storage()
+        if not key or storage is None or not result.extracted_text:
+            return
+        metadata: dict[str, Any] = {}
+        if result.extraction_metadata:
+            metadata["whisper_hash"] = result.extraction_metadata.whisper_hash
+            metadata["line_metadata"] = result.extraction_metadata.line_metadata
+        try:
+            if result.extraction_metadata and output_file_path and fs is not None:
+                highlight_path = str(cls._get_highlight_metadata_path(output_file_path))
+                if fs.exists(highlight_path):
+                    metadata["highlight_metadata"] = fs.json_load(highlight_path)
+            entry_dir = cls._get_entry_dir(key)
+            storage.mkdir(create_parents=True, path=entry_dir)
+            storage.write(
+                path=f"{entry_dir}/{cls.TEXT_FILE}",
+                mode="w",
+                data=result.extracted_text,
+            )
+            # Written last, as its presence marks the entry as complete
+            storage.json_dump(path=f"{entry_dir}/{cls.METADATA_FILE}", data=metadata)
+        except Exception as e:
+            logger.warning(f"Unable to write extraction cache entry {key}: {e}")
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops the storage, so that it is created again from the environment."""
+        with cls._lock:
+            cls._storage = None
+            cls._storage_initialised = False
+
+    @classmethod
+    def _get_entry_dir(cls, key: str) -> str:
+        cache_dir = os.environ.get("EXTRACTION_CACHE_DIR", cls.DEFAULT_DIR)
+        return f"{cache_dir.rstrip('/')}/{key}"
+
+    @staticmethod
+    def _get_highlight_metadata_path(output_file_path: str) -> Path:
+        """Path LLMWhisperer writes the highlight metadata of an output into."""
+        output_path = Path(output_file_path)
+        return output_path.parent / "metadata" / output_path.with_suffix(".json").name
+
+    @classmethod
+    def _get_storage(cls) -> FileStorage | None:
+        if cls._storage_initialised:
+            return cls._storage
+        with cls._lock:
+            if not cls._storage_initialised:
+                cls._storage = cls._create_storage()
+                cls._storage_initialised = True
+        return cls._storage
+
+    @classmethod
+    def _create_storage(cls) -> FileStorage | None:
+        if not Utils.str_to_bool(os.environ.get("EXTRACTION_CACHE_ENABLED", "True")):
+            return None
+        env_name = os.environ.get("EXTRACTION_CACHE_STORAGE", cls.DEFAULT_STORAGE_ENV)
+        if not os.environ.get(env_name):
+            return None
+        try:
+            return EnvHelper.get_storage(
+                storage_type=StorageType.PERMANENT, env_name=env_name
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache disabled, unable to open storage: {e}")
+            return None
@@ -0,0 +1,178 @@
+"""Shared keep-alive HTTP session for clients of Unstract and provider services."""
+
+import logging
+import os
+import threading
+from http.cookiejar import Cookie, DefaultCookiePolicy
+from urllib.request import Request
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from unstract.sdk1.utils.common import Utils
+
+logger = logging.getLogger(__name__)
+
+
+class _ConnectionCounter:
+    """Counts requests sent and connections opened by the shared session."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.connections_created = 0
+
+    def add_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self) -> None:
+        with self._lock:
+            self.connections_created += 1
+
+
+_counter = _ConnectionCounter()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self) -> HTTPConnection:
+        _counter.add_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self) -> HTTPSConnection:
+        _counter.add_connection()
+        return super()._new_conn()
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """Adapter whose connection pools count the connections they open."""
+
+    def init_poolmanager(self, *args: object, **kwargs: object) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, *args: object, **kwargs: object) -> requests.Response:
+        _counter.add_request()
+        return super().send(*args, **kwargs)
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """Keeps the shared session from storing cookies set by any response."""
+
+    def set_ok(self, cookie: Cookie, request: Request) -> bool:
+        return False
+
+
+class HttpSessionFactory:
+    """Provides a keep-alive `requests.Session` shared within a process.
+
+    Connections are pooled per host and reused across calls, instead of a new
+    TCP / TLS handshake for every call made with module-level `requests`
+    functions. The session is recreated in child processes after a fork, since
+    pooled sockets can't be shared between processes. Failures to connect are
+    retried at the HTTP level. Pooled connections closed by the server are
+    detected and replaced by urllib3 before they're reused, but requests
+    failing once sent aren't retried here, since a POST may already have been
+    processed; callers keep their own retries for those.
+
+    The session is shared by clients calling on behalf of different tenants,
+    so it never stores cookies set by responses.
+
+    Configurable via environment variables:
+    - HTTP_POOL_CONNECTIONS (default: 10 hosts with a pool)
+    - HTTP_POOL_MAXSIZE (default: 20 connections per host)
+    - HTTP_MAX_RETRIES (default: 2 retries of connection errors)
+    - HTTP_KEEP_ALIVE (default: True)
+    """
+
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 20
+    DEFAULT_MAX_RETRIES = 2
+
+    _session: requests.Session | None = None
+    # PID of the process the session was created in
+    _session_pid: int | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Returns the shared session of this process."""
+        if cls._session is None or cls._session_pid != os.getpid():
+            with cls._lock:
+                if cls._session is None or cls._session_pid != os.getpid():
+                    cls._session = cls._create_session()
+                    cls._session_pid = os.getpid()
+        return cls._session
+
+    @classmethod
+    def get_stats(cls) -> dict[str, int]:
+        """Returns counters of the connections made by the shared session.
+
+        Returns:
+            dict[str, int]: Number of requests sent, connections created and
+                requests sent over an already open connection
+        """
+        return {
+            "requests": _counter.requests,
+            "connections_created": _counter.connections_created,
+            "connections_reused": max(
+                _counter.requests - _counter.connections_created, 0
+            ),
+        }
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        pool_connections = int(
+            os.environ.get("HTTP_POOL_CONNECTIONS", cls.DEFAULT_POOL_CONNECTIONS)
+        )
+        pool_maxsize = int(os.environ.get("HTTP_POOL_MAXSIZE", cls.DEFAULT_POOL_MAXSIZE))
+        max_retries = int(os.environ.get("HTTP_MAX_RETRIES", cls.DEFAULT_MAX_RETRIES))
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=0.1,
+            raise_on_status=False,
+        )
+        adapter = _PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.cookies.set_policy(_RejectAllCookiesPolicy())
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not Utils.str_to_bool(os.environ.get("HTTP_KEEP_ALIVE", "True")):
+            session.headers["Connection"] = "close"
+        logger.debug(
+            f"Created HTTP session with {pool_maxsize} connections per host "
+            f"for up to {pool_connections} hosts"
+        )
+        return session
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Forgets the session of the parent after a fork."""
+        cls._session = None
+        cls._session_pid = None
+        cls._lock = threading.Lock()
+        _counter._lock = threading.Lock()
+        _counter.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=HttpSessionFactory._reset)
@@ -0,0 +1,82 @@
+"""Completeness markers of documents indexed into a vector DB."""
+
+import logging
+import os
+
+from redis import StrictRedis
+
+from unstract.sdk1.utils.redis_client import RedisClientFactory
+
+logger = logging.getLogger(__name__)
+
+
+class IndexMarker:
+    """Records that all nodes of a document were written to the vector DB.
+
+    A marker holding the node count is set in Redis once `VectorDB` finished
+    indexing a document and dropped when its nodes are deleted. Since the
+    `doc_id` is derived from the file hash, the adapter configs and the chunk
+    params, a document with a marker can be reused as is, while one with nodes
+    but no marker was only partly indexed and has to be indexed again.
+
+    Markers are optional; without Redis the completeness of a document is
+    unknown and callers decide based on the nodes present alone. Redis is
+    configured as described in `RedisClientFactory`.
+
+    Markers expire after `INDEX_MARKER_TTL` seconds (default: 30 days, 0 never
+    expires), after which the document is indexed again.
+    """
+
+    KEY_PREFIX = "index_complete"
+    DEFAULT_TTL = 30 * 24 * 60 * 60
+
+    @classmethod
+    def get(cls, doc_id: str) -> int | None:
+        """Returns the node count recorded for a document.
+
+        Returns:
+            int | None: Node count, 0 if no marker is set and None if markers
+                are unavailable
+        """
+        client = cls._get_redis_client()
+        if client is None:
+            return None
+        try:
+            value = client.get(cls._get_key(doc_id))
+        except Exception as e:
+            logger.warning(f"Unable to read index marker of {doc_id}: {e}")
+            return None
+        return int(value) if value is not None else 0
+
+    @classmethod
+    def set(cls, doc_id: str, node_count: int) -> None:
+        """Marks a document as completely indexed with `node_count` nodes."""
+        client = cls._get_redis_client()
+        if client is None or node_count <= 0:
+            return
+        try:
+            client.set(cls._get_key(doc_id), node_count, ex=cls.get_ttl() or None)
+        except Exception as e:
+            logger.warning(f"Unable to write index marker of {doc_id}: {e}")
+
+    @classmethod
+    def delete(cls, doc_id: str) -> None:
+        client = cls._get_redis_client()
+        if client is None:
+            return
+        try:
+            client.delete(cls._get_key(doc_id))
+        except Exception as e:
+            logger.warning(f"Unable to delete index marker of {doc_id}: {e}")
+
+    @classmethod
+    def get_ttl(cls) -> int:
+        return int(os.environ.get("INDEX_MARKER_TTL", cls.DEFAULT_TTL))
+
+    @classmethod
+    def _get_key(cls, doc_id: str) -> str:
+        return f"{cls.KEY_PREFIX}:{doc_id}"
+
+    @classmethod
+    def _get_redis_client(cls) -> StrictRedis | None:
+        return RedisClientFactory.get_client()
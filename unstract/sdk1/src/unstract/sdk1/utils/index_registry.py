@@ -0,0 +1,71 @@
+"""Local registry of documents indexed by this process."""
+
+import os
+import threading
+from collections import OrderedDict
+
+from unstract.sdk1.utils.common import Utils
+
+
+class IndexRegistry:
+    """Process-wide LRU map of (vector DB instance, doc_id) to node count.
+
+    Counts are recorded when a document is indexed and dropped when it is
+    deleted through `VectorDB`, so that the common "is this document indexed?"
+    check needs no vector DB round-trip. Only documents indexed by this process
+    are known; a miss falls back to the vector DB's count API.
+
+    The registry cannot see deletions made by other processes, so it is opt-in.
+    Configurable via environment variables:
+    - INDEX_REGISTRY_ENABLED (default: False)
+    - INDEX_REGISTRY_MAX_SIZE (default: 10000 documents)
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+
+    _counts: OrderedDict[tuple[str, str], int] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return Utils.str_to_bool(os.environ.get("INDEX_REGISTRY_ENABLED", "False"))
+
+    @classmethod
+    def get_max_size(cls) -> int:
+        return int(os.environ.get("INDEX_REGISTRY_MAX_SIZE", cls.DEFAULT_MAX_SIZE))
+
+    @classmethod
+    def get(cls, vector_db_instance_id: str, doc_id: str) -> int | None:
+        """Returns the recorded node count of a document, None if unknown."""
+        if not cls.is_enabled():
+            return None
+        key = (vector_db_instance_id, doc_id)
+        with cls._lock:
+            count = cls._counts.get(key)
+            if count is not None:
+                cls._counts.move_to_end(key)
+        return count
+
+    @classmethod
+    def set(cls, vector_db_instance_id: str, doc_id: str, count: int) -> None:
+        """Records the node count of a document that was indexed."""
+        if not cls.is_enabled() or count <= 0:
+            return
+        key = (vector_db_instance_id, doc_id)
+        max_size = cls.get_max_size()
+        with cls._lock:
+            cls._counts[key] = count
+            cls._counts.move_to_end(key)
+            while len(cls._counts) > max_size:
+                cls._counts.popitem(last=False)
+
+    @classmethod
+    def forget(cls, vector_db_instance_id: str, doc_id: str) -> None:
+        """Drops a document whose nodes were deleted."""
+        with cls._lock:
+            cls._counts.pop((vector_db_instance_id, doc_id), None)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._counts.clear()
@@ -0,0 +1,57 @@
+"""Redis client shared by the optional Redis-backed state of the SDK."""
+
+import logging
+import os
+import threading
+
+from redis import StrictRedis
+
+logger = logging.getLogger(__name__)
+
+
+class RedisClientFactory:
+    """Creates the Redis client of the process once, on first use.
+
+    Adapter config versions, embedding dimensions and index markers are kept
+    in Redis when it's configured, and work without it otherwise. The client
+    decodes responses and fails fast, so that an unreachable Redis doesn't
+    hold up the callers which treat it as optional.
+
+    Configurable via environment variables:
+    - REDIS_HOST (unset disables Redis)
+    - REDIS_PORT (default: 6379)
+    - REDIS_USER (default: default)
+    - REDIS_PASSWORD (default: empty)
+    - REDIS_DB (default: 0)
+    """
+
+    SOCKET_TIMEOUT = 1
+
+    _client: StrictRedis | None = None
+    _initialised = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls) -> StrictRedis | None:
+        """Returns the shared Redis client, None if Redis isn't configured."""
+        if cls._initialised:
+            return cls._client
+        with cls._lock:
+            if cls._initialised:
+                return cls._client
+            if os.environ.get("REDIS_HOST"):
+                try:
+                    cls._client = StrictRedis(
+                        host=os.environ["REDIS_HOST"],
+                        port=int(os.getenv("REDIS_PORT", 6379)),
+                        username=os.getenv("REDIS_USER", "default"),
+                        password=os.getenv("REDIS_PASSWORD", ""),
+                        db=int(os.getenv("REDIS_DB") or 0),
+                        decode_responses=True,
+                        socket_timeout=cls.SOCKET_TIMEOUT,
+                        socket_connect_timeout=cls.SOCKET_TIMEOUT,
+                    )
+                except Exception as e:
+                    logger.warning(f"Redis disabled: {e}")
+            cls._initialised = True
+        return cls._client
@@ -0,0 +1,352 @@
+"""Background emitter of usage records to the platform service."""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Any
+
+import requests
+
+from unstract.sdk1.utils.common import Utils
+from unstract.sdk1.utils.http_session import HttpSessionFactory
+
+logger = logging.getLogger(__name__)
+
+# Records are grouped by the platform they're sent to and the key to send with
+UsageItem = tuple[str, str, dict[str, Any]]
+
+
+class UsageEmitter:
+    """Sends usage records to the platform service off the caller's thread.
+
+    Records are put on a bounded in-memory queue and a flush thread sends them
+    in batches to the platform's ``/usage/batch`` endpoint, falling back to the
+    per-record endpoints of platforms that don't have it. Records which can't
+    be delivered, because the platform is unreachable or the queue is full, are
+    appended to a local spill file and re-sent once the platform responds
+    again. The spill file holds a fingerprint of the platform key instead of
+    the key, so spilled records are re-sent once a record with the same key is
+    emitted by the process. Pending records are flushed when the process exits.
+
+    Configurable via environment variables:
+    - USAGE_EMITTER_ENABLED (default: True, False sends each record inline)
+    - USAGE_EMITTER_MAX_QUEUE_SIZE (default: 10000 records)
+    - USAGE_EMITTER_BATCH_SIZE (default: 100 records)
+    - USAGE_EMITTER_FLUSH_INTERVAL (default: 1.0s)
+    - USAGE_EMITTER_FLUSH_TIMEOUT (default: 10s wait for batches in flight, when
+      flushing before usage is read back)
+    - USAGE_EMITTER_SPILL_PATH (default: unstract_usage_spill.jsonl in the temp
+      directory)
+    """
+
+    TOKEN_USAGE = "usage"
+    PAGE_USAGE = "page_usage"
+    ENDPOINTS = {TOKEN_USAGE: "usage", PAGE_USAGE: "page-usage"}
+    BATCH_ENDPOINT = "usage/batch"
+    DEFAULT_MAX_QUEUE_SIZE = 10000
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    DEFAULT_FLUSH_TIMEOUT = 10.0
+    REQUEST_TIMEOUT = 30
+
+    _queue: "queue.Queue[UsageItem] | None" = None
+    _thread: threading.Thread | None = None
+    _wakeup = threading.Event()
+    _lock = threading.Lock()
+    # Held while records are sent, so that `flush` waits for in-flight batches
+    _send_lock = threading.Lock()
+    _spill_lock = threading.Lock()
+    # Platform keys of emitted records by fingerprint, to re-send spilled ones
+    _keys: dict[str, str] = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return Utils.str_to_bool(os.environ.get("USAGE_EMITTER_ENABLED", "True"))
+
+    @classmethod
+    def get_batch_size(cls) -> int:
+        return max(
+            int(os.environ.get("USAGE_EMITTER_BATCH_SIZE", cls.DEFAULT_BATCH_SIZE)), 1
+        )
+
+    @classmethod
+    def get_flush_timeout(cls) -> float:
+        return float(
+            os.environ.get("USAGE_EMITTER_FLUSH_TIMEOUT", cls.DEFAULT_FLUSH_TIMEOUT)
+        )
+
+    @classmethod
+    def get_spill_path(cls) -> str:
+        return os.environ.get(
+            "USAGE_EMITTER_SPILL_PATH",
+            os.path.join(tempfile.gettempdir(), "unstract_usage_spill.jsonl"),
+        )
+
+    @classmethod
+    def emit(
+        cls,
+        base_url: str,
+        platform_api_key: str,
+        record_type: str,
+        data: dict[str, Any],
+    ) -> None:
+        """Queues a usage record to be sent in the background.
+
+        Args:
+            base_url (str): Base URL of the platform service
+            platform_api_key (str): Platform key to send the record with
+            record_type (str): `TOKEN_USAGE` or `PAGE_USAGE`
+            data (dict[str, Any]): Payload of the per-record usage endpoint
+        """
+        item = (base_url, platform_api_key, {"type": record_type, **data})
+        cls._keys.setdefault(cls._get_key_hash(platform_api_key), platform_api_key)
+        try:
+            cls._get_queue().put_nowait(item)
+        except queue.Full:
+            logger.warning("Usage queue is full, spilling record to file")
+            cls._spill([item])
+            return
+        if cls._queue.qsize() >= cls.get_batch_size():
+            cls._wakeup.set()
+
+    @classmethod
+    def flush(cls, timeout: float | None = None) -> bool:
+        """Sends all queued records, waiting for batches already in flight.
+
+        Args:
+            timeout (float | None): Seconds to wait for batches in flight, None
+                to wait until they're sent
+
+        Returns:
+            bool: False if batches in flight were still being sent on timeout
+        """
+        if cls._queue is None:
+            return True
+        if not cls._send_lock.acquire(timeout=-1 if timeout is None else timeout):
+            logger.warning(f"Usage records weren't flushed within {timeout}s")
+            return False
+        try:
+            cls._send_pending()
+        finally:
+            cls._send_lock.release()
+        return True
+
+    @classmethod
+    def _get_queue(cls) -> "queue.Queue[UsageItem]":
+        if cls._queue is not None and cls._thread is not None:
+            return cls._queue
+        with cls._lock:
+            if cls._queue is None:
+                max_size = int(
+                    os.environ.get(
+                        "USAGE_EMITTER_MAX_QUEUE_SIZE", cls.DEFAULT_MAX_QUEUE_SIZE
+                    )
+                )
+                cls._queue = queue.Queue(maxsize=max_size)
+            if cls._thread is None:
+                cls._thread = threading.Thread(
+                    target=cls._run, name="usage-emitter", daemon=True
+                )
+                cls._thread.start()
+        return cls._queue
+
+    @classmethod
+    def _run(cls) -> None:
+        interval = float(
+            os.environ.get("USAGE_EMITTER_FLUSH_INTERVAL", cls.DEFAULT_FLUSH_INTERVAL)
+        )
+        while True:
+            cls._wakeup.wait(interval)
+            cls._wakeup.clear()
+            try:
+                cls.flush()
+            except Exception as e:
+                logger.error(f"Error while flushing usage records: {e}")
+
+    @classmethod
+    def _send_pending(cls) -> None:
+        items: list[UsageItem] = []
+        while True:
+            try:
+                items.append(cls._queue.get_nowait())
+            except queue.Empty:
+                break
+        if items and cls._send(items):
+            cls._replay_spill()
+
+    @classmethod
+    def _send(cls, items: list[UsageItem]) -> bool:
+        """Sends records in batches, spilling the ones that weren't delivered.
+
+        Returns:
+            bool: Whether the platform could be reached for all records
+        """
+        grouped: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for base_url, platform_api_key, record in items:
+            grouped[(base_url, platform_api_key)].append(record)
+
+        undelivered: list[UsageItem] = []
+        batch_size = cls.get_batch_size()
+        for (base_url, platform_api_key), records in grouped.items():
+            for start in range(0, len(records), batch_size):
+                batch = records[start : start + batch_size]
+                undelivered.extend(
+                    (base_url, platform_api_key, record)
+                    for record in cls._send_batch(base_url, platform_api_key, batch)
+                )
+        if undelivered:
+            cls._spill(undelivered)
+        return not undelivered
+
+    @classmethod
+    def _send_batch(
+        cls, base_url: str, platform_api_key: str, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Sends a batch of records, returning the ones to retry later."""
+        headers = {"Authorization": f"Bearer {platform_api_key}"}
+        try:
+            response = HttpSessionFactory.get_session().post(
+                f"{base_url}/{cls.BATCH_ENDPOINT}",
+                headers=headers,
+                json={"records": records},
+                timeout=cls.REQUEST_TIMEOUT,
+            )
+        except requests.RequestException as e:
+            logger.error(f"Error while pushing usage details: {e}")
+            return records
+        if response.status_code == 404:
+            # Platform service without the bulk endpoint
+            return [
+                record
+                for record in records
+                if not cls._send_record(base_url, headers, record)
+            ]
+        if response.status_code >= 500:
+            logger.error(
+                "Error while pushing usage details: "
+                f"{response.status_code} {response.reason}"
+            )
+            return records
+        if response.status_code != 200:
+            # Rejected records would be rejected again, so they're not retried
+            logger.error(
+                f"Usage details rejected: {response.status_code} {response.reason}"
+            )
+            return []
+        try:
+            errors = response.json().get("errors")
+        except ValueError:
+            errors = None
+        if errors:
+            # Invalid records are rejected on their own, the others are recorded
+            logger.error(f"{len(errors)} usage record(s) rejected: {errors}")
+        return []
+
+    @classmethod
+    def _send_record(
+        cls, base_url: str, headers: dict[str, str], record: dict[str, Any]
+    ) -> bool:
+        """Sends a record to its per-record endpoint, False if to be retried."""
+        data = {key: value for key, value in record.items() if key != "type"}
+        url = f"{base_url}/{cls.ENDPOINTS[record['type']]}"
+        try:
+            response = HttpSessionFactory.get_session().post(
+                url, headers=headers, json=data, timeout=cls.REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
+            logger.error(f"Error while pushing usage details: {e}")
+            return False
+        if response.status_code != 200:
+            logger.error(
+                "Error while pushing usage details: "
+                f"{response.status_code} {response.reason}"
+            )
+        return response.status_code < 500
+
+    @staticmethod
+    def _get_key_hash(platform_api_key: str) -> str:
+        return hashlib.sha256(platform_api_key.encode()).hexdigest()
+
+    @classmethod
+    def _spill(cls, items: list[UsageItem]) -> None:
+        cls._append_spill(
+            [
+                json.dumps(
+                    {
+                        "base_url": base_url,
+                        "key_hash": cls._get_key_hash(key),
+                        "record": record,
+                    },
+                    default=str,
+                )
+                + "\n"
+                for base_url, key, record in items
+            ]
+        )
+
+    @classmethod
+    def _append_spill(cls, lines: list[str]) -> None:
+        path = cls.get_spill_path()
+        try:
+            with cls._spill_lock:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+                with os.fdopen(fd, "a") as spill_file:
+                    spill_file.write("".join(lines))
+            logger.warning(f"Spilled {len(lines)} usage record(s) to {path}")
+        except OSError as e:
+            logger.error(f"Unable to spill {len(lines)} usage record(s): {e}")
+
+    @classmethod
+    def _replay_spill(cls) -> None:
+        """Re-sends records spilled while the platform was unreachable."""
+        path = cls.get_spill_path()
+        replay_path = f"{path}.{os.getpid()}.replay"
+        with cls._spill_lock:
+            try:
+                # Claimed atomically, other processes may share the spill file
+                os.replace(path, replay_path)
+            except FileNotFoundError:
+                return
+            except OSError as e:
+                logger.error(f"Unable to read spilled usage records: {e}")
+                return
+        items: list[UsageItem] = []
+        # Records of keys this process hasn't seen stay spilled
+        unresolved: list[str] = []
+        with open(replay_path) as replay_file:
+            for line in replay_file:
+                if not line.strip():
+                    continue
+                spilled = json.loads(line)
+                key = cls._keys.get(spilled["key_hash"])
+                if key is None:
+                    unresolved.append(line)
+                else:
+                    items.append((spilled["base_url"], key, spilled["record"]))
+        os.remove(replay_path)
+        if unresolved:
+            cls._append_spill(unresolved)
+        if items:
+            logger.info(f"Re-sending {len(items)} spilled usage record(s)")
+            cls._send(items)
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Forgets the queue and thread of the parent after a fork."""
+        cls._queue = None
+        cls._thread = None
+        cls._wakeup = threading.Event()
+        cls._lock = threading.Lock()
+        cls._send_lock = threading.Lock()
+        cls._spill_lock = threading.Lock()
+
+
+atexit.register(UsageEmitter.flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=UsageEmitter._reset)
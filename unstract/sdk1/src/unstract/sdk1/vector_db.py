@@ -1,11 +1,14 @@
 import logging
-from collections.abc import Sequence
+import os
+from collections import Counter
+from collections.abc import Iterable, Sequence
 
 from deprecated import deprecated
 from llama_index.core import StorageContext, VectorStoreIndex
 from llama_index.core.indices.base import IndexType
 from llama_index.core.node_parser import SentenceSplitter
-from llama_index.core.schema import BaseNode, Document
+from llama_index.core.schema import BaseNode, Document, MetadataMode
+from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
 from llama_index.core.vector_stores.types import (
     BasePydanticVectorStore,
     VectorStore,
@@ -19,6 +22,10 @@ from unstract.sdk1.embedding import EmbeddingCompat
 from unstract.sdk1.exceptions import SdkError, VectorDBError
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.utils.embedding_batcher import EmbeddingBatcher
+from unstract.sdk1.utils.embedding_cache import EmbeddingCache
+from unstract.sdk1.utils.index_marker import IndexMarker
+from unstract.sdk1.utils.index_registry import IndexRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +35,9 @@ class VectorDB:
 
     vector_db_adapters = adapters
     DEFAULT_EMBEDDING_DIMENSION = 1536
+    DEFAULT_INSERT_BATCH_SIZE = 2048
+    # Nodes of a document fetched by a similarity query, where they can't be listed
+    MAX_DOCUMENT_NODES = 1000
     EMBEDDING_INSTANCE_ERROR = "Vector DB does not have an embedding initialised."
 
     def __init__(
@@ -123,6 +133,28 @@ class VectorDB:
         show_progress: bool = False,
         **index_kwargs: object,
     ) -> IndexType:
+        return self.index_document_batches(
+            [documents],
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            show_progress=show_progress,
+            **index_kwargs,
+        )
+
+    def index_document_batches(
+        self,
+        document_batches: Iterable[Sequence[Document]],
+        chunk_size: int = 1024,
+        chunk_overlap: int = 128,
+        show_progress: bool = False,
+        **index_kwargs: object,
+    ) -> IndexType:
+        """Indexes documents arriving in batches, e.g. while they're extracted.
+
+        Each batch is chunked, embedded and stored before the next batch is
+        consumed, so chunks never span two batches. Documents are marked as
+        complete once the nodes of all batches are stored.
+        """
         if not self._embedding_instance:
             raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
         storage_context = self.get_storage_context()
@@ -143,14 +175,86 @@ class VectorDB:
         if callback_manager is not None:
             index_kwargs_with_callback["callback_manager"] = callback_manager
 
-        return VectorStoreIndex.from_documents(
-            documents,
-            storage_context=storage_context,
-            show_progress=show_progress,
-            embed_model=self._embedding_instance,
-            transformations=[parser],
-            **index_kwargs_with_callback,
+        index_kwargs_with_callback.setdefault(
+            "insert_batch_size", self.get_insert_batch_size()
+        )
+        index = None
+        node_counts: Counter[str] = Counter()
+        for documents in document_batches:
+            nodes = parser.get_nodes_from_documents(
+                documents, show_progress=show_progress
+            )
+            self._embed_nodes(nodes)
+            if index is None:
+                # Nodes already carry their embeddings, so the index only stores
+                # them, upserting `insert_batch_size` nodes per request
+                index = VectorStoreIndex(
+                    nodes=nodes,
+                    storage_context=storage_context,
+                    show_progress=show_progress,
+                    embed_model=self._embedding_instance,
+                    transformations=[parser],
+                    **index_kwargs_with_callback,
+                )
+            else:
+                index.insert_nodes(nodes)
+            node_counts.update(node.ref_doc_id for node in nodes)
+        if index is None:
+            index = VectorStoreIndex(
+                nodes=[],
+                storage_context=storage_context,
+                embed_model=self._embedding_instance,
+                transformations=[parser],
+                **index_kwargs_with_callback,
+            )
+        # Documents are complete only once all of their nodes are stored
+        for ref_doc_id, count in node_counts.items():
+            IndexRegistry.set(self._adapter_instance_id, ref_doc_id, count)
+            IndexMarker.set(ref_doc_id, count)
+        return index
+
+    @classmethod
+    def get_insert_batch_size(cls) -> int:
+        return int(
+            os.environ.get("VECTOR_DB_INSERT_BATCH_SIZE", cls.DEFAULT_INSERT_BATCH_SIZE)
+        )
+
+    def _embed_nodes(self, nodes: Sequence[BaseNode]) -> None:
+        """Sets the embedding of each node, using cached embeddings where possible.
+
+        Chunks are looked up in the `EmbeddingCache` by their content. Only
+        the misses are sent to the embedding provider, grouped into batched
+        requests by `EmbeddingBatcher`, and are cached for the next time the
+        same content is indexed.
+        """
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        config_hash = None
+        cached: list[list[float] | None] = [None] * len(texts)
+        if EmbeddingCache.is_enabled() and hasattr(
+            self._embedding_instance, "get_config_hash"
+        ):
+            config_hash = self._embedding_instance.get_config_hash()
+            cached = EmbeddingCache.get_many(config_hash, texts)
+
+        misses = [i for i, embedding in enumerate(cached) if embedding is None]
+        if config_hash:
+            logger.info(
+                f"Embedding cache hits: {len(texts) - len(misses)}/{len(texts)} chunks"
+            )
+        embed_batch = getattr(self._embedding_instance, "embed_batch", None)
+        if embed_batch is None:
+            embed_batch = self._embedding_instance.get_text_embedding_batch
+        batcher = EmbeddingBatcher(
+            embed_batch=embed_batch,
+            default_max_items=self._embedding_instance.embed_batch_size,
         )
+        embeddings = batcher.embed([texts[i] for i in misses])
+        for i, embedding in zip(misses, embeddings, strict=True):
+            cached[i] = embedding
+        for node, embedding in zip(nodes, cached, strict=True):
+            node.embedding = embedding
+        if config_hash:
+            EmbeddingCache.set_many(config_hash, [texts[i] for i in misses], embeddings)
 
     def get_vector_store_index(self, **kwargs: object) -> VectorStoreIndex:
         if not self._embedding_instance:
@@ -169,6 +273,70 @@ class VectorDB:
             **index_kwargs,
         )
 
+    def get_document_nodes(self, doc_id: str) -> list[BaseNode]:
+        """Returns all nodes of a document, with their embeddings where known.
+
+        Nodes are listed without a similarity query where the vector DB
+        supports it, else at most `MAX_DOCUMENT_NODES` of them are returned,
+        so a result of that size may be incomplete. Embeddings the vector DB
+        doesn't return are looked up in the `EmbeddingCache`, but never
+        computed, so they may be None.
+
+        Args:
+            doc_id (str): ID of the indexed document
+
+        Returns:
+            list[BaseNode]: Nodes of the document
+        """
+        filters = MetadataFilters(filters=[ExactMatchFilter(key="doc_id", value=doc_id)])
+        try:
+            nodes = self._vector_db_instance.get_nodes(filters=filters)
+        except (NotImplementedError, AttributeError):
+            retriever = self.get_vector_store_index().as_retriever(
+                similarity_top_k=self.MAX_DOCUMENT_NODES, filters=filters
+            )
+            nodes = [node.node for node in retriever.retrieve(" ")]
+        except Exception as e:
+            raise parse_vector_db_err(e, self.vector_db_adapter_class) from e
+
+        missing = [node for node in nodes if node.embedding is None]
+        if missing and hasattr(self._embedding_instance, "get_config_hash"):
+            cached = EmbeddingCache.get_many(
+                self._embedding_instance.get_config_hash(),
+                [node.get_content(metadata_mode=MetadataMode.EMBED) for node in missing],
+            )
+            for node, embedding in zip(missing, cached, strict=True):
+                node.embedding = embedding
+        return nodes
+
+    def get_query_embedding(self, query: str) -> list[float]:
+        """Returns the embedding of a query, as used for similarity queries."""
+        if not self._embedding_instance:
+            raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
+        return self._embedding_instance.get_query_embedding(query)
+
+    def get_query_embeddings(self, queries: list[str]) -> list[list[float]]:
+        """Returns the embeddings of several queries.
+
+        Adapters embedding queries like any other text send them to the
+        provider in a single request.
+        """
+        if not self._embedding_instance:
+            raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
+        embed_batch = getattr(self._embedding_instance, "embed_batch", None)
+        if embed_batch is None:
+            # Other models may embed queries differently from documents
+            return [
+                self._embedding_instance.get_query_embedding(query) for query in queries
+            ]
+        return embed_batch(queries)
+
+    def get_embedding_config_hash(self) -> str | None:
+        """Hash of the config of the embedding, None if it isn't known."""
+        if not hasattr(self._embedding_instance, "get_config_hash"):
+            return None
+        return self._embedding_instance.get_config_hash()
+
     def get_storage_context(self) -> StorageContext:
         return StorageContext.from_defaults(vector_store=self._vector_db_instance)
 
@@ -181,6 +349,8 @@ class VectorDB:
     def delete(self, ref_doc_id: str, **delete_kwargs: object) -> None:
         if not self.vector_db_adapter_class:
             raise VectorDBError("Vector DB is not initialised properly")
+        IndexRegistry.forget(self._adapter_instance_id, ref_doc_id)
+        IndexMarker.delete(ref_doc_id)
         self.vector_db_adapter_class.delete(
             ref_doc_id=ref_doc_id, delete_kwargs=delete_kwargs
         )
@@ -196,6 +366,72 @@ class VectorDB:
             ref_doc_id=ref_doc_id,
             nodes=nodes,
         )
+        IndexRegistry.set(self._adapter_instance_id, ref_doc_id, len(nodes))
+        IndexMarker.set(ref_doc_id, len(nodes))
+
+    def count_nodes(self, doc_id: str) -> int | None:
+        """Counts the nodes stored for a document without a similarity query.
+
+        Args:
+            doc_id (str): ID of the indexed document
+
+        Returns:
+            int | None: Number of nodes, None if the vector DB can't count them
+                natively and a similarity query is needed instead
+        """
+        count = IndexRegistry.get(self._adapter_instance_id, doc_id)
+        if count is not None:
+            return count
+        if not self.vector_db_adapter_class:
+            raise VectorDBError("Vector DB is not initialised properly")
+        try:
+            count = self.vector_db_adapter_class.count_nodes(ref_doc_id=doc_id)
+        except Exception as e:
+            raise parse_vector_db_err(e, self.vector_db_adapter_class) from e
+        if count:
+            IndexRegistry.set(self._adapter_instance_id, doc_id, count)
+        return count
+
+    def has_document(self, doc_id: str) -> bool | None:
+        """Checks if a document is indexed without a similarity query.
+
+        Args:
+            doc_id (str): ID of the indexed document
+
+        Returns:
+            bool | None: Whether the document exists, None if the vector DB
+                can't look it up natively and a similarity query is needed
+        """
+        if IndexRegistry.get(self._adapter_instance_id, doc_id):
+            return True
+        if not self.vector_db_adapter_class:
+            raise VectorDBError("Vector DB is not initialised properly")
+        try:
+            return self.vector_db_adapter_class.has_document(ref_doc_id=doc_id)
+        except Exception as e:
+            raise parse_vector_db_err(e, self.vector_db_adapter_class) from e
+
+    def is_document_complete(self, doc_id: str) -> bool | None:
+        """Checks if all nodes of a document were indexed.
+
+        A document is complete if `index_document` or `add` recorded an
+        `IndexMarker` for it and, where the vector DB can count them, its nodes
+        are all still present.
+
+        Args:
+            doc_id (str): ID of the indexed document
+
+        Returns:
+            bool | None: Whether the document is complete, None if markers
+                are unavailable
+        """
+        marker = IndexMarker.get(doc_id)
+        if marker is None:
+            return None
+        if marker == 0:
+            return False
+        count = self.count_nodes(doc_id)
+        return count is None or count == marker
 
     def close(self, **kwargs: object) -> None:
         if not self.vector_db_adapter_class:
@@ -1,11 +1,15 @@
 import io
+from collections.abc import Iterator
 from typing import Any
 
 import pdfplumber
 from unstract.sdk1.adapters.constants import Common
 from unstract.sdk1.adapters.x2text import adapters
 from unstract.sdk1.adapters.x2text.constants import X2TextConstants
-from unstract.sdk1.adapters.x2text.dto import TextExtractionResult
+from unstract.sdk1.adapters.x2text.dto import (
+    PageExtractionResult,
+    TextExtractionResult,
+)
 from unstract.sdk1.adapters.x2text.x2text_adapter import X2TextAdapter
 from unstract.sdk1.audit import Audit
 from unstract.sdk1.constants import LogLevel, MimeType, ToolEnv
@@ -36,6 +40,8 @@ class X2Text:
         self._x2text_adapters = adapters
         self._adapter_instance_id = adapter_instance_id
         self._x2text_instance: X2TextAdapter = None
+        self._x2text_adapter_id: str | None = None
+        self._x2text_metadata: dict[str, Any] = {}
         self._usage_kwargs = usage_kwargs
         self._initialise()
 
@@ -43,6 +49,14 @@ class X2Text:
     def x2text_instance(self) -> X2TextAdapter:
         return self._x2text_instance
 
+    @property
+    def x2text_adapter_id(self) -> str | None:
+        return self._x2text_adapter_id
+
+    @property
+    def x2text_metadata(self) -> dict[str, Any]:
+        return self._x2text_metadata
+
     def _initialise(self) -> None:
         if self._adapter_instance_id:
             self._x2text_instance = self._get_x2text()
@@ -80,6 +94,8 @@ class X2Text:
                     )
 
                 self._x2text_instance = x2text_adapter(x2text_metadata)
+                self._x2text_adapter_id = x2text_adapter_id
+                self._x2text_metadata = x2text_metadata
 
                 return self._x2text_instance
             else:
@@ -123,6 +139,30 @@ class X2Text:
         self.push_usage_details(input_file_path, mime_type, fs=fs)
         return text_extraction_result
 
+    def process_pages(
+        self,
+        input_file_path: str,
+        output_file_path: str | None = None,
+        fs: FileStorage | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> Iterator[PageExtractionResult]:
+        """Yields the extracted text page by page, see `X2TextAdapter.process_pages`.
+
+        Usage is pushed once all pages are extracted.
+        """
+        if self._x2text_instance is None:
+            raise X2TextError(
+                "X2Text adapter not initialized. Check that the default profile's "
+                "x2text adapter is valid and available."
+            )
+        if fs is None:
+            fs = FileStorage(provider=FileStorageProvider.LOCAL)
+        mime_type = fs.mime_type(input_file_path)
+        yield from self._x2text_instance.process_pages(
+            input_file_path, output_file_path, fs, **kwargs
+        )
+        self.push_usage_details(input_file_path, mime_type, fs=fs)
+
     def push_usage_details(
         self,
         input_file_path: str,
@@ -0,0 +1,73 @@
+"""Tests for indexing pages of a document while it's extracted."""
+
+from collections.abc import Iterator
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.vector_stores import SimpleVectorStore
+
+from unstract.sdk1.exceptions import IndexingError
+from unstract.sdk1.index import Index
+from unstract.sdk1.vector_db import VectorDB
+
+
+class RecordingEmbedding(MockEmbedding):
+    """Mock embedding that records when texts are sent to the provider."""
+
+    events: ClassVar[list[str]] = []
+
+    @property
+    def _length(self) -> int:
+        return self.embed_dim
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        RecordingEmbedding.events.append(f"embedded {len(texts)}")
+        return [[1.0, 0.0] for _ in texts]
+
+
+@pytest.fixture
+def vector_db(monkeypatch: MonkeyPatch) -> VectorDB:
+    monkeypatch.setenv("INDEX_STREAMING_BATCH_PAGES", "10")
+    RecordingEmbedding.events = []
+    vector_db = VectorDB(tool=MagicMock(), embedding=RecordingEmbedding(embed_dim=2))
+    vector_db._vector_db_instance = SimpleVectorStore()
+    vector_db.delete = MagicMock()
+    return vector_db
+
+
+def pages(count: int) -> Iterator[str]:
+    for page in range(1, count + 1):
+        RecordingEmbedding.events.append(f"page {page}")
+        yield f"Unit {page} rent 1250.00"
+
+
+def index_pages(vector_db: VectorDB, texts: Iterator[str]) -> None:
+    Index(tool=MagicMock()).index_to_vector_db(
+        vector_db=vector_db,
+        embedding=MagicMock(),
+        chunk_size=1024,
+        chunk_overlap=0,
+        text_to_idx=texts,
+        doc_id="doc-1",
+        doc_id_found=True,
+    )
+
+
+class TestIndexStreaming:
+    def test_pages_are_embedded_while_extracted(self, vector_db: VectorDB) -> None:
+        index_pages(vector_db, pages(25))
+
+        events = RecordingEmbedding.events
+        assert events.index("embedded 1") < events.index("page 11")
+        assert events.count("embedded 1") == 3
+        assert len(vector_db._vector_db_instance.data.embedding_dict) == 3
+        vector_db.delete.assert_called_once_with(ref_doc_id="doc-1")
+
+    def test_nodes_are_kept_without_text(self, vector_db: VectorDB) -> None:
+        with pytest.raises(IndexingError, match="No text available to index"):
+            index_pages(vector_db, iter(["", ""]))
+
+        vector_db.delete.assert_not_called()
@@ -0,0 +1,116 @@
+"""Tests and benchmark of parallel page extraction by the Native PDF adapter.
+
+Run the benchmark with: pytest tests/test_native_pdf.py -v -s -m benchmark
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.adapters.x2text.native_pdf.src import NativePdfX2Text
+
+BENCHMARK_PAGES = 300
+LINES_PER_PAGE = 45
+
+
+def write_pdf(path: Path, pages: int, lines_per_page: int = 5) -> None:
+    """Writes a PDF with numbered lines of text on every page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page in range(pages):
+        lines = [
+            f"({'Page' if line == 0 else 'Unit'} {page + 1} line {line} rent 1250.00) Tj"
+            for line in range(lines_per_page)
+        ]
+        stream = f"BT /F1 10 Tf 14 TL 40 800 Td {' T* '.join(lines)} ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()
+
+    content = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(content)
+    content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    content += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    content += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(content)
+
+
+def extract(monkeypatch: MonkeyPatch, path: Path, workers: int) -> str:
+    monkeypatch.setenv("NATIVE_PDF_WORKERS", str(workers))
+    return NativePdfX2Text({}).process(str(path)).extracted_text
+
+
+class TestNativePdfX2Text:
+    def test_parallel_extraction_keeps_page_order(
+        self, monkeypatch: MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv("NATIVE_PDF_PAGE_CHUNK_SIZE", "3")
+        monkeypatch.setenv("NATIVE_PDF_PARALLEL_MIN_PAGES", "5")
+        path = tmp_path / "rent_roll.pdf"
+        write_pdf(path, pages=10)
+
+        serial_text = extract(monkeypatch, path, workers=1)
+        parallel_text = extract(monkeypatch, path, workers=2)
+
+        assert parallel_text == serial_text
+        page_starts = [line for line in serial_text.split("\n") if "line 0" in line]
+        assert page_starts == [
+            f"Page {page} line 0 rent 1250.00" for page in range(1, 11)
+        ]
+
+    def test_process_pages_streams_pages_and_output(
+        self, monkeypatch: MonkeyPatch, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "rent_roll.pdf"
+        write_pdf(path, pages=3)
+        adapter = NativePdfX2Text({})
+        output_path = tmp_path / "output" / "rent_roll.txt"
+
+        pages = list(adapter.process_pages(str(path), str(output_path)))
+
+        assert [page.page_number for page in pages] == [1, 2, 3]
+        assert pages[1].text.startswith("Page 2 line 0")
+        expected = adapter.process(str(path)).extracted_text
+        assert "\n".join(page.text for page in pages) == expected
+        assert output_path.read_text() == expected
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="Needs several CPUs")
+    def test_parallel_extraction_throughput(
+        self, monkeypatch: MonkeyPatch, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "rent_roll.pdf"
+        write_pdf(path, pages=BENCHMARK_PAGES, lines_per_page=LINES_PER_PAGE)
+        workers = min(os.cpu_count() or 1, 8)
+
+        start = time.perf_counter()
+        serial_text = extract(monkeypatch, path, workers=1)
+        serial_time = time.perf_counter() - start
+        start = time.perf_counter()
+        parallel_text = extract(monkeypatch, path, workers=workers)
+        parallel_time = time.perf_counter() - start
+
+        print(
+            f"\n[SERIAL] {BENCHMARK_PAGES / serial_time:.0f} pages/s"
+            f"\n[PARALLEL x{workers}] {BENCHMARK_PAGES / parallel_time:.0f} pages/s"
+        )
+        assert parallel_text == serial_text
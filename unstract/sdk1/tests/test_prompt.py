@@ -41,7 +41,7 @@ class TestPromptToolRetry:
         expected_response = {"result": "success"}
         payload = {"prompt": "test"}
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = expected_response
             mock_response.raise_for_status = Mock()
@@ -70,7 +70,7 @@ class TestPromptToolRetry:
         expected_response = {"result": "success"}
         payload = {"prompt": "test"}
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = expected_response
             mock_response.raise_for_status = Mock()
@@ -100,7 +100,7 @@ class TestPromptToolRetry:
 
         payload = {"prompt": "test"}
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = ConnectionError("Persistent failure")
 
             # Exception handled by decorator
@@ -134,7 +134,7 @@ class TestPromptToolRetry:
             "summary": "summary",
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = expected_response
             mock_response.raise_for_status = Mock()
@@ -163,7 +163,7 @@ class TestPromptToolRetry:
 
         payload = {"prompt": "test"}
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = ConnectionError("Persistent failure")
 
             # Error handler should catch after all retries
@@ -0,0 +1,98 @@
+"""Tests for the batched, compressed tool cache client."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.tool.cache import ToolCache
+from unstract.sdk1.utils.http_session import HttpSessionFactory
+
+
+def _response(status_code: int, json: dict | None = None) -> MagicMock:
+    return MagicMock(status_code=status_code, reason="", json=lambda: json)
+
+
+@pytest.fixture
+def tool_cache() -> ToolCache:
+    tool = MagicMock()
+    tool.get_env_or_die.return_value = "test-api-key"
+    return ToolCache(tool=tool, platform_host="http://platform", platform_port=3001)
+
+
+@pytest.fixture
+def session() -> Iterator[MagicMock]:
+    with patch.object(HttpSessionFactory, "get_session") as get_session:
+        yield get_session.return_value
+
+
+class TestToolCache:
+    def test_large_values_are_compressed(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("TOOL_CACHE_COMPRESS_MIN_SIZE", "100")
+        value = "extracted text " * 100
+        # Off by default, as older readers can't decode compressed values
+        assert ToolCache.encode_value(value) == value
+        monkeypatch.setenv("TOOL_CACHE_COMPRESS", "True")
+
+        encoded = ToolCache.encode_value(value)
+
+        assert encoded.startswith(ToolCache.COMPRESSED_PREFIX)
+        assert len(encoded) < len(value)
+        assert ToolCache.decode_value(encoded) == value
+        assert ToolCache.encode_value("small") == "small"
+
+    def test_mset_and_mget_use_one_request(
+        self, tool_cache: ToolCache, session: MagicMock
+    ) -> None:
+        session.post.return_value = _response(200)
+        assert tool_cache.mset({"a": "1", "b": "2"})
+        assert session.post.call_args.args[0] == "http://platform:3001/cache/mset"
+        assert session.post.call_args.kwargs["json"] == {"items": {"a": "1", "b": "2"}}
+
+        session.post.return_value = _response(200, {"values": {"a": "1", "b": None}})
+        assert tool_cache.mget(["a", "b"]) == {"a": "1", "b": None}
+        assert session.post.call_count == 2
+
+    def test_mget_falls_back_to_get(
+        self, tool_cache: ToolCache, session: MagicMock
+    ) -> None:
+        session.post.return_value = _response(404)
+        session.get.return_value = MagicMock(status_code=200, text="1")
+
+        assert tool_cache.mget(["a", "b"]) == {"a": "1", "b": "1"}
+        assert session.get.call_count == 2
+
+    def test_batches_are_split_to_the_platform_limit(
+        self, tool_cache: ToolCache, session: MagicMock
+    ) -> None:
+        keys = [f"key-{i}" for i in range(ToolCache.MAX_BATCH_SIZE * 2 + 1)]
+        session.post.return_value = _response(200)
+
+        assert tool_cache.mset(dict.fromkeys(keys, "1"), ttl=60)
+
+        batches = [call.kwargs["json"] for call in session.post.call_args_list]
+        assert [len(batch["items"]) for batch in batches] == [1000, 1000, 1]
+        assert all(batch["ttl"] == 60 for batch in batches)
+
+        session.post.reset_mock()
+        session.post.side_effect = lambda url, json, headers: _response(
+            200, {"values": dict.fromkeys(json["keys"], "1")}
+        )
+
+        assert tool_cache.mget(keys) == dict.fromkeys(keys, "1")
+        assert session.post.call_count == 3
+
+    def test_mset_fallback_keeps_the_ttl(
+        self, tool_cache: ToolCache, session: MagicMock
+    ) -> None:
+        session.post.side_effect = lambda url, json, headers: _response(
+            404 if url.endswith("/mset") else 200
+        )
+
+        assert tool_cache.mset({"a": "1", "b": "2"}, ttl=60)
+
+        assert [call.kwargs["json"] for call in session.post.call_args_list[1:]] == [
+            {"key": "a", "value": "1", "ttl": 60},
+            {"key": "b", "value": "2", "ttl": 60},
+        ]
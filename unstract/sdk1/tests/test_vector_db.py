@@ -0,0 +1,145 @@
+"""Tests for looking up indexed documents without a similarity query."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.index import Index
+from unstract.sdk1.utils.index_registry import IndexRegistry
+from unstract.sdk1.utils.redis_client import RedisClientFactory
+from unstract.sdk1.vector_db import VectorDB
+
+
+@pytest.fixture(autouse=True)
+def index_registry(monkeypatch: MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("INDEX_REGISTRY_ENABLED", "True")
+    IndexRegistry.clear()
+    yield
+    IndexRegistry.clear()
+
+
+@pytest.fixture
+def index_markers(monkeypatch: MonkeyPatch) -> dict[str, str]:
+    markers: dict[str, str] = {}
+    client = MagicMock()
+    client.get.side_effect = markers.get
+    client.set.side_effect = lambda key, value, ex=None: markers.__setitem__(
+        key, str(value)
+    )
+    client.delete.side_effect = lambda key: markers.pop(key, None)
+    monkeypatch.setattr(RedisClientFactory, "_client", client)
+    monkeypatch.setattr(RedisClientFactory, "_initialised", True)
+    return markers
+
+
+@pytest.fixture
+def vector_db() -> VectorDB:
+    vector_db = VectorDB(tool=MagicMock(), adapter_instance_id=None)
+    vector_db._adapter_instance_id = "vector-db-1"
+    vector_db.vector_db_adapter_class = MagicMock()
+    vector_db.vector_db_adapter_class.count_nodes.return_value = 0
+    vector_db.vector_db_adapter_class.has_document.return_value = False
+    return vector_db
+
+
+class TestDocumentLookup:
+    def test_native_lookup_is_used(self, vector_db: VectorDB) -> None:
+        vector_db.vector_db_adapter_class.count_nodes.return_value = 3
+
+        assert vector_db.count_nodes("doc-1") == 3
+        assert vector_db.has_document("doc-1") is True
+        vector_db.vector_db_adapter_class.has_document.assert_not_called()
+
+    def test_added_nodes_skip_vector_db(self, vector_db: VectorDB) -> None:
+        vector_db.add("doc-1", nodes=[MagicMock(), MagicMock()])
+
+        assert vector_db.has_document("doc-1") is True
+        assert vector_db.count_nodes("doc-1") == 2
+        vector_db.vector_db_adapter_class.count_nodes.assert_not_called()
+
+    def test_delete_forgets_document(self, vector_db: VectorDB) -> None:
+        vector_db.add("doc-1", nodes=[MagicMock()])
+        vector_db.delete("doc-1")
+
+        assert vector_db.has_document("doc-1") is False
+
+    def test_registry_is_opt_in(
+        self, vector_db: VectorDB, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("INDEX_REGISTRY_ENABLED", "False")
+        vector_db.add("doc-1", nodes=[MagicMock()])
+
+        assert vector_db.has_document("doc-1") is False
+
+    def test_unsupported_lookup_falls_back_to_query(self, vector_db: VectorDB) -> None:
+        vector_db.vector_db_adapter_class.has_document.return_value = None
+        vector_db._vector_db_instance = MagicMock()
+        vector_db._vector_db_instance.query.return_value.nodes = [MagicMock()]
+        embedding = MagicMock()
+        index = Index(tool=MagicMock())
+
+        assert index._is_document_indexed(vector_db, embedding, "doc-1")
+        embedding.get_query_embedding.assert_called_once()
+
+    def test_native_lookup_skips_query_embedding(self, vector_db: VectorDB) -> None:
+        embedding = MagicMock()
+        index = Index(tool=MagicMock())
+
+        assert not index._is_document_indexed(vector_db, embedding, "doc-1")
+        embedding.get_query_embedding.assert_not_called()
+
+
+class TestIndexMarker:
+    def test_added_document_is_complete(
+        self, vector_db: VectorDB, index_markers: dict[str, str]
+    ) -> None:
+        vector_db.add("doc-1", nodes=[MagicMock(), MagicMock()])
+
+        assert index_markers == {"index_complete:doc-1": "2"}
+        assert vector_db.is_document_complete("doc-1") is True
+
+    def test_marker_expires(
+        self,
+        vector_db: VectorDB,
+        index_markers: dict[str, str],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("INDEX_MARKER_TTL", "60")
+        vector_db.add("doc-1", nodes=[MagicMock()])
+
+        RedisClientFactory._client.set.assert_called_once_with(
+            "index_complete:doc-1", 1, ex=60
+        )
+
+    def test_document_without_marker_is_incomplete(
+        self, vector_db: VectorDB, index_markers: dict[str, str]
+    ) -> None:
+        vector_db.vector_db_adapter_class.count_nodes.return_value = 4
+
+        assert vector_db.is_document_complete("doc-1") is False
+
+    def test_missing_nodes_make_document_incomplete(
+        self, vector_db: VectorDB, index_markers: dict[str, str]
+    ) -> None:
+        index_markers["index_complete:doc-1"] = "5"
+        vector_db.vector_db_adapter_class.count_nodes.return_value = 3
+
+        assert vector_db.is_document_complete("doc-1") is False
+
+    def test_delete_drops_marker(
+        self, vector_db: VectorDB, index_markers: dict[str, str]
+    ) -> None:
+        vector_db.add("doc-1", nodes=[MagicMock()])
+        vector_db.delete("doc-1")
+
+        assert index_markers == {}
+
+    def test_unknown_without_redis(
+        self, vector_db: VectorDB, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(RedisClientFactory, "_client", None)
+        monkeypatch.setattr(RedisClientFactory, "_initialised", True)
+
+        assert vector_db.is_document_complete("doc-1") is None
@@ -0,0 +1,112 @@
+"""Tests for the in-process adapter config cache."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.platform import PlatformHelper
+from unstract.sdk1.utils.adapter_config_cache import AdapterConfigCache
+from unstract.sdk1.utils.redis_client import RedisClientFactory
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch: MonkeyPatch) -> Iterator[None]:
+    """Start every test with an empty cache and no Redis versioning."""
+    monkeypatch.delenv("ADAPTER_CONFIG_CACHE_TTL", raising=False)
+    monkeypatch.delenv("ADAPTER_CONFIG_CACHE_MAX_SIZE", raising=False)
+    monkeypatch.setattr(RedisClientFactory, "_client", None)
+    monkeypatch.setattr(RedisClientFactory, "_initialised", True)
+    AdapterConfigCache.invalidate()
+    yield
+    AdapterConfigCache.invalidate()
+
+
+@pytest.fixture
+def mock_tool() -> MagicMock:
+    tool = MagicMock()
+    tool.get_env_or_die.side_effect = lambda key: {
+        "PLATFORM_SERVICE_HOST": "http://localhost",
+        "PLATFORM_SERVICE_PORT": "3001",
+        "PLATFORM_SERVICE_API_KEY": "test-api-key",
+    }.get(key, "mock-value")
+    return tool
+
+
+def _adapter_response(adapter_id: str = "openai|123") -> Mock:
+    response = Mock()
+    response.json.side_effect = lambda: {
+        "adapter_id": adapter_id,
+        "adapter_metadata": {"model": "gpt-4o"},
+    }
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestAdapterConfigCache:
+    def test_config_is_fetched_once(self, mock_tool: MagicMock) -> None:
+        with patch("requests.Session.get", return_value=_adapter_response()) as mock_get:
+            first = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            second = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert mock_get.call_count == 1
+        assert first == second
+
+    def test_cached_config_is_not_shared_by_reference(self, mock_tool: MagicMock) -> None:
+        with patch("requests.Session.get", return_value=_adapter_response()):
+            first = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            first["adapter_metadata"]["embedding_dimension"] = 1536
+            second = PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert "embedding_dimension" not in second["adapter_metadata"]
+
+    def test_invalidate_forces_refetch(self, mock_tool: MagicMock) -> None:
+        with patch("requests.Session.get", return_value=_adapter_response()) as mock_get:
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            PlatformHelper.invalidate_adapter_config("adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert mock_get.call_count == 2
+
+    def test_expired_entries_are_refetched(
+        self, mock_tool: MagicMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        with patch("requests.Session.get", return_value=_adapter_response()) as mock_get:
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            with patch("time.monotonic", return_value=float("inf")):
+                PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert mock_get.call_count == 2
+
+    def test_version_bump_invalidates(self, mock_tool: MagicMock) -> None:
+        redis_client = MagicMock()
+        redis_client.get.return_value = "1"
+        RedisClientFactory._client = redis_client
+
+        with patch("requests.Session.get", return_value=_adapter_response()) as mock_get:
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+            redis_client.get.return_value = "2"
+            PlatformHelper.get_adapter_config(mock_tool, "adapter-1")
+
+        assert mock_get.call_count == 2
+        redis_client.get.assert_called_with("adapter_config_version:adapter-1")
+
+    def test_size_bound_evicts_least_recently_used(
+        self, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ADAPTER_CONFIG_CACHE_MAX_SIZE", "2")
+        AdapterConfigCache.set("key", "adapter-1", {"id": 1})
+        AdapterConfigCache.set("key", "adapter-2", {"id": 2})
+        AdapterConfigCache.get("key", "adapter-1")
+        AdapterConfigCache.set("key", "adapter-3", {"id": 3})
+
+        assert AdapterConfigCache.get("key", "adapter-1") == {"id": 1}
+        assert AdapterConfigCache.get("key", "adapter-2") is None
+
+    def test_disabled_with_zero_ttl(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("ADAPTER_CONFIG_CACHE_TTL", "0")
+        AdapterConfigCache.set("key", "adapter-1", {"id": 1})
+
+        assert AdapterConfigCache.get("key", "adapter-1") is None
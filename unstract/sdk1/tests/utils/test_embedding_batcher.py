@@ -0,0 +1,84 @@
+"""Tests for batched, concurrent embedding of chunks."""
+
+import threading
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.utils.embedding_batcher import EmbeddingBatcher
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class Provider:
+    """Fake provider that embeds a text as its length."""
+
+    def __init__(self, failures: int = 0) -> None:
+        """Fails the first `failures` requests with a rate limit error."""
+        self.failures = failures
+        self.requests: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.requests.append(texts)
+            if self.failures:
+                self.failures -= 1
+                raise RateLimitError("Too many requests")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def no_sleep() -> Iterator[MagicMock]:
+    with patch("unstract.sdk1.utils.embedding_batcher.time.sleep") as sleep:
+        yield sleep
+
+
+class TestEmbeddingBatcher:
+    def test_batches_respect_item_and_token_limits(
+        self, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("EMBEDDING_BATCH_MAX_TOKENS", "10")
+        batcher = EmbeddingBatcher(embed_batch=Provider().embed, default_max_items=2)
+
+        batches = batcher.make_batches(["a", "b", "c", "x" * 40, "d"])
+
+        assert batches == [["a", "b"], ["c"], ["x" * 40], ["d"]]
+
+    def test_concurrent_batches_keep_order(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("EMBEDDING_BATCH_CONCURRENCY", "3")
+        provider = Provider()
+        texts = ["x" * i for i in range(1, 12)]
+
+        embeddings = EmbeddingBatcher(provider.embed, default_max_items=2).embed(texts)
+
+        assert embeddings == [[float(i)] for i in range(1, 12)]
+        assert len(provider.requests) == 6
+
+    def test_rate_limited_requests_are_retried(self, no_sleep: MagicMock) -> None:
+        provider = Provider(failures=2)
+
+        embeddings = EmbeddingBatcher(provider.embed).embed(["ab"])
+
+        assert embeddings == [[2.0]]
+        assert len(provider.requests) == 3
+        assert no_sleep.call_count == 2
+
+    def test_gives_up_after_max_retries(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("EMBEDDING_BATCH_MAX_RETRIES", "1")
+        provider = Provider(failures=5)
+
+        with pytest.raises(RateLimitError):
+            EmbeddingBatcher(provider.embed).embed(["ab"])
+        assert len(provider.requests) == 2
+
+    def test_other_errors_are_not_retried(self) -> None:
+        def embed(texts: list[str]) -> list[list[float]]:
+            raise ValueError("Invalid input")
+
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(embed).embed(["ab"])
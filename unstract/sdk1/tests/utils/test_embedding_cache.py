@@ -0,0 +1,112 @@
+"""Tests for the content-addressed chunk embedding cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from llama_index.core import Document
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores import SimpleVectorStore
+
+from unstract.sdk1.utils.embedding_cache import EmbeddingCache
+from unstract.sdk1.vector_db import VectorDB
+
+
+class CountingEmbedding(MockEmbedding):
+    """Mock embedding that records the texts sent to the provider."""
+
+    embedded: ClassVar[list[str]] = []
+
+    @property
+    def _length(self) -> int:
+        return self.embed_dim
+
+    def get_config_hash(self) -> str:
+        return "config-1"
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        CountingEmbedding.embedded.extend(texts)
+        return [[float(len(text)), 0.5, 0.25, 0.0] for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def sqlite_cache(monkeypatch: MonkeyPatch, tmp_path: Path) -> Iterator[None]:
+    monkeypatch.setenv("EMBEDDING_CACHE_BACKEND", "sqlite")
+    monkeypatch.setenv("EMBEDDING_CACHE_SQLITE_PATH", str(tmp_path / "cache.sqlite3"))
+    EmbeddingCache.reset()
+    CountingEmbedding.embedded = []
+    yield
+    EmbeddingCache.reset()
+
+
+def _vector_db() -> VectorDB:
+    vector_db = VectorDB(
+        tool=MagicMock(), embedding=CountingEmbedding(embed_dim=4, embed_batch_size=2)
+    )
+    vector_db._vector_db_instance = SimpleVectorStore()
+    return vector_db
+
+
+def _documents(*texts: str) -> list[Document]:
+    return [Document(text=text, doc_id=f"doc-{i}") for i, text in enumerate(texts)]
+
+
+class TestEmbeddingCache:
+    def test_round_trip(self) -> None:
+        EmbeddingCache.set_many("config-1", ["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+
+        assert EmbeddingCache.get_many("config-1", ["b", "c", "a"]) == [
+            [3.0, 4.0],
+            None,
+            [1.0, 2.0],
+        ]
+        assert EmbeddingCache.get_many("config-2", ["a"]) == [None]
+
+    def test_disabled_without_backend(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.delenv("EMBEDDING_CACHE_BACKEND")
+        EmbeddingCache.reset()
+        EmbeddingCache.set_many("config-1", ["a"], [[1.0]])
+
+        assert not EmbeddingCache.is_enabled()
+        assert EmbeddingCache.get_many("config-1", ["a"]) == [None]
+
+    def test_config_hash_ignores_credentials(self) -> None:
+        first = EmbeddingCache.get_config_hash("openai", {"model": "m", "api_key": "1"})
+        second = EmbeddingCache.get_config_hash("openai", {"model": "m", "api_key": "2"})
+        other = EmbeddingCache.get_config_hash("openai", {"model": "n", "api_key": "1"})
+
+        assert first == second
+        assert first != other
+
+    def test_reindex_only_embeds_new_chunks(self) -> None:
+        _vector_db().index_document(_documents("first", "second"))
+        assert CountingEmbedding.embedded == ["first", "second"]
+
+        CountingEmbedding.embedded = []
+        index = _vector_db().index_document(_documents("first", "second", "third"))
+
+        assert CountingEmbedding.embedded == ["third"]
+        vector_store = index.vector_store
+        assert len(vector_store.data.embedding_dict) == 3
+        assert [5.0, 0.5, 0.25, 0.0] in vector_store.data.embedding_dict.values()
+
+    def test_document_nodes_get_cached_embeddings(self) -> None:
+        vector_db = _vector_db()
+        vector_db.index_document(_documents("first"))
+        CountingEmbedding.embedded = []
+        vector_db._vector_db_instance = MagicMock()
+        vector_db._vector_db_instance.get_nodes.return_value = [
+            TextNode(text="first"),
+            TextNode(text="unknown"),
+        ]
+
+        nodes = vector_db.get_document_nodes("doc-0")
+
+        assert [node.embedding for node in nodes] == [[5.0, 0.5, 0.25, 0.0], None]
+        assert CountingEmbedding.embedded == []
+        filters = vector_db._vector_db_instance.get_nodes.call_args.kwargs["filters"]
+        assert filters.filters[0].value == "doc-0"
@@ -0,0 +1,121 @@
+"""Tests for embedding dimension resolution without live test calls."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.adapters.embedding1.openai import OpenAIEmbeddingAdapter
+from unstract.sdk1.embedding import Embedding
+from unstract.sdk1.utils.embedding_dimensions import EmbeddingDimensionRegistry
+from unstract.sdk1.utils.redis_client import RedisClientFactory
+
+OPENAI_ADAPTER_ID = "openai|717a0b0e-3bbc-41dc-9f0c-5689437a1151"
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch: MonkeyPatch) -> Iterator[None]:
+    """Start every test without discovered dimensions or Redis."""
+    monkeypatch.setattr(RedisClientFactory, "_client", None)
+    monkeypatch.setattr(RedisClientFactory, "_initialised", True)
+    EmbeddingDimensionRegistry.clear()
+    yield
+    EmbeddingDimensionRegistry.clear()
+
+
+def _embedding(model: str) -> Embedding:
+    return Embedding(
+        adapter_id=OPENAI_ADAPTER_ID,
+        adapter_metadata={"model": model, "api_key": "test-key"},
+    )
+
+
+def _embedding_response(length: int) -> dict:
+    return {"data": [{"embedding": [0.0] * length}]}
+
+
+class TestEmbeddingDimensions:
+    def test_known_model_is_not_probed(self) -> None:
+        with patch("litellm.embedding") as mock_embedding:
+            embedding = _embedding("text-embedding-3-large")
+
+            assert embedding._length == 3072
+        mock_embedding.assert_not_called()
+
+    def test_requested_dimensions_are_used(self) -> None:
+        validate = OpenAIEmbeddingAdapter.validate
+
+        with (
+            patch.object(
+                OpenAIEmbeddingAdapter,
+                "validate",
+                side_effect=lambda metadata: {**validate(metadata), "dimensions": 256},
+            ),
+            patch("litellm.embedding") as mock_embedding,
+        ):
+            embedding = _embedding("text-embedding-3-large")
+
+            assert embedding._length == 256
+        mock_embedding.assert_not_called()
+
+    def test_unknown_model_is_probed_once(self) -> None:
+        with patch(
+            "litellm.embedding", return_value=_embedding_response(8)
+        ) as mock_embedding:
+            embedding = _embedding("custom-embedder")
+            mock_embedding.assert_not_called()
+
+            assert embedding._length == 8
+            assert _embedding("custom-embedder")._length == 8
+        assert mock_embedding.call_count == 1
+
+    def test_dimension_is_read_from_redis(self) -> None:
+        redis_client = MagicMock()
+        redis_client.get.return_value = "12"
+        RedisClientFactory._client = redis_client
+
+        with patch("litellm.embedding") as mock_embedding:
+            assert _embedding("custom-embedder")._length == 12
+        mock_embedding.assert_not_called()
+
+    def test_test_connection_always_probes(self) -> None:
+        redis_client = MagicMock()
+        RedisClientFactory._client = redis_client
+
+        with patch(
+            "litellm.embedding", return_value=_embedding_response(1536)
+        ) as mock_embedding:
+            assert _embedding("text-embedding-ada-002").test_connection()
+        assert mock_embedding.call_count == 1
+        redis_client.set.assert_called_once()
+
+    def test_config_hash_ignores_credentials(self) -> None:
+        first = EmbeddingDimensionRegistry.get_config_hash(
+            OPENAI_ADAPTER_ID, {"model": "m", "api_key": "one"}
+        )
+        second = EmbeddingDimensionRegistry.get_config_hash(
+            OPENAI_ADAPTER_ID, {"model": "m", "api_key": "two"}
+        )
+        other = EmbeddingDimensionRegistry.get_config_hash(
+            OPENAI_ADAPTER_ID, {"model": "n", "api_key": "one"}
+        )
+
+        assert first == second
+        assert first != other
+
+    @pytest.mark.parametrize(
+        "provider,models,expected",
+        [
+            ("ollama", ["ollama/nomic-embed-text:latest"], 768),
+            ("azure", ["azure/my-deployment", "text-embedding-3-small"], 1536),
+            ("bedrock", ["amazon.titan-embed-text-v2:0"], 1024),
+            ("openai", ["unknown-model"], None),
+        ],
+    )
+    def test_known_dimensions(
+        self, provider: str, models: list[str], expected: int | None
+    ) -> None:
+        assert (
+            EmbeddingDimensionRegistry.get_known_dimension(provider, models) == expected
+        )
@@ -0,0 +1,146 @@
+"""Tests for the content-addressed extracted text cache."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.adapters.x2text.dto import (
+    PageExtractionResult,
+    TextExtractionMetadata,
+    TextExtractionResult,
+)
+from unstract.sdk1.adapters.x2text.llm_whisperer_v2.src import LLMWhispererV2
+from unstract.sdk1.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk1.index import Index
+from unstract.sdk1.utils.extraction_cache import ExtractionCache
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch: MonkeyPatch, tmp_path: Path) -> Iterator[None]:
+    monkeypatch.setenv("PERMANENT_REMOTE_STORAGE", '{"provider": "local"}')
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    ExtractionCache.reset()
+    yield
+    ExtractionCache.reset()
+
+
+def _process(
+    input_file_path: str, output_file_path: str, fs: FileStorage, **kwargs: object
+) -> TextExtractionResult:
+    """Writes outputs the way LLMWhisperer V2 does."""
+    output_path = Path(output_file_path)
+    output_path.write_text("extracted text")
+    (output_path.parent / "metadata").mkdir(exist_ok=True)
+    (output_path.parent / "metadata" / f"{output_path.stem}.json").write_text(
+        json.dumps({"line_metadata": [[1, 2]]})
+    )
+    return TextExtractionResult(
+        extracted_text="extracted text",
+        extraction_metadata=TextExtractionMetadata(whisper_hash="hash-1"),
+    )
+
+
+@pytest.fixture
+def x2text() -> Iterator[MagicMock]:
+    with patch("unstract.sdk1.index.X2Text") as x2text_class:
+        x2text = x2text_class.return_value
+        x2text.x2text_instance = MagicMock(spec=LLMWhispererV2)
+        x2text.x2text_adapter_id = "llmwhisperer|v2"
+        x2text.x2text_metadata = {"mode": "form", "unstract_key": "secret"}
+        x2text.process.side_effect = _process
+        yield x2text
+
+
+class TestExtractionCache:
+    def test_identical_files_are_extracted_once(
+        self, x2text: MagicMock, tmp_path: Path
+    ) -> None:
+        fs = FileStorage(FileStorageProvider.LOCAL)
+        input_file = tmp_path / "input.pdf"
+        input_file.write_bytes(b"%PDF content")
+        index = Index(tool=MagicMock())
+
+        for project in ("first", "second"):
+            output_dir = tmp_path / project
+            output_dir.mkdir()
+            text = index.extract_text(
+                x2text_instance_id="x2text-1",
+                file_path=str(input_file),
+                output_file_path=str(output_dir / "input.txt"),
+                enable_highlight=True,
+                fs=fs,
+            )
+            assert text == "extracted text"
+
+        assert x2text.process.call_count == 1
+        second_output = tmp_path / "second"
+        assert (second_output / "input.txt").read_text() == "extracted text"
+        assert json.loads((second_output / "metadata" / "input.json").read_text()) == {
+            "line_metadata": [[1, 2]]
+        }
+        assert index.tool.update_exec_metadata.call_count == 2
+
+    def test_pages_are_cached_once_extracted(
+        self, x2text: MagicMock, tmp_path: Path
+    ) -> None:
+        def process_pages(
+            input_file_path: str, output_file_path: str, **kwargs: object
+        ) -> Iterator[PageExtractionResult]:
+            Path(output_file_path).write_text("page 1\npage 2")
+            yield PageExtractionResult(page_number=1, text="page 1")
+            yield PageExtractionResult(page_number=2, text="page 2")
+
+        x2text.process_pages.side_effect = process_pages
+        fs = FileStorage(FileStorageProvider.LOCAL)
+        input_file = tmp_path / "input.pdf"
+        input_file.write_bytes(b"%PDF content")
+        index = Index(tool=MagicMock())
+
+        def extract_pages(output_file: Path) -> list[str]:
+            return list(
+                index.extract_text_pages(
+                    x2text_instance_id="x2text-1",
+                    file_path=str(input_file),
+                    output_file_path=str(output_file),
+                    fs=fs,
+                )
+            )
+
+        assert extract_pages(tmp_path / "first.txt") == ["page 1", "page 2"]
+        # The cached text is yielded as a single page
+        assert extract_pages(tmp_path / "second.txt") == ["page 1\npage 2"]
+        assert x2text.process_pages.call_count == 1
+        assert (tmp_path / "second.txt").read_text() == "page 1\npage 2"
+
+    def test_key_depends_on_content_and_config(self, tmp_path: Path) -> None:
+        fs = FileStorage(FileStorageProvider.LOCAL)
+        file_a = tmp_path / "a.pdf"
+        file_a.write_bytes(b"a")
+        file_b = tmp_path / "b.pdf"
+        file_b.write_bytes(b"a")
+        key = ExtractionCache.get_key(fs, str(file_a), "x2text", {"mode": "form"}, True)
+
+        assert key == ExtractionCache.get_key(
+            fs, str(file_b), "x2text", {"mode": "form", "timeout": 900}, True
+        )
+        # Entries aren't shared across accounts or organisations
+        assert key != ExtractionCache.get_key(
+            fs, str(file_a), "x2text", {"mode": "form", "api_key": "other"}, True
+        )
+        assert key != ExtractionCache.get_key(
+            fs, str(file_a), "x2text", {"mode": "form"}, True, scope="org-2-key"
+        )
+        assert key != ExtractionCache.get_key(
+            fs, str(file_a), "x2text", {"mode": "form"}, False
+        )
+        assert key != ExtractionCache.get_key(
+            fs, str(file_a), "x2text", {"mode": "text"}, True
+        )
+        file_b.write_bytes(b"b")
+        assert key != ExtractionCache.get_key(
+            fs, str(file_b), "x2text", {"mode": "form"}, True
+        )
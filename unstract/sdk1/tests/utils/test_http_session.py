@@ -0,0 +1,63 @@
+"""Tests for the shared keep-alive HTTP session."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from unstract.sdk1.utils.http_session import HttpSessionFactory
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cookie header of each request received
+    cookies: ClassVar[list[str | None]] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        _Handler.cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=tenant-1; Path=/")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"OK")
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    HttpSessionFactory._reset()
+    _Handler.cookies = []
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    HttpSessionFactory._reset()
+    server.shutdown()
+
+
+class TestHttpSessionFactory:
+    def test_connections_are_reused(self, server_url: str) -> None:
+        session = HttpSessionFactory.get_session()
+        assert HttpSessionFactory.get_session() is session
+
+        for _ in range(3):
+            assert session.get(server_url, timeout=5).status_code == 200
+
+        assert HttpSessionFactory.get_stats() == {
+            "requests": 3,
+            "connections_created": 1,
+            "connections_reused": 2,
+        }
+
+    def test_cookies_are_not_stored(self, server_url: str) -> None:
+        session = HttpSessionFactory.get_session()
+
+        for _ in range(2):
+            assert session.get(server_url, timeout=5).status_code == 200
+
+        assert len(session.cookies) == 0
+        assert _Handler.cookies == [None, None]
@@ -0,0 +1,139 @@
+"""Tests for the background, batched usage emitter."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from _pytest.monkeypatch import MonkeyPatch
+
+from unstract.sdk1.audit import Audit
+from unstract.sdk1.utils.common import TokenCounterCompat
+from unstract.sdk1.utils.usage_emitter import UsageEmitter
+
+BASE_URL = "http://platform:3001/api/v1"
+
+
+def _response(status_code: int) -> MagicMock:
+    return MagicMock(status_code=status_code, reason="")
+
+
+@pytest.fixture(autouse=True)
+def emitter(monkeypatch: MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    spill_path = tmp_path / "usage_spill.jsonl"
+    monkeypatch.setenv("USAGE_EMITTER_SPILL_PATH", str(spill_path))
+    monkeypatch.setenv("USAGE_EMITTER_FLUSH_INTERVAL", "60")
+    monkeypatch.setenv("PLATFORM_SERVICE_HOST", "http://platform")
+    monkeypatch.setenv("PLATFORM_SERVICE_PORT", "3001")
+    UsageEmitter._reset()
+    yield spill_path
+    UsageEmitter._reset()
+
+
+@pytest.fixture
+def post() -> Iterator[MagicMock]:
+    with patch("requests.Session.post") as post:
+        post.return_value = _response(200)
+        yield post
+
+
+class TestUsageEmitter:
+    def test_records_are_sent_in_one_batch(self, post: MagicMock) -> None:
+        for run_id in ("run-1", "run-2", "run-3"):
+            UsageEmitter.emit(
+                BASE_URL, "key", UsageEmitter.PAGE_USAGE, {"run_id": run_id}
+            )
+        UsageEmitter.flush()
+
+        post.assert_called_once()
+        assert post.call_args.args[0] == f"{BASE_URL}/usage/batch"
+        records = post.call_args.kwargs["json"]["records"]
+        assert [record["run_id"] for record in records] == ["run-1", "run-2", "run-3"]
+        assert {record["type"] for record in records} == {"page_usage"}
+
+    def test_falls_back_to_per_record_endpoints(self, post: MagicMock) -> None:
+        post.side_effect = [_response(404), _response(200), _response(200)]
+        UsageEmitter.emit(BASE_URL, "key", UsageEmitter.TOKEN_USAGE, {"run_id": "1"})
+        UsageEmitter.emit(BASE_URL, "key", UsageEmitter.PAGE_USAGE, {"run_id": "2"})
+        UsageEmitter.flush()
+
+        urls = [call.args[0] for call in post.call_args_list]
+        assert urls[1:] == [f"{BASE_URL}/usage", f"{BASE_URL}/page-usage"]
+        assert post.call_args.kwargs["json"] == {"run_id": "2"}
+
+    def test_unreachable_platform_spills_and_replays(
+        self, post: MagicMock, emitter: Path
+    ) -> None:
+        post.side_effect = requests.ConnectionError("Connection refused")
+        UsageEmitter.emit(BASE_URL, "key", UsageEmitter.TOKEN_USAGE, {"run_id": "1"})
+        UsageEmitter.flush()
+
+        spilled = [json.loads(line) for line in emitter.read_text().splitlines()]
+        assert [item["record"]["run_id"] for item in spilled] == ["1"]
+        # The platform key itself isn't written to disk
+        assert set(spilled[0]) == {"base_url", "key_hash", "record"}
+
+        post.side_effect = None
+        UsageEmitter.emit(BASE_URL, "key", UsageEmitter.TOKEN_USAGE, {"run_id": "2"})
+        UsageEmitter.flush()
+
+        assert not emitter.exists()
+        replayed = post.call_args.kwargs["json"]["records"]
+        assert [record["run_id"] for record in replayed] == ["1"]
+
+    def test_spilled_records_of_unknown_keys_stay_spilled(
+        self, post: MagicMock, emitter: Path
+    ) -> None:
+        post.side_effect = requests.ConnectionError("Connection refused")
+        UsageEmitter.emit(BASE_URL, "key-1", UsageEmitter.TOKEN_USAGE, {"run_id": "1"})
+        UsageEmitter.flush()
+        # A restarted process doesn't know the key of the spilled record
+        UsageEmitter._keys.clear()
+        post.reset_mock()
+
+        post.side_effect = None
+        UsageEmitter.emit(BASE_URL, "key-2", UsageEmitter.TOKEN_USAGE, {"run_id": "2"})
+        UsageEmitter.flush()
+
+        post.assert_called_once()
+        spilled = [json.loads(line) for line in emitter.read_text().splitlines()]
+        assert [item["record"]["run_id"] for item in spilled] == ["1"]
+
+        UsageEmitter.emit(BASE_URL, "key-1", UsageEmitter.TOKEN_USAGE, {"run_id": "3"})
+        UsageEmitter.flush()
+
+        assert not emitter.exists()
+        assert post.call_args.kwargs["headers"]["Authorization"] == "Bearer key-1"
+        replayed = post.call_args.kwargs["json"]["records"]
+        assert [record["run_id"] for record in replayed] == ["1"]
+
+    def test_flush_gives_up_on_timeout(self, post: MagicMock) -> None:
+        UsageEmitter.emit(BASE_URL, "key", UsageEmitter.TOKEN_USAGE, {"run_id": "1"})
+        with UsageEmitter._send_lock:
+            assert UsageEmitter.flush(timeout=0.01) is False
+        post.assert_not_called()
+
+        assert UsageEmitter.flush(timeout=0.01) is True
+        post.assert_called_once()
+
+    def test_audit_queues_usage(self, post: MagicMock) -> None:
+        token_counter = TokenCounterCompat(
+            prompt_tokens=10, completion_tokens=5, total_tokens=15
+        )
+
+        with Audit() as audit:
+            audit.push_usage_data(
+                platform_api_key="key",
+                token_counter=token_counter,
+                model_name="openai/gpt-4o",
+                event_type="llm",
+                kwargs={"run_id": "run-1"},
+            )
+            post.assert_not_called()
+
+        record = post.call_args.kwargs["json"]["records"][0]
+        assert record["type"] == "usage"
+        assert record["model_name"] == "gpt-4o"
+        assert record["total_tokens"] == 15
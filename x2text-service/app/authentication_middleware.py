@@ -1,6 +1,8 @@
 from typing import Any
 
+import redis
 from flask import Request, current_app, request
+from unstract.core.flask import PlatformKeyInfo, PlatformKeyResolver
 
 from app.constants import DBTable
 from app.env import Env
@@ -20,36 +22,57 @@ def authentication_middleware(func: Any) -> Any:
     return wrapper
 
 
+def _get_redis_client() -> redis.Redis:
+    return redis.Redis(
+        host=Env.REDIS_HOST,
+        port=Env.REDIS_PORT,
+        username=Env.REDIS_USERNAME,
+        password=Env.REDIS_PASSWORD,
+    )
+
+
 class AuthenticationMiddleware:
+    @classmethod
+    def fetch_platform_key(cls, token: str) -> PlatformKeyInfo | None:
+        """Fetch a platform key and its organization in a single query."""
+        platform_key_table = f'"{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY}'
+        organization_table = f'"{Env.DB_SCHEMA}".{DBTable.ORGANIZATION}'
+        query = (
+            "SELECT pk.is_active, pk.organization_id, org.organization_id "
+            f"FROM {platform_key_table} pk "
+            f"LEFT JOIN {organization_table} org ON org.id = pk.organization_id "
+            "WHERE pk.key = %s"
+        )
+        cursor = be_db.execute_sql(query, (token,))
+        result_row = cursor.fetchone()
+        cursor.close()
+        if not result_row:
+            return None
+        is_active, organization_uid, organization_identifier = result_row
+        return PlatformKeyInfo(
+            is_active=bool(is_active),
+            organization_uid=organization_uid,
+            organization_identifier=organization_identifier,
+        )
+
     @classmethod
     def validate_bearer_token(cls, token: str | None) -> bool:
         try:
             if token is None:
                 current_app.logger.error("Authentication failed. Empty bearer token")
                 return False
-            platform_key_table = f'"{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY}'
-            query = f"SELECT * FROM {platform_key_table} WHERE key = '{token}'"
-            cursor = be_db.execute_sql(query)
-            result_row = cursor.fetchone()
-            cursor.close()
-            if not result_row or len(result_row) == 0:
+            platform_key = platform_key_resolver.resolve(token)
+            if platform_key is None:
                 current_app.logger.error(
                     f"Authentication failed. bearer token not found {token}"
                 )
                 return False
-            platform_key = str(result_row[1])
-            is_active = bool(result_row[2])
-            if not is_active:
+            if not platform_key.is_active:
                 current_app.logger.error(
                     f"Token is not active. Activate \
                         before using it. token {token}"
                 )
                 return False
-            if platform_key != token:
-                current_app.logger.error(
-                    f"Authentication failed. Invalid bearer token: {token}"
-                )
-                return False
 
         except Exception as e:
             current_app.logger.error(
@@ -82,26 +105,15 @@ class AuthenticationMiddleware:
         Returns:
             tuple[int, str]: organization uid and organization identifier
         """
-        platform_key_table = f'"{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY}'
-        organization_table = f'"{Env.DB_SCHEMA}".{DBTable.ORGANIZATION}'
-
-        organization_uid: int | None = cls.execute_query(
-            f"SELECT organization_id FROM {platform_key_table} WHERE key=%s", (token,)
-        )
-        if organization_uid is None:
+        platform_key = platform_key_resolver.resolve(token)
+        if platform_key is None:
             return None, None
+        return platform_key.organization_uid, platform_key.organization_identifier
 
-        organization_identifier: str | None = cls.execute_query(
-            f"SELECT organization_id FROM {organization_table} WHERE id=%s",
-            (organization_uid,),
-        )
-        return organization_uid, organization_identifier
 
-    @classmethod
-    def execute_query(cls, query: str, params: tuple = ()) -> Any:
-        cursor = be_db.execute_sql(query, params)
-        result_row = cursor.fetchone()
-        cursor.close()
-        if not result_row or len(result_row) == 0:
-            return None
-        return result_row[0]
+# Caches platform keys per process. Without Redis, changes to a key are only
+# picked up once its cache entry expires.
+platform_key_resolver = PlatformKeyResolver(
+    fetch=AuthenticationMiddleware.fetch_platform_key,
+    get_redis_client=_get_redis_client if Env.REDIS_HOST else None,
+)
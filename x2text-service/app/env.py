@@ -51,6 +51,11 @@ class Env:
     DB_USERNAME = EnvManager.get_required_setting("DB_USERNAME")
     DB_PASSWORD = EnvManager.get_required_setting("DB_PASSWORD")
     DB_NAME = EnvManager.get_required_setting("DB_NAME")
+    # Optional, used to drop cached platform keys when they change
+    REDIS_HOST = os.environ.get("REDIS_HOST")
+    REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
+    REDIS_USERNAME = os.environ.get("REDIS_USERNAME")
+    REDIS_PASSWORD = os.environ.get("REDIS_PASSWORD")
 
 
 EnvManager.raise_for_missing_envs()